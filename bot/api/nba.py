@@ -1,227 +1,258 @@
 import asyncio
-import datetime
 import logging
-import os
 
-from nba_api.stats.static import players, teams
-from nba_api.stats.endpoints import playercareerstats, teamgamelog
-from nba_api.live.nba.endpoints import scoreboard, boxscore
+import requests
 
-from managers.redis import RedisManager
-from utils.schedule_formatter import format_schedule
+from api.transport import NBATransport
+from managers.cache import CacheManager
+from managers.scoreboard import ScoreboardManager
+from managers.standings import StandingsManager
+from utils.career import CareerStats, career_params, compact_career
+from utils.codec import payload_key
+from utils.player_index import PlayerIndex
+from utils.stats_formatter import format_career, format_record
+from utils.team_index import TEAM_INDEX
 
 logger = logging.getLogger(__name__)
 
 
 class NBAClient:
     """
-    Wrapper around the nba_api library to fetch NBA data (scores, stats, schedules),
+    Wrapper around the NBA's live and stats endpoints to fetch NBA data (scores, stats, schedules),
     using a rotating proxy endpoint on every request.
-    This class also caches results in Redis to reduce API calls and improve performance.
+    This class also caches results in memory and Redis to reduce API calls and improve performance.
+    Live data (scores, stat lines, schedule) is read from the shared
+    ScoreboardManager snapshot and never triggers an upstream call.
+    Cache lifetimes follow the game state (see CachePolicy), stale values are
+    served while a background refresh runs, and cached career lines are
+    dropped as soon as the game they depend on goes final. Team records come
+    from the league-wide StandingsManager.
     """
 
-    def __init__(self, proxy_manager, redis_manager: RedisManager):
+    UNAVAILABLE = "Live NBA data is not available yet. Please try again shortly."
+    TIMED_OUT = "NBA stats are slow to respond right now. Please try again shortly."
+    STATS_UNAVAILABLE = "NBA stats are unavailable right now. Please try again shortly."
+
+    def __init__(self, proxy_manager, cache_manager: CacheManager,
+                 scoreboard_manager: ScoreboardManager, transport: NBATransport,
+                 player_index: PlayerIndex, standings_manager: StandingsManager):
         """
         Initialize the NBAClient.
 
         Args:
             proxy_manager (ProxyManager): Provides the rotating proxy URL.
-            redis_manager (RedisManager): Manages Redis cache for storing data.
+            cache_manager (CacheManager): Two-tier (memory + Redis) cache for storing data.
+            scoreboard_manager (ScoreboardManager): Publishes live scoreboard snapshots.
+            transport (NBATransport): Runs the NBA endpoints off the event loop.
+            player_index (PlayerIndex): Resolves player names, nicknames and typos.
+            standings_manager (StandingsManager): Serves every team's record.
         """
         self.proxy_manager = proxy_manager
-        self.redis = redis_manager
-
-    @staticmethod
-    def _get_all_teams() -> list[dict]:
+        self.cache = cache_manager
+        self.transport = transport
+        self.scoreboard = scoreboard_manager
+        self.policy = scoreboard_manager.policy
+        self.players = player_index
+        self.standings = standings_manager
+        self.scoreboard.add_final_listener(self._on_game_final)
+
+    def _game_for_team(self, team_id: int) -> dict | None:
+        snapshot = self.scoreboard.snapshot
+        return snapshot.find_game(team_id) if snapshot else None
+
+    def _game_for_player(self, player_id: int) -> dict | None:
+        snapshot = self.scoreboard.snapshot
+        if snapshot is None:
+            return None
+        ref = snapshot.players.by_id.get(player_id)
+        return snapshot.boxscores[ref.game_id] if ref else None
+
+    async def _on_game_final(self, box: dict) -> None:
+        """
+        Invalidate the career stats of everyone who played once a game goes final.
+        """
+        keys = []
+        for side in ("homeTeam", "awayTeam"):
+            keys.extend(
+                payload_key("career", player["personId"])
+                for player in box[side]["players"]
+                if player.get("played") == "1"
+            )
+        for key in keys:
+            await self.cache.delete(key)
+
+    def _get_player_data(self, name: str) -> tuple[dict | None, str | None]:
         """
-        Retrieve the full list of NBA teams from the static endpoint.
+        Resolve a player by name, nickname, last name or near-miss spelling.
+
         Returns:
-            list[dict]: A list of team metadata dicts.
+            tuple[dict | None, str | None]: The player, or None together with a
+                "not found" / "did you mean" reply for the user.
         """
-        return teams.get_teams()
+        player, candidates = self.players.resolve(name)
+        if player:
+            return player, None
+        logger.warning(f"Player not found: {name}")
+        if candidates:
+            names = ", ".join(candidate["full_name"] for candidate in candidates)
+            return None, f"Player not found: {name}. Did you mean: {names}?"
+        return None, f"Player not found: {name}"
 
     @staticmethod
-    def _get_player_data(name: str) -> dict | None:
+    def _get_team_data(name: str) -> tuple[dict | None, str | None]:
         """
-        Look up a player by full name (case-insensitive).
+        Look up a team by full name, nickname, abbreviation, city or slang.
+
+        Returns:
+            tuple[dict | None, str | None]: The team, or None together with a
+                "not found" / "ambiguous" reply for the user.
         """
-        matches = players.find_players_by_full_name(name)
+        matches = TEAM_INDEX.lookup(name)
+        if len(matches) == 1:
+            return matches[0], None
         if matches:
-            return matches[0]
-        logger.warning(f"Player not found: {name}")
-        return None
-
-    @staticmethod
-    def _get_team_data(name: str) -> dict | None:
-        """
-        Look up a team by full name, nickname, or abbreviation (case-insensitive).
-        """
-        name_lower = name.strip().lower()
-        for team in NBAClient._get_all_teams():
-            if (
-                name_lower == team["full_name"].lower() or
-                name_lower == team["nickname"].lower() or
-                name_lower == team["abbreviation"].lower()
-            ):
-                return team
+            names = ", ".join(team["full_name"] for team in matches)
+            return None, f"{name} is ambiguous: {names}."
         logger.warning(f"Team not found: {name}")
-        return None
+        return None, f"Team not found: {name}"
 
     async def get_game_score(self, name: str) -> str:
         """
-        Fetch the current game score for the given team, using the rotating proxy.
-        Results are not cached.
+        Return the current game score for the given team from the live snapshot.
         """
-        data = NBAClient._get_team_data(name)
+        data, error = NBAClient._get_team_data(name)
         if not data:
-            return f"Team not found: {name}"
+            return error
+
+        snapshot = self.scoreboard.snapshot
+        if snapshot is None:
+            return self.UNAVAILABLE
+
+        game = snapshot.find_game(data["id"])
+        if game is None:
+            return f"The {data['full_name']} are not currently playing."
+
+        home, away = game["homeTeam"], game["awayTeam"]
+        away_name = f"{away['teamCity']} {away['teamName']}"
+        home_name = f"{home['teamCity']} {home['teamName']}"
+        return (
+            f"{away_name} {away['score']} - "
+            f"{home_name} {home['score']} ({game['gameStatusText']})"
+        )
 
-        proxy = await self.proxy_manager.get_proxy()
-        games = scoreboard.ScoreBoard(proxy=proxy).get_dict()[
-            "scoreboard"]["games"]
-
-        for game in games:
-            home, away = game["homeTeam"], game["awayTeam"]
-            if data["id"] in (home["teamId"], away["teamId"]):
-                box = boxscore.BoxScore(
-                    game_id=game["gameId"], proxy=proxy).get_dict()["game"]
-                away_name = f"{away['teamCity']} {away['teamName']}"
-                home_name = f"{home['teamCity']} {home['teamName']}"
-                status = box["gameStatusText"]
-
-                return (
-                    f"{away_name} {box['awayTeam']['score']} - "
-                    f"{home_name} {box['homeTeam']['score']} ({status})"
-                )
-        return f"The {data['full_name']} are not currently playing."
-
-    async def get_player_career(self, name: str) -> str:
-        """
-        Compute and return a player's career averages, using the rotating proxy.
-        Results are cached in Redis for 1 hour.
-        """
-        player = NBAClient._get_player_data(name)
-        if not player:
-            return f"Player not found: {name}"
+    async def get_player_career(self, name: str, season: int | None = None) -> str:
+        """
+        Return a player's career (or single-season) averages, regular season
+        and playoffs, using the rotating proxy.
+        The compact career rows are cached until the player's next game goes
+        final (or the next ET day) and the reply is computed from them locally;
+        concurrent misses share one fetch.
 
-        cache_key = f"career:{player['id']}"
-        cached = await self.redis.get(cache_key)
-        if cached:
-            logger.info(f"Cache hit for career stats of {name}")
-            return cached
+        Args:
+            name (str): The player's name, nickname or last name.
+            season (int | None): Start year of a single season to show.
+        """
+        player, error = self._get_player_data(name)
+        if not player:
+            return error
+
+        try:
+            career = await self.cache.get_or_refresh(
+                payload_key("career", player["id"]),
+                lambda: self._fetch_player_career(player),
+            )
+        except asyncio.TimeoutError:
+            return self.TIMED_OUT
+        except requests.RequestException as e:
+            logger.warning("Career stats request for %s failed: %s", player["id"], e)
+            return self.STATS_UNAVAILABLE
+        return format_career(player["full_name"], CareerStats.from_compact(career), season)
+
+    async def _fetch_player_career(self, player: dict) -> tuple[dict, float]:
+        """
+        Fetch a player's career stats upstream.
 
+        Returns:
+            tuple[dict, float]: The compact career rows and how long they may be cached.
+        """
         proxy = await self.proxy_manager.get_proxy()
-        career_df = playercareerstats.PlayerCareerStats(
-            player_id=player["id"],
-            proxy=proxy
-        ).get_data_frames()[0]
-
-        if career_df.empty:
-            logger.warning(f"No career data for {name}")
-            return "No career data available."
-
-        gp  = career_df["GP"].sum()
-        pts = career_df["PTS"].sum()
-        reb = career_df["REB"].sum()
-        ast = career_df["AST"].sum()
-        fgm = career_df["FGM"].sum()
-        fga = career_df["FGA"].sum()
-
-        avg_pts = round(pts / gp, 1) if gp else 0.0
-        avg_reb = round(reb / gp, 1) if gp else 0.0
-        avg_ast = round(ast / gp, 1) if gp else 0.0
-        fg_pct  = round((fgm / fga) * 100, 1) if fga else 0.0
-
-        result = (
-            f"{player['full_name']}: "
-            f"{avg_pts} PTS, {avg_reb} REB, {avg_ast} AST, {fg_pct}% FG"
-        )
-
-        await self.redis.set(cache_key, result, expire_seconds=3600)
-        return result
+        payload = await self.transport.get_stats_json(
+            "PlayerCareerStats", career_params(player["id"]), proxy)
+        ttl = self.policy.ttl_for_game(self._game_for_player(player["id"]))
+        return compact_career(payload), ttl
 
     async def get_player_statline(self, name: str) -> str:
         """
-        Fetch a player's box-score stat line from any live game, using the rotating proxy.
+        Return a player's box-score stat line from any started game in the live snapshot.
+        Accepts full names, last names and personIds, ignoring accents and case.
         """
-        name_lower = name.strip().lower()
-        proxy = await self.proxy_manager.get_proxy()
-
-        games = scoreboard.ScoreBoard(proxy=proxy).get_dict()[
-            "scoreboard"]["games"]
-        for game in games:
-            game_id = game["gameId"]
-            box = boxscore.BoxScore(
-                game_id=game_id, proxy=proxy).get_dict()["game"]
-            for side in ("homeTeam", "awayTeam"):
-                for player in box[side]["players"]:
-                    if player["name"].lower() != name_lower:
-                        continue
-                    stats = player.get("statistics")
-                    if not stats:
-                        continue
-
-                    pts = stats["points"]
-                    reb = stats["reboundsTotal"]
-                    ast = stats["assists"]
-                    stl = stats["steals"]
-                    blk = stats["blocks"]
-                    tov = stats["turnovers"]
-                    mins = int(stats["minutes"].split("PT")[1].split("M")[0])
-
-                    fg_m = stats["fieldGoalsMade"]
-                    fg_a = stats["fieldGoalsAttempted"]
-                    tp_m = stats["threePointersMade"]
-                    tp_a = stats["threePointersAttempted"]
-                    ft_m = stats["freeThrowsMade"]
-                    ft_a = stats["freeThrowsAttempted"]
-
-                    return (
-                        f"{player['name']}: {pts} PTS "
-                        f"({fg_m}/{fg_a} FG, {tp_m}/{tp_a} 3PT, {ft_m}/{ft_a} FT), "
-                        f"{reb} REB, {ast} AST, {stl} STL, {blk} BLK, {tov} TO "
-                        f"in {mins} MIN"
-                    )
-        logger.warning(f"Player not found: {name}")
-        return f"{name} is not currently playing."
+        snapshot = self.scoreboard.snapshot
+        if snapshot is None:
+            return self.UNAVAILABLE
+
+        candidates = [
+            player for player in map(snapshot.player, snapshot.players.lookup(name))
+            if player.get("statistics")
+        ]
+        if not candidates:
+            logger.warning(f"Player not found: {name}")
+            return f"{name} is not currently playing."
+        if len(candidates) > 1:
+            names = ", ".join(player["name"] for player in candidates)
+            return f"Did you mean: {names}?"
+
+        player = candidates[0]
+        stats = player["statistics"]
+
+        pts = stats["points"]
+        reb = stats["reboundsTotal"]
+        ast = stats["assists"]
+        stl = stats["steals"]
+        blk = stats["blocks"]
+        tov = stats["turnovers"]
+        mins = int(stats["minutes"].split("PT")[1].split("M")[0])
+
+        fg_m = stats["fieldGoalsMade"]
+        fg_a = stats["fieldGoalsAttempted"]
+        tp_m = stats["threePointersMade"]
+        tp_a = stats["threePointersAttempted"]
+        ft_m = stats["freeThrowsMade"]
+        ft_a = stats["freeThrowsAttempted"]
+
+        return (
+            f"{player['name']}: {pts} PTS "
+            f"({fg_m}/{fg_a} FG, {tp_m}/{tp_a} 3PT, {ft_m}/{ft_a} FT), "
+            f"{reb} REB, {ast} AST, {stl} STL, {blk} BLK, {tov} TO "
+            f"in {mins} MIN"
+        )
 
     async def get_team_record(self, name: str) -> str:
         """
-        Retrieve the current win-loss record for a team, using the rotating proxy.
+        Return a team's win-loss record, streak, conference seed and games
+        behind from the cached league standings.
         """
-        data = NBAClient._get_team_data(name)
+        data, error = NBAClient._get_team_data(name)
         if not data:
-            return f"Team not found: {name}"
-
-        cache_key = f"record:{data['id']}"
-        cached = await self.redis.get(cache_key)
-        if cached:
-            logger.info(f"Cache hit for {name} season record.")
-            return cached
-
-        proxy = await self.proxy_manager.get_proxy()
-        df = teamgamelog.TeamGameLog(
-            team_id=data["id"], proxy=proxy).get_data_frames()[0]
-        w, l = df.iloc[0]["W"], df.iloc[0]["L"]
-        result = f"The {data['full_name']} are {w} - {l}"
-        await self.redis.set(cache_key, result, expire_seconds=3600)
-        return result
+            return error
+
+        try:
+            standing = await self.standings.get_standing(data["id"])
+        except asyncio.TimeoutError:
+            return self.TIMED_OUT
+        except requests.RequestException as e:
+            logger.warning("Standings request failed: %s", e)
+            return self.STATS_UNAVAILABLE
+        if standing is None:
+            return f"No record available for the {data['full_name']}."
+        return format_record(data["full_name"], standing)
 
     async def get_schedule(self) -> str:
         """
-        Fetch and format today's NBA schedule, using the rotating proxy.
+        Return today's formatted NBA schedule from the live snapshot.
         Returns:
             str: A schedule, or "No games scheduled."
         """
-        cache_key = "schedule"
-        cached = await self.redis.get(cache_key)
-        if cached:
-            logger.info("Cache hit for today's NBA schedule.")
-            return cached
-
-        proxy = await self.proxy_manager.get_proxy()
-        games = scoreboard.ScoreBoard(proxy=proxy).get_dict()[
-            "scoreboard"]["games"]
-        result = format_schedule(games)
-        await self.redis.set(cache_key, result, expire_seconds=3600)
-        return result
+        snapshot = self.scoreboard.snapshot
+        if snapshot is None:
+            return self.UNAVAILABLE
+        return snapshot.schedule
@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from managers.proxy import proxy_label
+from utils.metrics import UPSTREAM_LATENCY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class EndpointPolicy:
+    """
+    Per-endpoint limits applied by NBATransport.
+
+    Attributes:
+        timeout (float): Seconds before the call is abandoned and TimeoutError is raised.
+        concurrency (int): Maximum number of in-flight calls to this endpoint.
+    """
+    timeout: float
+    concurrency: int
+
+
+class NBATransport:
+    """
+    Runs the NBA's HTTP endpoints on a bounded thread pool so that a slow
+    stats.nba.com response never blocks the asyncio event loop.
+    Each endpoint gets its own timeout and concurrency limit, so a backlog on
+    one endpoint cannot starve the others of worker threads.
+
+    Both the live CDN feeds (scoreboard, box scores, play-by-play) and the
+    stats.nba.com endpoints are fetched directly through a pooled
+    requests.Session per proxy, so concurrent requests reuse keep-alive
+    connections and gzip-compressed responses instead of opening a new
+    connection per call. The stats JSON is returned as is: callers read
+    the result sets they need without building DataFrames.
+
+    When given a ProxyManager, every call reports its latency and outcome
+    for the proxy it used, which drives proxy selection and circuit breaking.
+    """
+
+    LIVE_BASE_URL = "https://cdn.nba.com/static/json/liveData"
+    LIVE_HEADERS = {
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        "Origin": "https://www.nba.com",
+        "Referer": "https://www.nba.com/",
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+        ),
+    }
+
+    STATS_BASE_URL = "https://stats.nba.com/stats"
+    STATS_HEADERS = {
+        "Host": "stats.nba.com",
+        "Origin": "https://www.nba.com",
+        "Referer": "https://www.nba.com/",
+        "x-nba-stats-origin": "stats",
+        "x-nba-stats-token": "true",
+    }
+
+    DEFAULT_POLICY = EndpointPolicy(timeout=15.0, concurrency=4)
+    POLICIES: dict[str, EndpointPolicy] = {
+        "ScoreBoard": EndpointPolicy(timeout=10.0, concurrency=2),
+        "BoxScore": EndpointPolicy(timeout=10.0, concurrency=16),
+        "PlayByPlay": EndpointPolicy(timeout=10.0, concurrency=16),
+        "LeagueStandingsV3": EndpointPolicy(timeout=15.0, concurrency=1),
+        "PlayerCareerStats": EndpointPolicy(timeout=15.0, concurrency=4),
+    }
+
+    def __init__(self, max_workers: int = 32,
+                 policies: dict[str, EndpointPolicy] | None = None,
+                 proxy_manager=None):
+        """
+        Initialize the NBATransport.
+
+        Args:
+            max_workers (int): Size of the shared worker thread pool.
+            policies (dict[str, EndpointPolicy] | None): Overrides for the
+                per-endpoint defaults, keyed by endpoint name.
+            proxy_manager (ProxyManager | None): Receives per-proxy outcome reports.
+        """
+        self.proxy_manager = proxy_manager
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="nba-api")
+        self._max_workers = max_workers
+        self._policies = {**self.POLICIES, **(policies or {})}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._sessions: dict[str | None, requests.Session] = {}
+
+    def policy(self, endpoint: str) -> EndpointPolicy:
+        """
+        Return the policy for the given endpoint name.
+        """
+        return self._policies.get(endpoint, self.DEFAULT_POLICY)
+
+    def _semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(endpoint)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.policy(endpoint).concurrency)
+            self._semaphores[endpoint] = semaphore
+        return semaphore
+
+    def _session(self, proxy: str | None) -> requests.Session:
+        """
+        Return the keep-alive session for the given proxy, creating it on first use.
+        Only called from the event loop thread, so no locking is needed.
+        """
+        session = self._sessions.get(proxy)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self._max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self.LIVE_HEADERS)
+            if proxy:
+                session.proxies = {"http": proxy, "https": proxy}
+            self._sessions[proxy] = session
+        return session
+
+    async def _run(self, endpoint: str, work: Callable[[], T], proxy: str | None) -> T:
+        """
+        Run work on the pool under the endpoint's concurrency limit and timeout,
+        reporting the outcome for the proxy it went through. Only transport
+        errors, timeouts and 429/5xx answers count against the proxy; other
+        HTTP errors (e.g. a 404 for a box score not published yet) are the
+        upstream's answer, and a cancelled call is not reported at all.
+        """
+        policy = self.policy(endpoint)
+        async with self._semaphore(endpoint):
+            loop = asyncio.get_running_loop()
+            started = time.monotonic()
+            ok = False
+            proxy_ok: bool | None = False
+            try:
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(self._executor, work), policy.timeout)
+                ok = proxy_ok = True
+                return result
+            except asyncio.TimeoutError:
+                logger.warning("%s timed out after %.1fs", endpoint, policy.timeout)
+                raise
+            except asyncio.CancelledError:
+                proxy_ok = None
+                raise
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                proxy_ok = status is not None and status != 429 and status < 500
+                raise
+            finally:
+                elapsed = time.monotonic() - started
+                UPSTREAM_LATENCY.observe(
+                    elapsed, endpoint, proxy_label(proxy), "ok" if ok else "error")
+                if self.proxy_manager is not None and proxy_ok is not None:
+                    self.proxy_manager.report(proxy, elapsed, proxy_ok)
+
+    async def get_live_json(self, endpoint: str, path: str, proxy: str | None) -> dict:
+        """
+        GET a JSON document from the live CDN through the pooled session for proxy.
+
+        Args:
+            endpoint (str): Policy name for the request, e.g. "BoxScore".
+            path (str): Path below LIVE_BASE_URL, e.g. "boxscore/boxscore_0022400001.json".
+            proxy (str | None): Proxy URL to route the request through.
+
+        Returns:
+            dict: The decoded JSON payload.
+
+        Raises:
+            asyncio.TimeoutError: If the request does not finish within its timeout.
+            requests.HTTPError: If the CDN answers with an error status.
+        """
+        timeout = self.policy(endpoint).timeout
+        session = self._session(proxy)
+        url = f"{self.LIVE_BASE_URL}/{path}"
+
+        def work() -> dict:
+            response = session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+
+        return await self._run(endpoint, work, proxy)
+
+    async def get_live_json_if_changed(self, endpoint: str, path: str, proxy: str | None,
+                                       etag: str | None) -> tuple[dict | None, str | None]:
+        """
+        Conditionally GET a JSON document from the live CDN: when the CDN
+        still has the version identified by etag it answers 304 and nothing
+        is downloaded or decoded.
+
+        Args:
+            endpoint (str): Policy name for the request, e.g. "PlayByPlay".
+            path (str): Path below LIVE_BASE_URL.
+            proxy (str | None): Proxy URL to route the request through.
+            etag (str | None): ETag of the copy already held, if any.
+
+        Returns:
+            tuple[dict | None, str | None]: The decoded payload, or None if it
+                is unchanged, and the ETag to send next time.
+
+        Raises:
+            asyncio.TimeoutError: If the request does not finish within its timeout.
+            requests.HTTPError: If the CDN answers with an error status.
+        """
+        timeout = self.policy(endpoint).timeout
+        session = self._session(proxy)
+        url = f"{self.LIVE_BASE_URL}/{path}"
+        headers = {"If-None-Match": etag} if etag else None
+
+        def work() -> tuple[dict | None, str | None]:
+            response = session.get(url, timeout=timeout, headers=headers)
+            if response.status_code == 304:
+                return None, etag
+            response.raise_for_status()
+            return response.json(), response.headers.get("ETag")
+
+        return await self._run(endpoint, work, proxy)
+
+    async def get_stats_json(self, endpoint: str, params: dict, proxy: str | None) -> dict:
+        """
+        GET a stats.nba.com endpoint through the pooled session for proxy and
+        return its decoded JSON, with no nba_api endpoint object or DataFrame
+        in between.
+
+        Args:
+            endpoint (str): The endpoint name, e.g. "PlayerCareerStats"; also its policy name.
+            params (dict): Query parameters, e.g. {"PlayerID": 2544, "PerMode": "Totals"}.
+            proxy (str | None): Proxy URL to route the request through.
+
+        Returns:
+            dict: The decoded payload, with its "resultSets".
+
+        Raises:
+            asyncio.TimeoutError: If the request does not finish within its timeout.
+            requests.HTTPError: If stats.nba.com answers with an error status.
+        """
+        timeout = self.policy(endpoint).timeout
+        session = self._session(proxy)
+        url = f"{self.STATS_BASE_URL}/{endpoint.lower()}"
+
+        def work() -> dict:
+            response = session.get(url, params=params, headers=self.STATS_HEADERS,
+                                   timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+
+        return await self._run(endpoint, work, proxy)
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool without waiting for in-flight requests
+        and close every pooled session.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
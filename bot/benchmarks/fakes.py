@@ -0,0 +1,226 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+from api.nba import NBAClient
+from api.transport import EndpointPolicy, NBATransport
+from managers.cache import CacheManager
+from managers.scoreboard import ScoreboardManager
+from managers.standings import StandingsManager
+from utils.cache_policy import CachePolicy
+from utils.player_index import PlayerIndex
+
+T = TypeVar("T")
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for RedisManager with the same coroutine interface
+    and TTL semantics, so the cache, single-flight and lock code paths run
+    unchanged without a Redis server.
+    """
+
+    def __init__(self):
+        self._data: dict[str, tuple[Any, float | None]] = {}
+        self._sorted_sets: dict[str, dict[str, float]] = {}
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._sorted_sets.clear()
+
+    def _get(self, key: str) -> tuple[Any, float | None]:
+        value, expires_at = self._data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None, None
+        return value, expires_at
+
+    def _set(self, key: str, value: Any, expire_seconds: float | None) -> None:
+        expires_at = time.monotonic() + expire_seconds if expire_seconds else None
+        self._data[key] = (value, expires_at)
+
+    def _ttl(self, expires_at: float | None) -> float | None:
+        return None if expires_at is None else expires_at - time.monotonic()
+
+    async def get(self, key: str) -> str | None:
+        return self._get(key)[0]
+
+    async def get_bytes_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        value, expires_at = self._get(key)
+        return value, self._ttl(expires_at)
+
+    async def set_bytes(self, key: str, value: bytes, expire_seconds: int | None = None) -> None:
+        self._set(key, value, expire_seconds)
+
+    async def set_many_bytes(self, items: list[tuple[str, bytes, int | None]]) -> None:
+        for key, value, expire_seconds in items:
+            self._set(key, value, expire_seconds)
+
+    async def set(self, key: str, value: str, expire_seconds: int | None = None) -> None:
+        self._set(key, value, expire_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        pass
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        await asyncio.Event().wait()
+        yield ""
+
+    async def heartbeat(self, key: str, member: str, ttl_seconds: float) -> list[str]:
+        members = self._sorted_sets.setdefault(key, {})
+        now = time.time()
+        members[member] = now
+        for name, score in list(members.items()):
+            if score < now - ttl_seconds:
+                del members[name]
+        return sorted(members)
+
+    async def remove_member(self, key: str, member: str) -> None:
+        self._sorted_sets.get(key, {}).pop(member, None)
+
+    async def exists(self, key: str) -> bool:
+        return self._get(key)[0] is not None
+
+    async def acquire_lock(self, key: str, ttl_seconds: float) -> str | None:
+        if self._get(key)[0] is not None:
+            return None
+        token = uuid.uuid4().hex
+        self._set(key, token, ttl_seconds)
+        return token
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if self._get(key)[0] == token:
+            del self._data[key]
+
+
+class FakeProxyManager:
+    """
+    Direct connection only: no proxies, nothing to report.
+    """
+
+    stats: list = []
+
+    async def get_proxy(self) -> str | None:
+        return None
+
+    def report(self, url: str | None, latency: float, ok: bool) -> None:
+        pass
+
+
+class FixtureTransport(NBATransport):
+    """
+    NBATransport that answers from the recorded JSON fixtures instead of the
+    network. Each response is decoded from its raw text on every call, as a
+    real response would be, after an optional simulated upstream latency.
+    Endpoint concurrency limits still apply.
+
+    Fixture files:
+        scoreboard.json              live scoreboard (todaysScoreboard_00.json)
+        boxscore_<gameId>.json       live box scores
+        playbyplay_<gameId>.json     live play-by-play
+        career_<playerId>.json       PlayerCareerStats; career.json for any other player
+        standings.json               LeagueStandingsV3
+    """
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, latency: float = 0.0,
+                 policies: dict[str, EndpointPolicy] | None = None):
+        """
+        Args:
+            fixtures_dir (str): Directory holding the fixture files.
+            latency (float): Seconds each upstream call is delayed by.
+            policies (dict[str, EndpointPolicy] | None): Endpoint policy overrides.
+        """
+        super().__init__(max_workers=1, policies=policies)
+        self.latency = latency
+        self.calls: dict[str, int] = {}
+        self._raw: dict[str, str] = {}
+        for name in os.listdir(fixtures_dir):
+            if name.endswith(".json"):
+                with open(os.path.join(fixtures_dir, name), encoding="utf-8") as f:
+                    self._raw[name[:-len(".json")]] = f.read()
+
+    def _load(self, name: str, fallback: str | None = None) -> dict:
+        raw = self._raw.get(name)
+        if raw is None and fallback is not None:
+            raw = self._raw.get(fallback)
+        if raw is None:
+            raise FileNotFoundError(f"No fixture named {name}.json")
+        return json.loads(raw)
+
+    async def _serve(self, endpoint: str, load: Callable[[], T]) -> T:
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        async with self._semaphore(endpoint):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return load()
+
+    async def get_live_json(self, endpoint: str, path: str, proxy: str | None) -> dict:
+        name = os.path.basename(path)[:-len(".json")]
+        if name == "todaysScoreboard_00":
+            name = "scoreboard"
+        return await self._serve(endpoint, lambda: self._load(name))
+
+    async def get_live_json_if_changed(self, endpoint: str, path: str, proxy: str | None,
+                                       etag: str | None) -> tuple[dict | None, str | None]:
+        # Fixtures never change, so the file name serves as the ETag.
+        name = os.path.basename(path)[:-len(".json")]
+        if etag == name:
+            return await self._serve(endpoint, lambda: None), etag
+        return await self._serve(endpoint, lambda: self._load(name)), name
+
+    async def get_stats_json(self, endpoint: str, params: dict, proxy: str | None) -> dict:
+        if endpoint == "PlayerCareerStats":
+            fixture, fallback = f"career_{params['PlayerID']}", "career"
+        elif endpoint == "LeagueStandingsV3":
+            fixture, fallback = "standings", None
+        else:
+            raise FileNotFoundError(f"No fixture for endpoint {endpoint}")
+        return await self._serve(endpoint, lambda: self._load(fixture, fallback))
+
+
+@dataclass
+class NBAStack:
+    """
+    The bot's NBA data path wired to the fakes above.
+    """
+    redis: FakeRedis
+    cache: CacheManager
+    transport: FixtureTransport
+    scoreboard: ScoreboardManager
+    standings: StandingsManager
+    client: NBAClient
+
+    def clear_caches(self) -> None:
+        """
+        Empty both cache tiers, so the next call is a cold miss.
+        """
+        self.cache.local.clear()
+        self.redis.clear()
+
+
+def build_nba_stack(latency: float = 0.0, fixtures_dir: str = FIXTURES_DIR,
+                    player_index: PlayerIndex | None = None) -> NBAStack:
+    """
+    Build an NBAClient (and its managers) on FakeRedis, FakeProxyManager and
+    FixtureTransport. Call `await stack.scoreboard.refresh()` to publish the
+    first snapshot.
+    """
+    redis = FakeRedis()
+    proxy_manager = FakeProxyManager()
+    cache = CacheManager(redis)
+    transport = FixtureTransport(fixtures_dir, latency)
+    scoreboard = ScoreboardManager(proxy_manager, transport, cache, CachePolicy())
+    standings = StandingsManager(proxy_manager, transport, cache, scoreboard)
+    client = NBAClient(
+        proxy_manager, cache, scoreboard, transport,
+        player_index or PlayerIndex.from_static(), standings)
+    return NBAStack(redis, cache, transport, scoreboard, standings, client)
@@ -0,0 +1,433 @@
+"""
+End-to-end chat load simulator.
+
+Runs the bot's real chat path (twitchio command dispatch, CommandManager,
+KeywordHandler, OutboundManager, NBAClient and its caches) inside one process
+with local stand-ins for everything remote:
+
+- Twitch EventSub: synthetic ChatMessage events are dispatched into the bot
+  across thousands of channels, with a realistic command mix, popular
+  channels getting most of the traffic, and periodic bursts.
+- Helix send-message: sends are answered after a configurable latency.
+- Supabase (+ realtime): channels are paged in from an in-memory table, and
+  channels are toggled through DatabaseManager.on_change while the load runs.
+- stats.nba.com and the live CDN: answered from the benchmark fixtures.
+
+It reports end-to-end reply latency (message dispatched -> reply sent),
+throughput and memory growth per load step. With --ramp the message rate
+doubles every step until replies miss the latency SLO, which gives the
+throughput ceiling of one Bot instance:
+
+    python -m benchmarks.loadsim                        # from the bot directory
+    python -m benchmarks.loadsim --ramp --rate 250 --step 20
+"""
+import os
+
+# Config reads these at import time; the simulator never talks to either.
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "simulated")
+os.environ.setdefault("TWITCH_BOT_ID", "1")
+os.environ.setdefault("TWITCH_BOT_USERNAME", "nbalivebot")
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import random
+import re
+import resource
+import statistics
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+import twitchio
+from twitchio.ext import commands
+
+from benchmarks.fakes import FakeProxyManager, build_nba_stack
+from config import Config
+from managers.command import CommandManager
+from managers.database import DatabaseManager
+from managers.outbound import OutboundManager
+from managers.websocket import WebSocketManager
+from utils.keyword_handler import KeywordHandler
+
+logger = logging.getLogger(__name__)
+
+# Share of chat messages per kind; everything else is ordinary chatter.
+COMMAND_MIX = {
+    "!score": 0.05,
+    "!stats": 0.04,
+    "!career": 0.015,
+    "!record": 0.015,
+    "!schedule": 0.01,
+    "keyword": 0.02,
+}
+CHATTER = ("LETS GO", "what a shot", "refs are blind", "W", "no way", "MVP MVP",
+           "that was a foul", "clutch", "who's winning?", "bench him")
+MENTION = re.compile(r"@sim(\d+)\b")
+
+
+class FakeSupabase:
+    """
+    The `channels` table, in memory, behind the query-builder calls that
+    DatabaseManager makes.
+    """
+
+    def __init__(self, channel_ids: list[str]):
+        self.rows = [{"broadcaster_user_id": channel_id, "is_active": True}
+                     for channel_id in channel_ids]
+
+    def table(self, name: str) -> "FakeSupabase._Query":
+        return self._Query(self.rows if name == "channels" else [])
+
+    class _Query:
+        def __init__(self, rows: list[dict]):
+            self._rows = rows
+            self._range = (0, len(rows))
+
+        def select(self, *args, **kwargs) -> "FakeSupabase._Query":
+            return self
+
+        def eq(self, column: str, value) -> "FakeSupabase._Query":
+            return FakeSupabase._Query([row for row in self._rows if row.get(column) == value])
+
+        def order(self, column: str) -> "FakeSupabase._Query":
+            return FakeSupabase._Query(sorted(self._rows, key=lambda row: row.get(column) or ""))
+
+        def range(self, start: int, end: int) -> "FakeSupabase._Query":
+            self._range = (start, end + 1)
+            return self
+
+        def execute(self) -> SimpleNamespace:
+            start, end = self._range
+            return SimpleNamespace(data=self._rows[start:end], count=len(self._rows))
+
+
+class SimBot(commands.Bot):
+    """
+    A twitchio Bot wired like bot.Bot, but on local stand-ins. EventSub
+    subscribe calls succeed immediately and Helix sends are recorded.
+    """
+
+    def __init__(self, stack, channel_ids: list[str], channel_limit: int,
+                 global_limit: int, send_latency: float):
+        super().__init__(client_id="simulated", client_secret="simulated",
+                         bot_id=Config.BOT_ID, prefix="!")
+        self.stack = stack
+        self.proxy_manager = FakeProxyManager()
+        self.cache_manager = stack.cache
+        self.nba_client = stack.client
+        self.outbound_manager = OutboundManager(self, channel_limit, global_limit)
+        self.keyword_handler = KeywordHandler()
+        self.websocket_manager = WebSocketManager(self)
+        self.database_manager = DatabaseManager(
+            FakeSupabase(channel_ids), self.websocket_manager, keyword_handler=self.keyword_handler)
+        self.send_latency = send_latency
+        self.sent: list[tuple[float, str]] = []
+        self._subscriptions: dict[str, SimpleNamespace] = {}
+        self._http.post_chat_message = self._post_chat_message
+
+    async def subscribe_websocket(self, payload, **kwargs) -> dict:
+        # Same shape as twitchio's SubscriptionResponse.
+        subscription_id = uuid.uuid4().hex
+        condition = dict(payload.condition)
+        self._subscriptions[subscription_id] = SimpleNamespace(
+            id=subscription_id, condition=condition)
+        return {
+            "data": [{"id": subscription_id, "status": "enabled", "condition": condition}],
+            "total": len(self._subscriptions),
+            "total_cost": 0,
+            "max_total_cost": 10,
+        }
+
+    def websocket_subscriptions(self) -> dict[str, SimpleNamespace]:
+        return dict(self._subscriptions)
+
+    async def delete_websocket_subscription(self, subscription_id: str) -> None:
+        self._subscriptions.pop(subscription_id, None)
+
+    async def _post_chat_message(self, broadcaster_id, sender_id, message, token_for=None,
+                                 reply_to_message_id=None) -> dict:
+        if self.send_latency:
+            await asyncio.sleep(self.send_latency)
+        self.sent.append((time.perf_counter(), message))
+        return {"data": [{"message_id": uuid.uuid4().hex, "is_sent": True, "drop_reason": None}]}
+
+    async def event_command_error(self, payload) -> None:
+        # Cooldown rejections are expected under load; keep them quiet.
+        pass
+
+
+class TrafficGenerator:
+    """
+    Builds synthetic EventSub chat messages. Channel popularity follows a
+    Pareto distribution, so a few big channels carry most of the traffic.
+    """
+
+    def __init__(self, bot: SimBot, channel_ids: list[str], seed: int):
+        self.bot = bot
+        self.random = random.Random(seed)
+        self.channel_ids = channel_ids
+        self.weights = [self.random.paretovariate(1.2) for _ in channel_ids]
+        snapshot = bot.stack.scoreboard.snapshot
+        self.teams = [game[side]["teamName"] for game in snapshot.games
+                      for side in ("homeTeam", "awayTeam")]
+        self.players = [player["name"] for box in snapshot.boxscores.values()
+                        for side in ("homeTeam", "awayTeam")
+                        for player in box[side]["players"][:6]]
+        self.careers = ["LeBron James", "Stephen Curry", "Nikola Jokic", "wemby", "steph",
+                        "Kevin Durant", "Jayson Tatum", "Antony Edwrds"]
+        self.sequence = 0
+        self.dispatched: dict[int, float] = {}
+
+    def _text(self) -> str:
+        roll = self.random.random()
+        for kind, share in COMMAND_MIX.items():
+            if roll < share:
+                break
+            roll -= share
+        else:
+            return self.random.choice(CHATTER)
+        if kind == "!score":
+            return f"!score {self.random.choice(self.teams)}"
+        if kind == "!stats":
+            return f"!stats {self.random.choice(self.players)}"
+        if kind == "!career":
+            return f"!career {self.random.choice(self.careers)}"
+        if kind == "!record":
+            return f"!record {self.random.choice(self.teams)}"
+        if kind == "!schedule":
+            return "!schedule"
+        return "lakers in 5"
+
+    def message(self, channel_id: str | None = None, text: str | None = None) -> twitchio.ChatMessage:
+        self.sequence += 1
+        channel_id = channel_id or self.random.choices(self.channel_ids, self.weights)[0]
+        text = text or self._text()
+        login = f"sim{self.sequence}"
+        payload = {
+            "broadcaster_user_id": channel_id,
+            "broadcaster_user_login": f"channel{channel_id}",
+            "broadcaster_user_name": f"Channel{channel_id}",
+            "chatter_user_id": str(10_000_000 + self.sequence),
+            "chatter_user_login": login,
+            "chatter_user_name": login,
+            "message_id": uuid.uuid4().hex,
+            "message": {"text": text, "fragments": [
+                {"type": "text", "text": text, "cheermote": None, "emote": None, "mention": None}]},
+            "color": None,
+            "badges": [],
+            "message_type": "text",
+            "cheer": None,
+            "reply": None,
+            "channel_points_custom_reward_id": None,
+            "channel_points_animation_id": None,
+            "source_broadcaster_user_id": None,
+            "source_broadcaster_user_login": None,
+            "source_broadcaster_user_name": None,
+            "source_message_id": None,
+            "source_badges": None,
+        }
+        return twitchio.ChatMessage(payload, http=self.bot._http)
+
+    def dispatch(self, message: twitchio.ChatMessage) -> None:
+        self.dispatched[self.sequence] = time.perf_counter()
+        self.bot.dispatch("message", message)
+
+
+def _rss_bytes() -> int:
+    """
+    Current resident set size, or the peak where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _percentile(samples: list[float], q: int) -> float | None:
+    if not samples:
+        return None
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+async def run_step(bot: SimBot, traffic: TrafficGenerator, rate: float, duration: float,
+                   burst_every: float, burst_channels: int, burst_size: int,
+                   churn: float, drain: float) -> dict:
+    """
+    Inject `rate` messages per second for `duration` seconds, then wait up to
+    `drain` seconds for replies, and summarize what happened.
+    """
+    first_sent = len(bot.sent)
+    first_sequence = traffic.sequence + 1
+    outbound_before = dict(bot.outbound_manager.stats)
+    rss_before = _rss_bytes()
+    lag = []
+
+    started = time.perf_counter()
+    next_burst = started + burst_every
+    injected = 0
+    tick = 0.01
+    while (now := time.perf_counter()) < started + duration:
+        due = int((now - started) * rate) - injected
+        for _ in range(due):
+            traffic.dispatch(traffic.message())
+        injected += max(due, 0)
+
+        if burst_every and now >= next_burst:
+            # A big moment: many chatters in a few channels ask for the score at once.
+            for channel_id in traffic.random.sample(traffic.channel_ids, burst_channels):
+                for _ in range(burst_size):
+                    traffic.dispatch(traffic.message(
+                        channel_id, f"!score {traffic.random.choice(traffic.teams)}"))
+                    injected += 1
+            next_burst += burst_every
+
+        if churn and traffic.random.random() < churn * tick:
+            channel_id = traffic.random.choice(traffic.channel_ids)
+            active = channel_id not in bot.websocket_manager.subscribed()
+            await bot.database_manager.on_change(
+                {"data": {"record": {"broadcaster_user_id": channel_id, "is_active": active}}})
+
+        before_sleep = time.perf_counter()
+        await asyncio.sleep(tick)
+        lag.append(max(0.0, time.perf_counter() - before_sleep - tick))
+    elapsed = time.perf_counter() - started
+
+    deadline = time.perf_counter() + drain
+    while bot.outbound_manager.depth and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(min(drain, 0.2))
+
+    latencies = []
+    for sent_at, text in bot.sent[first_sent:]:
+        for match in MENTION.finditer(text):
+            sequence = int(match.group(1))
+            if sequence >= first_sequence and sequence in traffic.dispatched:
+                latencies.append(sent_at - traffic.dispatched.pop(sequence))
+    traffic.dispatched = {seq: at for seq, at in traffic.dispatched.items()
+                          if seq >= traffic.sequence - 10_000}
+
+    stats = bot.outbound_manager.stats
+    gc.collect()
+    return {
+        "rate": rate,
+        "injected": injected,
+        "injected_per_sec": round(injected / elapsed, 1),
+        "replies": len(latencies),
+        "sends": len(bot.sent) - first_sent,
+        "sends_per_sec": round((len(bot.sent) - first_sent) / elapsed, 1),
+        "reply_p50_ms": _ms(_percentile(latencies, 50)),
+        "reply_p99_ms": _ms(_percentile(latencies, 99)),
+        "reply_max_ms": _ms(max(latencies) if latencies else None),
+        "dropped": sum(stats[key] - outbound_before[key]
+                       for key in ("dropped_overflow", "dropped_expired", "failed")),
+        "queue_depth": bot.outbound_manager.depth,
+        "loop_lag_p99_ms": _ms(_percentile(lag, 99)),
+        "rss_mb": round(_rss_bytes() / 2**20, 1),
+        "rss_growth_mb": round((_rss_bytes() - rss_before) / 2**20, 1),
+        "subscribed_channels": len(bot.websocket_manager.subscribed()),
+    }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+async def simulate(args: argparse.Namespace) -> list[dict]:
+    stack = build_nba_stack(args.upstream_latency)
+    channel_ids = [str(100_000 + i) for i in range(args.channels)]
+    bot = SimBot(stack, channel_ids, args.channel_limit, args.global_limit, args.send_latency)
+    results = []
+    try:
+        await stack.scoreboard.start()
+        await bot.outbound_manager.start()
+        await bot.add_component(CommandManager(bot, stack.client))
+        while stack.scoreboard.snapshot is None:
+            await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        await bot.database_manager.init()
+        print(f"Subscribed {len(bot.websocket_manager.subscribed())} channels "
+              f"in {time.perf_counter() - started:.2f}s")
+
+        traffic = TrafficGenerator(bot, channel_ids, args.seed)
+        rate = args.rate
+        for step in range(args.steps if args.ramp else 1):
+            result = await run_step(
+                bot, traffic, rate, args.step, args.burst_every, args.burst_channels,
+                args.burst_size, args.churn, args.drain)
+            results.append(result)
+            print(
+                f"rate {result['rate']:>8.0f}/s  in {result['injected_per_sec']:>8.1f}/s"
+                f"  sends {result['sends_per_sec']:>7.1f}/s  reply p50 {result['reply_p50_ms']} ms"
+                f"  p99 {result['reply_p99_ms']} ms  dropped {result['dropped']}"
+                f"  lag p99 {result['loop_lag_p99_ms']} ms  rss {result['rss_mb']} MB"
+                f" (+{result['rss_growth_mb']})"
+            )
+            saturated = (
+                result["injected_per_sec"] < rate * 0.9 or result["dropped"] or
+                (result["reply_p99_ms"] or 0) > args.slo * 1000
+            )
+            if args.ramp and saturated:
+                break
+            rate *= 2
+
+        if args.ramp:
+            sustained = [r["rate"] for r in results
+                         if (r["reply_p99_ms"] or 0) <= args.slo * 1000 and not r["dropped"]
+                         and r["injected_per_sec"] >= r["rate"] * 0.9]
+            if sustained:
+                print(f"Throughput ceiling: {max(sustained):.0f} messages/s "
+                      f"with reply p99 <= {args.slo}s")
+            else:
+                print(f"Saturated below {args.rate:.0f} messages/s")
+        return results
+    finally:
+        await bot.outbound_manager.close()
+        await stack.scoreboard.close()
+        await stack.standings.close()
+        stack.transport.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end chat load simulator.")
+    parser.add_argument("--channels", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=500, help="chat messages per second")
+    parser.add_argument("--step", type=float, default=15, help="seconds per load step")
+    parser.add_argument("--ramp", action="store_true", help="double the rate every step")
+    parser.add_argument("--steps", type=int, default=8, help="maximum ramp steps")
+    parser.add_argument("--slo", type=float, default=2.0, help="reply p99 SLO in seconds")
+    parser.add_argument("--burst-every", type=float, default=5.0,
+                        help="seconds between bursts (0 disables)")
+    parser.add_argument("--burst-channels", type=int, default=20)
+    parser.add_argument("--burst-size", type=int, default=25)
+    parser.add_argument("--churn", type=float, default=1.0,
+                        help="channel activations/deactivations per second")
+    parser.add_argument("--upstream-latency", type=float, default=0.15)
+    parser.add_argument("--send-latency", type=float, default=0.05)
+    parser.add_argument("--channel-limit", type=int, default=100)
+    parser.add_argument("--global-limit", type=int, default=20,
+                        help="sends per 30s across channels (default: 20; 7500 for a verified bot)")
+    parser.add_argument("--drain", type=float, default=5.0,
+                        help="seconds to wait for queued replies after each step")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the step results as JSON")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    results = asyncio.run(simulate(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
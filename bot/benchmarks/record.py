@@ -0,0 +1,70 @@
+"""
+Re-record the benchmark fixtures from the live NBA endpoints:
+
+    python -m benchmarks.record                  # from the bot directory
+    python -m benchmarks.record --players 2544 201939
+
+Box scores and play-by-play are saved for every game of today's scoreboard
+that has started.
+The first player id is also saved as the default career.json.
+"""
+import argparse
+import asyncio
+import json
+import os
+
+from api.transport import NBATransport
+from benchmarks.fakes import FIXTURES_DIR
+from config import Config
+from managers.proxy import ProxyManager
+from utils.cache_policy import GAME_STATUS_SCHEDULED
+from utils.career import career_params
+from utils.stats_formatter import standings_params
+
+
+def _save(name: str, payload: dict) -> None:
+    with open(os.path.join(FIXTURES_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    print(f"Recorded {name}.json")
+
+
+async def record(player_ids: list[int]) -> None:
+    proxy_manager = ProxyManager.from_config(Config)
+    transport = NBATransport(proxy_manager=proxy_manager)
+    try:
+        scoreboard = await transport.get_live_json(
+            "ScoreBoard", "scoreboard/todaysScoreboard_00.json",
+            await proxy_manager.get_proxy())
+        _save("scoreboard", scoreboard)
+        for game in scoreboard["scoreboard"]["games"]:
+            if game["gameStatus"] == GAME_STATUS_SCHEDULED:
+                continue
+            game_id = game["gameId"]
+            _save(f"boxscore_{game_id}", await transport.get_live_json(
+                "BoxScore", f"boxscore/boxscore_{game_id}.json",
+                await proxy_manager.get_proxy()))
+            _save(f"playbyplay_{game_id}", await transport.get_live_json(
+                "PlayByPlay", f"playbyplay/playbyplay_{game_id}.json",
+                await proxy_manager.get_proxy()))
+
+        for i, player_id in enumerate(player_ids):
+            career = await transport.get_stats_json(
+                "PlayerCareerStats", career_params(player_id), await proxy_manager.get_proxy())
+            _save("career" if i == 0 else f"career_{player_id}", career)
+
+        _save("standings", await transport.get_stats_json(
+            "LeagueStandingsV3", standings_params(), await proxy_manager.get_proxy()))
+    finally:
+        transport.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-record the benchmark fixtures.")
+    parser.add_argument("--players", type=int, nargs="*", default=[2544],
+                        help="player ids whose career stats to record (default: 2544)")
+    args = parser.parse_args()
+    asyncio.run(record(args.players))
+
+
+if __name__ == "__main__":
+    main()
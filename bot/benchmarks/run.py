@@ -0,0 +1,231 @@
+"""
+Offline benchmarks for the command hot paths.
+
+Runs every command path against the recorded fixtures (see benchmarks/fakes.py)
+with a cold cache (both tiers emptied before each call) and a warm cache, and
+reports throughput, p50/p99 latency and allocations per call. Paths answered
+from the scoreboard snapshot are only run warm. Results are
+written as JSON so that runs can be compared:
+
+    python -m benchmarks.run                              # from the bot directory
+    python -m benchmarks.run --output after.json --compare before.json
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+
+from benchmarks.fakes import NBAStack, build_nba_stack
+from utils.schedule_formatter import format_schedule
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+Call = Callable[[str], Awaitable[object]]
+
+# Served from the in-memory scoreboard snapshot, which the cache reset leaves
+# in place, so a cold run would only repeat the warm one.
+SNAPSHOT_PATHS = frozenset({"score", "stats", "schedule", "format_schedule"})
+
+
+def _queries(stack: NBAStack) -> dict[str, list[str]]:
+    """
+    Inputs for each command, taken from the fixtures: teams and players in
+    today's games, plus a few misses and nicknames.
+    """
+    snapshot = stack.scoreboard.snapshot
+    teams = [game[side]["teamName"] for game in snapshot.games
+             for side in ("homeTeam", "awayTeam")]
+    players = [
+        player["name"] for box in snapshot.boxscores.values()
+        for side in ("homeTeam", "awayTeam")
+        for player in box[side]["players"][:5]
+    ]
+    return {
+        "score": teams + ["Spurs", "Jazz", "LAL", "Nope"],
+        "stats": players + ["Jokic", "doncic", "Nobody Here"],
+        "career": ["LeBron James", "Stephen Curry", "Nikola Jokic", "Jayson Tatum",
+                   "wemby", "steph", "Antony Edwrds", "Kevin Durant"],
+        "record": teams + ["Sixers", "Wolves", "Los Angeles", "Nope"],
+        "schedule": [""],
+    }
+
+
+def _paths(stack: NBAStack) -> dict[str, Call]:
+    client = stack.client
+    games = list(stack.scoreboard.snapshot.games)
+
+    async def schedule(_: str) -> str:
+        return await client.get_schedule()
+
+    async def format_schedule_call(_: str) -> str:
+        return format_schedule(games)
+
+    async def refresh(_: str) -> object:
+        return await stack.scoreboard.refresh()
+
+    return {
+        "score": client.get_game_score,
+        "stats": client.get_player_statline,
+        "career": client.get_player_career,
+        "record": client.get_team_record,
+        "schedule": schedule,
+        "format_schedule": format_schedule_call,
+        "scoreboard_refresh": refresh,
+    }
+
+
+def _percentile(samples: list[float], q: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+async def _measure(path: str, call: Call, queries: list[str], iterations: int,
+                   reset: Callable[[], None] | None) -> dict:
+    """
+    Time `iterations` calls, then repeat them under tracemalloc to count
+    allocations without skewing the timings.
+    """
+    for query in queries:  # Warm up imports, regex caches and the cache itself.
+        await call(query)
+
+    latencies = []
+    for i in range(iterations):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        await call(queries[i % len(queries)])
+        latencies.append(time.perf_counter() - started)
+
+    allocation_runs = min(iterations, 200)
+    tracemalloc.start()
+    peaks, blocks = [], []
+    for i in range(allocation_runs):
+        if reset is not None:
+            reset()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        await call(queries[i % len(queries)])
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        peaks.append(peak - base)
+        blocks.append(sum(
+            max(0, stat.count_diff) for stat in after.compare_to(before, "traceback")))
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        "path": path,
+        "cache": "cold" if reset is not None else "warm",
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / total, 1) if total else None,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 4),
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 4),
+        "alloc_peak_bytes": round(statistics.fmean(peaks)),
+        "alloc_blocks": round(statistics.fmean(blocks), 1),
+    }
+
+
+async def run(iterations: int, latency: float, only: list[str] | None) -> list[dict]:
+    stack = build_nba_stack(latency)
+    try:
+        await stack.scoreboard.refresh()
+        queries = _queries(stack)
+        results = []
+        for path, call in _paths(stack).items():
+            if only and path not in only:
+                continue
+            inputs = queries.get(path, [""])
+            resets = (None,) if path in SNAPSHOT_PATHS else (stack.clear_caches, None)
+            for reset in resets:
+                result = await _measure(path, call, inputs, iterations, reset)
+                results.append(result)
+                print(
+                    f"{path:<20} {result['cache']:<5} {result['ops_per_sec'] or 0:>10.1f} ops/s"
+                    f"  p50 {result['p50_ms']:>8.3f} ms  p99 {result['p99_ms']:>8.3f} ms"
+                    f"  {result['alloc_peak_bytes']:>8} B peak  {result['alloc_blocks']:>7} blocks"
+                )
+        return results
+    finally:
+        await stack.standings.close()
+        stack.transport.close()
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(__file__), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: list[dict], baseline_file: str) -> None:
+    """
+    Print the relative change of throughput and latency against an earlier run.
+    """
+    with open(baseline_file, encoding="utf-8") as f:
+        baseline = {(r["path"], r["cache"]): r for r in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_file}:")
+    for result in current:
+        before = baseline.get((result["path"], result["cache"]))
+        if before is None:
+            continue
+        changes = []
+        for metric in ("ops_per_sec", "p50_ms", "p99_ms", "alloc_blocks"):
+            old, new = before.get(metric), result.get(metric)
+            if old:
+                changes.append(f"{metric} {(new - old) / old * 100:+.1f}%")
+        print(f"{result['path']:<20} {result['cache']:<5} " + "  ".join(changes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="simulated upstream latency in seconds (default: 0)")
+    parser.add_argument("--only", nargs="*", help="paths to run (default: all)")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    results = asyncio.run(run(args.iterations, args.latency, args.only))
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "commit": _git_commit(),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "iterations": args.iterations,
+                "latency": args.latency,
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
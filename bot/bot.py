@@ -1,50 +1,171 @@
+import time
+
+# Taken before the imports below so that startup timing includes them.
+STARTED = time.monotonic()
+
 import asyncio
 import logging
 import os
+from typing import Awaitable, Callable
 
-from supabase import create_client, Client
 from twitchio.ext import commands
 
 from api.nba import NBAClient
+from api.transport import NBATransport
 from config import Config
+from managers.cache import CacheManager
 from managers.command import CommandManager
 from managers.database import DatabaseManager
+from managers.follow import FollowManager
+from managers.metrics import MetricsManager
+from managers.outbound import OutboundManager
+from managers.play_by_play import PlayByPlayManager
+from managers.precompute import CareerPrecomputer
 from managers.proxy import ProxyManager
 from managers.redis import RedisManager
+from managers.scoreboard import ScoreboardManager
+from managers.shard import ShardManager
+from managers.standings import StandingsManager
 from managers.websocket import WebSocketManager
+from utils.cache_policy import CachePolicy
+from utils.keyword_handler import KeywordHandler
+from utils.player_index import PlayerIndex
+from utils.startup import StartupTimer
 
-logging.basicConfig(level=logging.ERROR)
+logging.basicConfig(level=Config.LOG_LEVEL)
 
 logger = logging.getLogger(__name__)
 
+STARTUP_ATTEMPTS = 5
+STARTUP_BACKOFF = 1.0
+STARTUP_MAX_BACKOFF = 60.0
+
 class Bot(commands.Bot):
     def __init__(self) -> None:
+        self.startup = StartupTimer(STARTED)
+        self.startup.record("imports", self.startup.elapsed())
+        constructed = time.monotonic()
         super().__init__(
             client_id=Config.CLIENT_ID,
             client_secret=Config.CLIENT_SECRET,
             bot_id=Config.BOT_ID,
             prefix="!",
         )
-        self.supabase_client = create_client(
-            Config.SUPABASE_URL, Config.SUPABASE_KEY)
-        self.proxy_manager = ProxyManager(Config.PROXY_URL)
+        self.proxy_manager = ProxyManager.from_config(Config)
         self.redis_manager = RedisManager()
+        self.cache_manager = CacheManager(
+            self.redis_manager, Config.LOCAL_CACHE_MAX_BYTES,
+            Config.LOCAL_CACHE_TTL, Config.CACHE_STALE_TTL)
+        self.outbound_manager = OutboundManager(
+            self, Config.CHAT_CHANNEL_LIMIT, Config.CHAT_GLOBAL_LIMIT)
         self.websocket_manager = WebSocketManager(self)
+        self.shard_manager = (
+            ShardManager(self.redis_manager, Config.WORKER_ID)
+            if Config.SHARDING_ENABLED else None
+        )
+        self.keyword_handler = KeywordHandler()
+        self.nba_transport = NBATransport(
+            Config.NBA_API_MAX_WORKERS, proxy_manager=self.proxy_manager)
+        self.scoreboard_manager = ScoreboardManager(
+            self.proxy_manager, self.nba_transport, self.cache_manager,
+            CachePolicy(Config.SCOREBOARD_POLL_INTERVAL))
+        self.play_by_play_manager = PlayByPlayManager(
+            self.proxy_manager, self.nba_transport, self.scoreboard_manager)
+        self.follow_manager = FollowManager(self, self.scoreboard_manager)
         self.database_manager = DatabaseManager(
-            self.supabase_client, self.websocket_manager)
-        self.nba_client = NBAClient(self.proxy_manager, self.redis_manager)
+            None, self.websocket_manager, self.shard_manager,
+            self.keyword_handler, self.follow_manager, self.redis_manager)
+        self.standings_manager = StandingsManager(
+            self.proxy_manager, self.nba_transport, self.cache_manager,
+            self.scoreboard_manager)
+        self.player_index = PlayerIndex.from_static(Config.PLAYER_ALIASES_FILE)
+        self.nba_client = NBAClient(
+            self.proxy_manager, self.cache_manager,
+            self.scoreboard_manager, self.nba_transport, self.player_index,
+            self.standings_manager)
+        self.metrics_manager = MetricsManager(
+            self, Config.METRICS_HOST, Config.METRICS_PORT)
+        self.career_precomputer = CareerPrecomputer(
+            self.proxy_manager, self.nba_transport, self.cache_manager,
+            self.player_index, Config.CAREER_PRECOMPUTE_HOUR)
+        self._startup_task: asyncio.Task | None = None
+        self.startup.record("construct", time.monotonic() - constructed)
 
     async def setup_hook(self) -> None:
-        await self.add_component(CommandManager(self, self.nba_client))
-        await self.load_tokens()
-        await self.database_manager.init()
-        await self.database_manager.listen()
+        """
+        Bring chat up first: commands, the outbound queue and the EventSub
+        subscriptions of the channels remembered from the last run. The
+        scoreboard poller, Supabase and the career precompute schedule follow
+        in the background (see _finish_startup) while chat is already being served.
+        """
+        with self.startup.phase("core"):
+            await self.metrics_manager.start()
+            await self.cache_manager.listen()
+            await self.outbound_manager.start()
+            await self.add_component(CommandManager(self, self.nba_client))
+            await self.load_tokens()
+            if self.shard_manager is not None:
+                await self.shard_manager.start()
+        with self.startup.phase("eventsub"):
+            subscribed = await self.database_manager.subscribe_cached()
+        self._startup_task = asyncio.create_task(self._finish_startup(subscribed))
+
+    async def _finish_startup(self, subscribed: bool) -> None:
+        """
+        Start everything that chat does not wait for. Each step is retried
+        with backoff and a step that keeps failing is skipped, so one
+        transient error does not leave the rest undone; connecting to
+        Supabase is retried until it succeeds, since the steps after it
+        need the connection.
+        """
+        await self._startup_step("scoreboard", self.scoreboard_manager.start)
+        with self.startup.phase("supabase"):
+            await self._startup_step(
+                "supabase connect", self.database_manager.connect, attempts=None)
+            await self._startup_step("keywords", self.database_manager.load_keywords)
+            await self._startup_step("follows", self.database_manager.load_follows)
+            if subscribed:
+                await self._startup_step("channels", self.database_manager.reconcile)
+            else:
+                await self._startup_step("channels", self.database_manager.init)
+            await self._startup_step("realtime", self.database_manager.listen)
+            await self.database_manager.start_reconciliation(Config.RECONCILE_INTERVAL)
+        with self.startup.phase("warm"):
+            await self._startup_step("career precompute", self.career_precomputer.start)
+        logger.info("Startup finished in %.2fs", self.startup.elapsed())
+
+    async def _startup_step(self, name: str, step: Callable[[], Awaitable[None]],
+                            attempts: int | None = STARTUP_ATTEMPTS) -> bool:
+        """
+        Run a startup step, retrying it with exponential backoff (capped at
+        STARTUP_MAX_BACKOFF) up to `attempts` times, or forever if None.
+
+        Returns:
+            bool: Whether the step eventually succeeded.
+        """
+        attempt = 0
+        while True:
+            try:
+                await step()
+                return True
+            except Exception as e:
+                attempt += 1
+                if attempts is not None and attempt >= attempts:
+                    logger.error("Startup step %s failed, skipping it: %s", name, e)
+                    return False
+                delay = min(STARTUP_BACKOFF * 2 ** (attempt - 1), STARTUP_MAX_BACKOFF)
+                logger.warning("Startup step %s failed, retrying in %.1fs: %s", name, delay, e)
+                await asyncio.sleep(delay)
 
     async def load_tokens(self) -> None:
         await super().add_token(Config.TWITCH_ACCESS_TOKEN, Config.TWITCH_REFRESH_TOKEN)
 
+    async def event_subscription_revoked(self, payload) -> None:
+        self.websocket_manager.handle_revocation(payload.id)
+
     async def event_ready(self) -> None:
-        print(f"{Config.BOT_USERNAME} is ONLINE and READY to receive commands.")
+        print(f"{Config.BOT_USERNAME} is ONLINE and READY to receive commands "
+              f"({self.startup.elapsed():.2f}s after start).")
 
 
 def main() -> None:
@@ -53,7 +174,19 @@ def main() -> None:
         try:
             await bot.start()
         finally:
+            if bot._startup_task is not None:
+                bot._startup_task.cancel()
+            await bot.metrics_manager.close()
+            await bot.scoreboard_manager.close()
+            await bot.standings_manager.close()
+            await bot.play_by_play_manager.close()
+            await bot.outbound_manager.close()
+            await bot.career_precomputer.close()
+            await bot.cache_manager.close()
             await bot.database_manager.close()
+            if bot.shard_manager is not None:
+                await bot.shard_manager.close()
+            bot.nba_transport.close()
     asyncio.run(runner())
 
 
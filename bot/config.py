@@ -7,14 +7,31 @@ load_dotenv()
 class Config:
     BOT_ID = os.getenv("TWITCH_BOT_ID")
     BOT_USERNAME = os.getenv("TWITCH_BOT_USERNAME")
+    CACHE_STALE_TTL = float(os.getenv("CACHE_STALE_TTL", str(6 * 3600)))
+    CAREER_PRECOMPUTE_HOUR = int(os.getenv("CAREER_PRECOMPUTE_HOUR", "5"))
+    CHAT_CHANNEL_LIMIT = int(os.getenv("CHAT_CHANNEL_LIMIT", "100"))
+    CHAT_GLOBAL_LIMIT = int(os.getenv("CHAT_GLOBAL_LIMIT", "20"))
     CLIENT_ID = os.getenv("TWITCH_CLIENT_ID")
     CLIENT_SECRET = os.getenv("TWITCH_CLIENT_SECRET")
     DOCUMENTATION_URL = os.getenv("DOCUMENTATION_URL")
+    LOCAL_CACHE_MAX_BYTES = int(os.getenv("LOCAL_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    LOCAL_CACHE_TTL = float(os.getenv("LOCAL_CACHE_TTL", "300"))
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "ERROR").upper()
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+    NBA_API_MAX_WORKERS = int(os.getenv("NBA_API_MAX_WORKERS", "32"))
+    PLAYER_ALIASES_FILE = os.getenv("PLAYER_ALIASES_FILE")
     PROXY_URL = os.getenv("PROXY_URL")
+    RECONCILE_INTERVAL = float(os.getenv("RECONCILE_INTERVAL", "300"))
+    SCOREBOARD_POLL_INTERVAL = float(os.getenv("SCOREBOARD_POLL_INTERVAL", "10"))
+    SHARDING_ENABLED = os.getenv("SHARDING_ENABLED", "false").lower() == "true"
     SUPABASE_KEY= os.getenv("SUPABASE_KEY")
     SUPABASE_URL= os.getenv("SUPABASE_URL")
     TWITCH_ACCESS_TOKEN = os.getenv("TWITCH_ACCESS_TOKEN")
     TWITCH_REFRESH_TOKEN = os.getenv("TWITCH_REFRESH_TOKEN")    
-    WEBSHARE_USERNAME = os.getenv("WEBSHARE_USERNAME")
+    WEBSHARE_HOST = os.getenv("WEBSHARE_HOST", "p.webshare.io:80")
     WEBSHARE_PASSWORD = os.getenv("WEBSHARE_PASSWORD")
+    WEBSHARE_PROXY_COUNT = int(os.getenv("WEBSHARE_PROXY_COUNT", "1"))
+    WEBSHARE_USERNAME = os.getenv("WEBSHARE_USERNAME")
+    WORKER_ID = os.getenv("WORKER_ID")
     
\ No newline at end of file
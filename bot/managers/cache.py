@@ -0,0 +1,310 @@
+import asyncio
+import json
+import logging
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from managers.redis import RedisManager
+from utils.codec import pack, unpack
+from utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached value with a soft expiry. Past `fresh_until` the value may still
+    be served while a background refresh replaces it.
+    """
+    value: Any
+    fresh_until: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+Loader = Callable[[], Awaitable[tuple[Any, float]]]
+
+
+class LocalCache:
+    """
+    In-process LRU cache with per-entry TTLs and an approximate memory cap.
+    Expired entries are dropped lazily on access and evicted first when the
+    cache is over its memory budget.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes (int): Approximate upper bound on the memory held by entries.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _sizeof(key: str, value: Any) -> int:
+        """
+        Estimate the memory held by a decoded value: the sum of sys.getsizeof
+        over its nested dicts, lists and tuples and their items. Shared
+        objects such as small ints or interned strings are counted each
+        time, which errs on the side of evicting early.
+        """
+        size = sys.getsizeof(key)
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            size += sys.getsizeof(item)
+            if isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+        return size
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, size: int | None = None) -> None:
+        """
+        Store a value. `size` overrides the estimate of its footprint.
+        """
+        if ttl <= 0:
+            return
+        self.delete(key)
+        size = self._sizeof(key, value) if size is None else size
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class CacheManager:
+    """
+    Two-tier cache: a LocalCache in front of RedisManager.
+
+    Reads are served from process memory when possible and fall back to Redis,
+    copying the value into memory for no longer than its remaining Redis TTL
+    (and at most `local_ttl`). Writes and deletes go to both tiers and are
+    broadcast on a Redis pub/sub channel so that other bot processes drop
+    their local copies. Hit and miss counts are kept per tier.
+
+    get_or_refresh adds stale-while-revalidate on top: once an entry's soft
+    TTL passes, callers keep getting the stale value while a single
+    background refresh (coalesced across callers and processes) replaces it.
+    """
+
+    INVALIDATION_CHANNEL = "cache:invalidate"
+
+    def __init__(self, redis_manager: RedisManager, max_bytes: int = 32 * 1024 * 1024,
+                 local_ttl: float = 300.0, stale_ttl: float = 6 * 3600):
+        """
+        Initialize the CacheManager.
+
+        Args:
+            redis_manager (RedisManager): The shared Redis tier.
+            max_bytes (int): Memory budget for the in-process tier.
+            local_ttl (float): Upper bound in seconds on how long a value lives in memory.
+            stale_ttl (float): How long past its soft TTL an entry may still be served.
+        """
+        self.redis = redis_manager
+        self.local = LocalCache(max_bytes)
+        self.local_ttl = local_ttl
+        self.stale_ttl = stale_ttl
+        self.singleflight = SingleFlight(redis_manager)
+        self.origin = uuid.uuid4().hex
+        self.stats = {
+            "local": {"hits": 0, "misses": 0},
+            "redis": {"hits": 0, "misses": 0},
+        }
+        self.stale_served = 0
+        self._refreshing: set[str] = set()
+        self._listener: asyncio.Task | None = None
+
+    def hit_rate(self, tier: str) -> float:
+        """
+        Return the hit rate of the given tier ("local" or "redis") since startup.
+        """
+        counts = self.stats[tier]
+        total = counts["hits"] + counts["misses"]
+        return counts["hits"] / total if total else 0.0
+
+    async def delete(self, key: str) -> None:
+        """
+        Drop a key from both tiers.
+        """
+        self.local.delete(key)
+        await self.redis.delete(key)
+        await self._invalidate_remote(key)
+
+    async def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Read a structured value written by set_entry, from memory or Redis.
+        """
+        entry = self.local.get(key)
+        if entry is not None:
+            self.stats["local"]["hits"] += 1
+            return entry
+        self.stats["local"]["misses"] += 1
+
+        data, ttl = await self.redis.get_bytes_with_ttl(key)
+        if data is None:
+            self.stats["redis"]["misses"] += 1
+            return None
+        self.stats["redis"]["hits"] += 1
+        entry = CacheEntry(*unpack(data))
+        local_ttl = self.local_ttl if ttl is None else min(self.local_ttl, ttl)
+        self.local.set(key, entry, local_ttl)
+        return entry
+
+    async def set_entry(self, key: str, value: Any, ttl: float) -> CacheEntry:
+        """
+        Store a structured value (dicts, lists, scalars) that is fresh for
+        `ttl` seconds and may be served stale for another `stale_ttl` seconds.
+        In Redis it is kept as compressed msgpack; in memory, decoded.
+        """
+        entry = CacheEntry(value, time.time() + ttl)
+        data = pack(list(entry))
+        hard_ttl = int(ttl + self.stale_ttl)
+        await self.redis.set_bytes(key, data, expire_seconds=hard_ttl)
+        self.local.set(key, entry, min(self.local_ttl, hard_ttl))
+        await self._invalidate_remote(key)
+        return entry
+
+    async def set_entries(self, items: list[tuple[str, Any, float]]) -> None:
+        """
+        Store many structured values at once, as set_entry would, with a
+        single Redis round trip and a single invalidation message.
+
+        Args:
+            items (list[tuple[str, Any, float]]): (key, value, ttl) triples.
+        """
+        if not items:
+            return
+        writes = []
+        for key, value, ttl in items:
+            entry = CacheEntry(value, time.time() + ttl)
+            data = pack(list(entry))
+            hard_ttl = int(ttl + self.stale_ttl)
+            writes.append((key, data, hard_ttl))
+            self.local.set(key, entry, min(self.local_ttl, hard_ttl))
+        await self.redis.set_many_bytes(writes)
+        await self._invalidate_remote(*(key for key, _, _ in writes))
+
+    async def get_or_refresh(self, key: str, loader: Loader) -> Any:
+        """
+        Return the cached value for key, loading it on a miss and refreshing it
+        in the background once stale.
+
+        Args:
+            key (str): The cache key.
+            loader (Loader): Fetches the value upstream and returns (value, ttl).
+                A ttl of 0 returns the value without caching it. Exceptions
+                propagate to the caller on a miss and are logged when raised
+                by a background refresh.
+
+        Returns:
+            The fresh, stale or newly loaded value.
+        """
+        entry = await self.get_entry(key)
+        if entry is None:
+            return await self._load(key, loader)
+        if not entry.fresh:
+            self.stale_served += 1
+            self._refresh_in_background(key, loader)
+        return entry.value
+
+    async def _load(self, key: str, loader: Loader) -> Any:
+        async def fetch() -> Any:
+            value, ttl = await loader()
+            if ttl > 0:
+                await self.set_entry(key, value, ttl)
+            return value
+
+        async def lookup() -> Any | None:
+            entry = await self.get_entry(key)
+            return entry.value if entry is not None and entry.fresh else None
+
+        return await self.singleflight.do(key, fetch, lookup)
+
+    def _refresh_in_background(self, key: str, loader: Loader) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                await self._load(key, loader)
+            except Exception as e:
+                logger.error("Background refresh of %s failed: %s", key, e)
+            finally:
+                self._refreshing.discard(key)
+
+        asyncio.create_task(refresh())
+
+    async def _invalidate_remote(self, *keys: str) -> None:
+        message = json.dumps({"origin": self.origin, "keys": keys})
+        await self.redis.publish(self.INVALIDATION_CHANNEL, message)
+
+    async def listen(self) -> None:
+        """
+        Start a background task that applies invalidations from other processes.
+        """
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self.redis.subscribe(self.INVALIDATION_CHANNEL):
+                    data = json.loads(message)
+                    if data.get("origin") != self.origin:
+                        for key in data.get("keys") or [data["key"]]:
+                            self.local.delete(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Anything published while disconnected is lost, so start clean.
+                logger.error("Cache invalidation listener failed: %s", e)
+                self.local.clear()
+                await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        """
+        Stop the invalidation listener.
+        """
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
@@ -3,58 +3,81 @@ from twitchio.ext import commands
 
 from api.nba import NBAClient
 from config import Config
-from utils.keyword_handler import KeywordHandler
+from utils.career import split_season
+from utils.metrics import CHAT_MESSAGES, COMMAND_LATENCY
 
 
 class CommandManager(commands.Component):
     def __init__(self, bot: commands.Bot, nba_client: NBAClient):
         self.bot = bot
         self.nba_client = nba_client
-        self.keyword_handler = KeywordHandler()
 
     @commands.Component.listener()
     async def event_message(self, payload: twitchio.ChatMessage):
+        CHAT_MESSAGES.inc()
         if payload.chatter.name.lower() == Config.BOT_USERNAME.lower():
             return None
 
-        response = self.keyword_handler.get_response(
-            payload.text, payload.broadcaster.name)
+        response = self.bot.keyword_handler.get_response(
+            payload.text, payload.broadcaster.id)
         if response:
-            await payload.broadcaster.send_message(
-                sender=self.bot.bot_id,
-                message=response
-            )
+            self.bot.outbound_manager.send(payload.broadcaster, response)
 
     @commands.command(name="career")
     @commands.cooldown(rate=1, per=5, key=commands.BucketType.channel)
     async def career(self, ctx: commands.Context, *, player: str) -> None:
-        response = await self.nba_client.get_player_career(player)
-        await ctx.send(f"@{ctx.author.name} {response}")
+        with COMMAND_LATENCY.time("career"):
+            response = await self.nba_client.get_player_career(*split_season(player))
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
 
     @commands.command(name="commands")
     async def documentation(self, ctx: commands.Context) -> None:
-        await ctx.send(f"@{ctx.author.name}, {Config.DOCUMENTATION_URL}")
+        self.bot.outbound_manager.send(
+            ctx.broadcaster, f"@{ctx.author.name}, {Config.DOCUMENTATION_URL}")
+
+    @commands.command(name="follow")
+    @commands.is_moderator()
+    async def follow(self, ctx: commands.Context, *, team: str | None = None) -> None:
+        response = await self.bot.follow_manager.follow_team(ctx.broadcaster.id, team)
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
+
+    @commands.command(name="unfollow")
+    @commands.is_moderator()
+    async def unfollow(self, ctx: commands.Context, *, team: str) -> None:
+        response = await self.bot.follow_manager.unfollow_team(ctx.broadcaster.id, team)
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
 
     @commands.command(name="score")
     @commands.cooldown(rate=1, per=5, key=commands.BucketType.channel)
     async def score(self, ctx: commands.Context, *, team: str) -> None:
-        response = await self.nba_client.get_game_score(team)
-        await ctx.send(f"@{ctx.author.name} {response}")
+        with COMMAND_LATENCY.time("score"):
+            response = await self.nba_client.get_game_score(team)
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
 
     @commands.command(name="stats")
     @commands.cooldown(rate=1, per=5, key=commands.BucketType.channel)
     async def statline(self, ctx: commands.Context, *, player: str) -> None:
-        response = await self.nba_client.get_player_statline(player)
-        await ctx.send(f"@{ctx.author.name} {response}")
+        with COMMAND_LATENCY.time("stats"):
+            response = await self.nba_client.get_player_statline(player)
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
+
+    @commands.command(name="last")
+    @commands.cooldown(rate=1, per=5, key=commands.BucketType.channel)
+    async def last(self, ctx: commands.Context, *, target: str) -> None:
+        with COMMAND_LATENCY.time("last"):
+            response = await self.bot.play_by_play_manager.get_last(target)
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
 
     @commands.command(name="record")
     @commands.cooldown(rate=1, per=5, key=commands.BucketType.channel)
     async def record(self, ctx: commands.Context, *, team: str) -> None:
-        response = await self.nba_client.get_team_record(team)
-        await ctx.send(f"@{ctx.author.name} {response}")
+        with COMMAND_LATENCY.time("record"):
+            response = await self.nba_client.get_team_record(team)
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
 
     @commands.command(name="schedule")
     @commands.cooldown(rate=1, per=5, key=commands.BucketType.channel)
     async def schedule(self, ctx: commands.Context) -> None:
-        response = await self.nba_client.get_schedule()
-        await ctx.send(f"@{ctx.author.name} {response}")
+        with COMMAND_LATENCY.time("schedule"):
+            response = await self.nba_client.get_schedule()
+        self.bot.outbound_manager.send(ctx.broadcaster, f"@{ctx.author.name} {response}")
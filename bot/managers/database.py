@@ -1,11 +1,21 @@
 import logging
 import asyncio
+import json
+import random
+import time
+from typing import TYPE_CHECKING, AsyncIterator
 
 from config import Config
-from realtime import AsyncRealtimeClient
-from supabase import Client
 
+from managers.follow import FollowManager
+from managers.redis import RedisManager
+from managers.shard import ShardManager, owner_of
 from managers.websocket import WebSocketManager
+from utils.keyword_handler import KeywordHandler
+
+if TYPE_CHECKING:
+    from realtime import AsyncRealtimeClient
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -16,49 +26,427 @@ class DatabaseManager:
     with the WebSocketManager. It performs an initial subscribe to all
     active channels and then listens for real-time INSERT/UPDATE events
     to subscribe or unsubscribe dynamically.
+
+    In sharded mode only channels owned by this worker (per the ShardManager)
+    are subscribed; change events for other channels are left to their
+    owner, and ownership is re-diffed whenever a worker joins or dies.
+
+    The supabase and realtime packages are only imported by connect() and
+    listen(). With a RedisManager, the active channel list is remembered in
+    Redis, so a restart can subscribe from it (subscribe_cached) before
+    Supabase is even connected, and then reconcile against the table.
     """
     WS_URL = Config.SUPABASE_URL.replace("https", "wss") + "/realtime/v1"
+    PAGE_SIZE = 1000
+    SUBSCRIBE_CONCURRENCY = 20
+    MAX_RETRIES = 5
+    BASE_BACKOFF = 0.5
+    PROGRESS_INTERVAL = 2.0
+    RECONCILE_BATCH_SIZE = 100
+    CHANNELS_KEY = "channels:active"
 
-    def __init__(self, supabase_client: Client, websocket_manager: WebSocketManager):
+    def __init__(self, supabase_client: "Client | None", websocket_manager: WebSocketManager,
+                 shard_manager: ShardManager | None = None,
+                 keyword_handler: KeywordHandler | None = None,
+                 follow_manager: FollowManager | None = None,
+                 redis_manager: RedisManager | None = None):
         """
         Initialize your DatabaseManager.
 
         Args:
-            supabase_client (Client): A Supabase client for querying the `channels` table.
+            supabase_client (Client | None): A Supabase client for querying the
+                                             `channels` table; None creates one in connect().
             websocket_manager (WebSocketManager): Handles actual subscribe/unsubscribe calls
                                                    to Twitch over WebSockets.
+            shard_manager (ShardManager | None): Decides which channels this worker
+                                                 owns; None serves every channel.
+            keyword_handler (KeywordHandler | None): Receives the per-channel
+                                                     rows of the `keywords` table.
+            follow_manager (FollowManager | None): Receives the rows of the
+                                                   `follows` table.
+            redis_manager (RedisManager | None): Remembers the active channel list
+                                                 for the next startup.
         """
-        self.async_realtime_client = AsyncRealtimeClient(
-            self.WS_URL, Config.SUPABASE_KEY, auto_reconnect=True
-        )
+        self.async_realtime_client: "AsyncRealtimeClient | None" = None
         self.supabase_client = supabase_client
         self.websocket_manager = websocket_manager
+        self.shard_manager = shard_manager
+        self.keyword_handler = keyword_handler
+        self.follow_manager = follow_manager
+        self.redis_manager = redis_manager
+        self._reconciler: asyncio.Task | None = None
+        if shard_manager is not None:
+            shard_manager.on_rebalance(self.rebalance)
+
+    def _owns(self, broadcaster_user_id: str) -> bool:
+        return self.shard_manager is None or self.shard_manager.owns(broadcaster_user_id)
+
+    async def connect(self) -> None:
+        """
+        Create the Supabase client if none was given. The supabase package
+        (and realtime with it) is imported on a worker thread, so the event
+        loop keeps serving chat meanwhile.
+        """
+        if self.supabase_client is None:
+            self.supabase_client = await asyncio.to_thread(self._create_client)
+
+    @staticmethod
+    def _create_client() -> "Client":
+        from supabase import create_client
+
+        return create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+
+    async def _remember_channels(self, broadcaster_user_ids: set[str]) -> None:
+        """
+        Store the active channels (of every shard) for the next startup.
+        """
+        if self.redis_manager is None:
+            return
+        try:
+            await self.redis_manager.set(
+                self.CHANNELS_KEY, json.dumps(sorted(broadcaster_user_ids)))
+        except Exception as e:
+            logger.warning("Could not remember the active channels: %s", e)
+
+    async def subscribe_cached(self) -> bool:
+        """
+        Subscribe to the (owned) channels remembered by the last init() or
+        reconcile(), without querying Supabase.
+
+        Returns:
+            bool: False if no channel list was remembered; call init() instead.
+        """
+        if self.redis_manager is None:
+            return False
+        try:
+            cached = await self.redis_manager.get(self.CHANNELS_KEY)
+        except Exception as e:
+            logger.warning("Could not read the remembered channels: %s", e)
+            return False
+        if cached is None:
+            return False
+
+        started = time.monotonic()
+        owned = [channel for channel in json.loads(cached) if self._owns(channel)]
+        semaphore = asyncio.Semaphore(self.SUBSCRIBE_CONCURRENCY)
+        progress = {"total": len(owned), "done": 0, "failed": 0}
+        await asyncio.gather(*(
+            self._subscribe_with_retry(broadcaster_user_id, semaphore, progress)
+            for broadcaster_user_id in owned
+        ))
+        logger.info(
+            "Subscribed to %d/%d remembered channels (%d failed) in %.2fs",
+            progress["done"], progress["total"], progress["failed"],
+            time.monotonic() - started,
+        )
+        return True
 
     async def init(self) -> None:
         """
         Perform the initial subscription to all currently active channels.
 
-        Queries Supabase for rows in `channels` where `is_active` is True,
-        then calls WebSocketManager.subscribe on each valid broadcaster_user_id.
-        Logs and skips any rows missing the broadcaster_user_id.
+        Pages through rows in `channels` where `is_active` is True and
+        subscribes each valid broadcaster_user_id as soon as its page arrives,
+        with at most SUBSCRIBE_CONCURRENCY subscriptions in flight. Rate-limited
+        subscriptions are retried with exponential backoff. Progress is logged
+        periodically, followed by the total time until every channel was
+        subscribed. Logs and skips any rows missing the broadcaster_user_id,
+        and skips channels owned by another shard.
         """
-        response = (
-            self.supabase_client
-            .table("channels")
-            .select("broadcaster_user_id")
-            .eq("is_active", True)
-            .execute()
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.SUBSCRIBE_CONCURRENCY)
+        progress = {"total": 0, "done": 0, "failed": 0, "skipped": 0}
+        reporter = asyncio.create_task(self._report_progress(progress, started))
+
+        tasks = []
+        active: set[str] = set()
+        try:
+            async for rows, total in self._active_channel_pages():
+                progress["total"] = total or progress["total"] + len(rows)
+                for row in rows:
+                    broadcaster_user_id = row.get("broadcaster_user_id")
+                    if not broadcaster_user_id:
+                        logger.warning("Row missing 'broadcaster_user_id': %r", row)
+                        progress["failed"] += 1
+                        continue
+                    active.add(broadcaster_user_id)
+                    if not self._owns(broadcaster_user_id):
+                        progress["skipped"] += 1
+                        continue
+                    tasks.append(asyncio.create_task(
+                        self._subscribe_with_retry(broadcaster_user_id, semaphore, progress)))
+            await asyncio.gather(*tasks)
+        finally:
+            reporter.cancel()
+        await self._remember_channels(active)
+
+        logger.info(
+            "Subscribed to %d/%d channels (%d failed, %d owned by other shards) in %.2fs",
+            progress["done"], progress["total"], progress["failed"], progress["skipped"],
+            time.monotonic() - started,
         )
-        rows = response.data
-        for row in rows:
-            broadcaster_user_id = row.get("broadcaster_user_id")
-            if not broadcaster_user_id:
-                logger.warning("Row missing 'broadcaster_user_id': %r", row)
-                continue
+
+    async def _active_channel_pages(self) -> AsyncIterator[tuple[list[dict], int | None]]:
+        """
+        Yield pages of active channel rows together with the total row count.
+
+        The Supabase client is synchronous, so each page query runs in a
+        worker thread to keep the event loop free for the subscriptions
+        already in flight.
+        """
+        start = 0
+        while True:
+            response = await asyncio.to_thread(
+                lambda start=start: (
+                    self.supabase_client
+                    .table("channels")
+                    .select("broadcaster_user_id", count="exact")
+                    .eq("is_active", True)
+                    .order("broadcaster_user_id")
+                    .range(start, start + self.PAGE_SIZE - 1)
+                    .execute()
+                )
+            )
+            rows = response.data or []
+            yield rows, response.count
+            if len(rows) < self.PAGE_SIZE:
+                return
+            start += self.PAGE_SIZE
+
+    async def load_keywords(self) -> None:
+        """
+        Load every channel's custom keyword responses from the `keywords`
+        table into the KeywordHandler.
+        """
+        if self.keyword_handler is None:
+            return
+        rows = []
+        start = 0
+        while True:
+            response = await asyncio.to_thread(
+                lambda start=start: (
+                    self.supabase_client
+                    .table("keywords")
+                    .select("broadcaster_user_id, keyword, response")
+                    .order("broadcaster_user_id")
+                    .order("keyword")
+                    .order("response")
+                    .range(start, start + self.PAGE_SIZE - 1)
+                    .execute()
+                )
+            )
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                break
+            start += self.PAGE_SIZE
+        self.keyword_handler.load(rows)
+        logger.info("Loaded %d custom keywords", len(rows))
+
+    async def load_follows(self) -> None:
+        """
+        Load the teams every channel follows from the `follows` table into
+        the FollowManager.
+        """
+        if self.follow_manager is None:
+            return
+        rows = []
+        start = 0
+        while True:
+            response = await asyncio.to_thread(
+                lambda start=start: (
+                    self.supabase_client
+                    .table("follows")
+                    .select("broadcaster_user_id, team_id")
+                    .order("broadcaster_user_id")
+                    .order("team_id")
+                    .range(start, start + self.PAGE_SIZE - 1)
+                    .execute()
+                )
+            )
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                break
+            start += self.PAGE_SIZE
+        self.follow_manager.load(rows)
+        logger.info("Loaded %d follows", len(rows))
+
+    async def add_follow(self, broadcaster_user_id: str, team_id: int) -> None:
+        """
+        Store that a channel follows a team.
+        """
+        row = {"broadcaster_user_id": broadcaster_user_id, "team_id": team_id}
+        await asyncio.to_thread(
+            lambda: self.supabase_client.table("follows").upsert(row).execute())
+
+    async def remove_follow(self, broadcaster_user_id: str, team_id: int) -> None:
+        """
+        Delete a channel's follow of a team.
+        """
+        await asyncio.to_thread(
+            lambda: (
+                self.supabase_client
+                .table("follows")
+                .delete()
+                .eq("broadcaster_user_id", broadcaster_user_id)
+                .eq("team_id", team_id)
+                .execute()
+            )
+        )
+
+    async def _reload_follows(self) -> None:
+        try:
+            await self.load_follows()
+        except Exception as e:
+            logger.error("Failed to reload follows: %s", e)
+
+    async def _reload_keywords(self) -> None:
+        try:
+            await self.load_keywords()
+        except Exception as e:
+            logger.error("Failed to reload keywords: %s", e)
+
+    async def _subscribe_with_retry(self, broadcaster_user_id: str,
+                                    semaphore: asyncio.Semaphore, progress: dict) -> None:
+        """
+        Subscribe to one channel, backing off and retrying when Twitch rate-limits us.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with semaphore:
+                try:
+                    await self.websocket_manager.subscribe(broadcaster_user_id)
+                    progress["done"] += 1
+                    return
+                except Exception as e:
+                    rate_limited = getattr(e, "status", None) == 429
+                    if not rate_limited or attempt == self.MAX_RETRIES:
+                        logger.error("Error subscribing to %s: %s", broadcaster_user_id, e)
+                        progress["failed"] += 1
+                        return
+            delay = self.BASE_BACKOFF * 2 ** attempt
+            await asyncio.sleep(delay + random.uniform(0, delay))
+
+    async def rebalance(self, previous: tuple[str, ...], current: tuple[str, ...]) -> None:
+        """
+        Subscribe to channels this worker gained and unsubscribe from those it
+        lost after a shard membership change.
+
+        Args:
+            previous (tuple[str, ...]): Worker ids before the change.
+            current (tuple[str, ...]): Worker ids after the change.
+        """
+        if self.supabase_client is None:
+            # Not connected yet: the init() or reconcile() that follows
+            # connect() subscribes by the membership current at that time.
+            logger.info("Deferring rebalance until Supabase is connected")
+            return
+        worker_id = self.shard_manager.worker_id
+        semaphore = asyncio.Semaphore(self.SUBSCRIBE_CONCURRENCY)
+        progress = {"total": 0, "done": 0, "failed": 0}
+        gained: list[asyncio.Task] = []
+        lost: list[str] = []
+
+        async for rows, _ in self._active_channel_pages():
+            for row in rows:
+                broadcaster_user_id = row.get("broadcaster_user_id")
+                if not broadcaster_user_id:
+                    continue
+                was_owner = owner_of(broadcaster_user_id, previous) == worker_id
+                is_owner = owner_of(broadcaster_user_id, current) == worker_id
+                if is_owner and not was_owner:
+                    progress["total"] += 1
+                    gained.append(asyncio.create_task(
+                        self._subscribe_with_retry(broadcaster_user_id, semaphore, progress)))
+                elif was_owner and not is_owner:
+                    lost.append(broadcaster_user_id)
+
+        for broadcaster_user_id in lost:
             try:
-                await self.websocket_manager.subscribe(broadcaster_user_id)
+                await self.websocket_manager.unsubscribe(broadcaster_user_id)
             except Exception as e:
-                logger.error("Error subscribing to %s: %s", broadcaster_user_id, e)
+                logger.error("Error unsubscribing from %s: %s", broadcaster_user_id, e)
+        await asyncio.gather(*gained)
+        logger.info(
+            "Rebalanced: gained %d channels (%d failed), released %d",
+            progress["done"], progress["failed"], len(lost),
+        )
+
+    async def reconcile(self) -> None:
+        """
+        Diff the active (and owned) channels in Supabase against the local
+        subscription registry and fix any drift, e.g. missed realtime events
+        or revoked subscriptions.
+
+        The registry is first resynced with the bot's live subscriptions;
+        missing channels are then subscribed and stale ones unsubscribed in
+        batches of RECONCILE_BATCH_SIZE.
+        """
+        active: set[str] = set()
+        async for rows, _ in self._active_channel_pages():
+            for row in rows:
+                broadcaster_user_id = row.get("broadcaster_user_id")
+                if broadcaster_user_id:
+                    active.add(broadcaster_user_id)
+        await self._remember_channels(active)
+        desired = {channel for channel in active if self._owns(channel)}
+
+        self.websocket_manager.resync()
+        subscribed = self.websocket_manager.subscribed()
+        to_add = sorted(desired - subscribed)
+        to_remove = sorted(subscribed - desired)
+        if not to_add and not to_remove:
+            return
+
+        semaphore = asyncio.Semaphore(self.SUBSCRIBE_CONCURRENCY)
+        progress = {"total": len(to_add), "done": 0, "failed": 0}
+        size = self.RECONCILE_BATCH_SIZE
+        for i in range(0, len(to_add), size):
+            await asyncio.gather(*(
+                self._subscribe_with_retry(broadcaster_user_id, semaphore, progress)
+                for broadcaster_user_id in to_add[i:i + size]
+            ))
+        for i in range(0, len(to_remove), size):
+            results = await asyncio.gather(
+                *(
+                    self.websocket_manager.unsubscribe(broadcaster_user_id)
+                    for broadcaster_user_id in to_remove[i:i + size]
+                ),
+                return_exceptions=True,
+            )
+            for broadcaster_user_id, result in zip(to_remove[i:i + size], results):
+                if isinstance(result, Exception):
+                    logger.error("Error unsubscribing from %s: %s", broadcaster_user_id, result)
+        logger.info(
+            "Reconciled channels: subscribed %d (%d failed), unsubscribed %d",
+            progress["done"], progress["failed"], len(to_remove),
+        )
+
+    async def start_reconciliation(self, interval: float) -> None:
+        """
+        Run reconcile() every `interval` seconds in the background.
+        """
+        if self._reconciler is None or self._reconciler.done():
+            self._reconciler = asyncio.create_task(self._reconcile_forever(interval))
+
+    async def _reconcile_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Channel reconciliation failed: %s", e)
+
+    async def _report_progress(self, progress: dict, started: float) -> None:
+        while True:
+            await asyncio.sleep(self.PROGRESS_INTERVAL)
+            logger.info(
+                "Subscribing to channels: %d/%d done, %d failed, %.1fs elapsed",
+                progress["done"], progress["total"], progress["failed"],
+                time.monotonic() - started,
+            )
 
     async def listen(self) -> None:
         """
@@ -66,7 +454,14 @@ class DatabaseManager:
         events on the `channels` table.
 
         For each relevant change, schedules self.on_change to handle the payload.
+        Changes to the `keywords` table reload the KeywordHandler, and
+        changes to the `follows` table reload the FollowManager.
         """
+        from realtime import AsyncRealtimeClient
+
+        self.async_realtime_client = AsyncRealtimeClient(
+            self.WS_URL, Config.SUPABASE_KEY, auto_reconnect=True
+        )
         await self.async_realtime_client.connect()
         channel = self.async_realtime_client.channel("realtime:public:channels")
 
@@ -88,11 +483,37 @@ class DatabaseManager:
 
         await channel.subscribe()
 
+        if self.keyword_handler is not None:
+            # The keywords table is small, so any change simply reloads it.
+            keywords = self.async_realtime_client.channel("realtime:public:keywords")
+            keywords.on_postgres_changes(
+                event="*",
+                schema="public",
+                table="keywords",
+                callback=lambda payload: asyncio.create_task(self._reload_keywords()),
+            )
+            await keywords.subscribe()
+
+        if self.follow_manager is not None:
+            # Also picks up follows made through another worker.
+            follows = self.async_realtime_client.channel("realtime:public:follows")
+            follows.on_postgres_changes(
+                event="*",
+                schema="public",
+                table="follows",
+                callback=lambda payload: asyncio.create_task(self._reload_follows()),
+            )
+            await follows.subscribe()
+
     async def close(self) -> None:
         """
-        Close the Supabase Realtime connection cleanly.
+        Stop reconciliation and close the Supabase Realtime connection cleanly.
         """
-        await self.async_realtime_client.close()
+        if self._reconciler is not None:
+            self._reconciler.cancel()
+            self._reconciler = None
+        if self.async_realtime_client is not None:
+            await self.async_realtime_client.close()
 
     async def on_change(self, payload: dict) -> None:
         """
@@ -102,6 +523,7 @@ class DatabaseManager:
             payload (dict): The change payload, containing 'data' -> 'record'.
 
         Behavior:
+            - If the channel belongs to another shard, do nothing.
             - If record['is_active'] is True, subscribe to that channel.
             - Otherwise, unsubscribe from that channel.
         """
@@ -110,6 +532,8 @@ class DatabaseManager:
         if not broadcaster_user_id:
             logger.warning("Change payload missing 'broadcaster_user_id': %r", row)
             return
+        if not self._owns(broadcaster_user_id):
+            return
 
         if row["is_active"]:
             await self.websocket_manager.subscribe(broadcaster_user_id)
@@ -0,0 +1,174 @@
+import logging
+
+from managers.scoreboard import ScoreboardManager, ScoreboardSnapshot
+from utils.game_events import GameDiffer
+from utils.metrics import FOLLOW_EVENTS
+from utils.team_index import TEAM_INDEX
+
+logger = logging.getLogger(__name__)
+
+
+class FollowManager:
+    """
+    Pushes game events (tip-offs, lead changes, period ends, finals and big
+    statlines) to the channels that follow a team with !follow.
+
+    Every refresh of the ScoreboardManager is diffed exactly once by a
+    GameDiffer, and the formatted events are then handed to the
+    OutboundManager for each following channel, so the diffing cost stays
+    O(games) however many channels follow along. Follows are stored in the
+    Supabase `follows` table and loaded through the DatabaseManager; events
+    are only pushed to channels this worker is subscribed to.
+    """
+
+    def __init__(self, bot, scoreboard_manager: ScoreboardManager, max_follows: int = 5):
+        """
+        Initialize the FollowManager.
+
+        Args:
+            bot: The TwitchIO Bot; its outbound and websocket managers are used.
+            scoreboard_manager (ScoreboardManager): Publishes the snapshots to diff.
+            max_follows (int): Maximum number of teams one channel may follow.
+        """
+        self.bot = bot
+        self.max_follows = max_follows
+        self.differ = GameDiffer()
+        self._followers: dict[int, set[str]] = {}
+        self._teams: dict[str, set[int]] = {}
+        scoreboard_manager.add_snapshot_listener(self._on_snapshot)
+
+    def load(self, rows: list[dict]) -> None:
+        """
+        Replace all follows with rows of the `follows` table.
+
+        Args:
+            rows (list[dict]): Rows with broadcaster_user_id and team_id.
+        """
+        followers: dict[int, set[str]] = {}
+        teams: dict[str, set[int]] = {}
+        for row in rows:
+            channel_id, team_id = row.get("broadcaster_user_id"), row.get("team_id")
+            if not channel_id or not team_id:
+                continue
+            followers.setdefault(int(team_id), set()).add(channel_id)
+            teams.setdefault(channel_id, set()).add(int(team_id))
+        self._followers, self._teams = followers, teams
+
+    def following(self, channel_id: str) -> set[int]:
+        """
+        Return the ids of the teams the channel follows.
+        """
+        return set(self._teams.get(channel_id, ()))
+
+    def follow(self, channel_id: str, team_id: int) -> None:
+        """
+        Start pushing the team's events to the channel.
+        """
+        self._followers.setdefault(team_id, set()).add(channel_id)
+        self._teams.setdefault(channel_id, set()).add(team_id)
+
+    def unfollow(self, channel_id: str, team_id: int) -> None:
+        """
+        Stop pushing the team's events to the channel.
+        """
+        followers = self._followers.get(team_id)
+        if followers is not None:
+            followers.discard(channel_id)
+            if not followers:
+                del self._followers[team_id]
+        teams = self._teams.get(channel_id)
+        if teams is not None:
+            teams.discard(team_id)
+            if not teams:
+                del self._teams[channel_id]
+
+    @staticmethod
+    def _resolve_team(name: str) -> tuple[dict | None, str | None]:
+        """
+        Look up a team by any alias, or return a "not found" / "ambiguous" reply.
+        """
+        teams = TEAM_INDEX.lookup(name)
+        if len(teams) == 1:
+            return teams[0], None
+        if teams:
+            names = ", ".join(team["full_name"] for team in teams)
+            return None, f"{name} is ambiguous: {names}."
+        return None, f"Team not found: {name}"
+
+    async def follow_team(self, channel_id: str, name: str | None) -> str:
+        """
+        Handle !follow: list the channel's teams, or store a new follow.
+
+        Returns:
+            str: The reply for the chat.
+        """
+        if not name:
+            names = []
+            for team_id in self.following(channel_id):
+                team = TEAM_INDEX.by_id.get(team_id)
+                if team is None:
+                    logger.warning("Skipping unknown followed team %s for %s", team_id, channel_id)
+                    continue
+                names.append(team["full_name"])
+            if not names:
+                return ("This channel does not follow any team. "
+                        "Use !follow <team> for live game updates.")
+            return f"This channel follows: {', '.join(sorted(names))}."
+
+        team, error = self._resolve_team(name)
+        if not team:
+            return error
+        teams = self._teams.get(channel_id, set())
+        if team["id"] in teams:
+            return f"This channel already follows the {team['full_name']}."
+        if len(teams) >= self.max_follows:
+            return (f"This channel already follows {self.max_follows} teams. "
+                    "Use !unfollow <team> first.")
+
+        try:
+            await self.bot.database_manager.add_follow(channel_id, team["id"])
+        except Exception as e:
+            logger.error("Failed to store follow of %s for %s: %s", team["id"], channel_id, e)
+            return "Could not save the follow. Please try again shortly."
+        self.follow(channel_id, team["id"])
+        return (
+            f"Following the {team['full_name']}: tip-offs, lead changes, period ends, "
+            "finals and big statlines will be posted here."
+        )
+
+    async def unfollow_team(self, channel_id: str, name: str) -> str:
+        """
+        Handle !unfollow: delete a stored follow.
+
+        Returns:
+            str: The reply for the chat.
+        """
+        team, error = self._resolve_team(name)
+        if not team:
+            return error
+        if team["id"] not in self._teams.get(channel_id, ()):
+            return f"This channel does not follow the {team['full_name']}."
+
+        try:
+            await self.bot.database_manager.remove_follow(channel_id, team["id"])
+        except Exception as e:
+            logger.error("Failed to delete follow of %s for %s: %s", team["id"], channel_id, e)
+            return "Could not remove the follow. Please try again shortly."
+        self.unfollow(channel_id, team["id"])
+        return f"Unfollowed the {team['full_name']}."
+
+    async def _on_snapshot(self, previous: ScoreboardSnapshot | None,
+                           current: ScoreboardSnapshot) -> None:
+        events = self.differ.diff(previous, current)
+        if not events or not self._followers:
+            return
+
+        subscribed = self.bot.websocket_manager.subscribed()
+        for event in events:
+            FOLLOW_EVENTS.inc(event.kind)
+            channels = set()
+            for team_id in event.team_ids:
+                channels |= self._followers.get(team_id, set())
+            for channel_id in channels & subscribed:
+                self.bot.outbound_manager.send(
+                    self.bot.create_partialuser(user_id=channel_id), event.text)
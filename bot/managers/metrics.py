@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import time
+
+from managers.proxy import proxy_label
+from utils.metrics import LOOP_LAG, REGISTRY, CallbackMetric, Registry
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsManager:
+    """
+    Exposes the bot's metrics on a local HTTP endpoint in the Prometheus
+    text format and measures event-loop lag.
+
+    Hot paths only bump counters and histogram buckets (see utils.metrics);
+    everything else (cache hit rates, outbound queue depth, proxy health,
+    ...) is read from the managers' existing stats when /metrics is
+    scraped, so nothing is computed while nobody is scraping.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, bot, host: str, port: int, lag_interval: float = 1.0,
+                 registry: Registry = REGISTRY):
+        """
+        Initialize the MetricsManager.
+
+        Args:
+            bot: The Bot whose managers are reported.
+            host (str): Interface to listen on; keep it local.
+            port (int): Port to listen on; 0 disables the endpoint.
+            lag_interval (float): Seconds between event-loop lag probes.
+            registry (Registry): The metrics to render.
+        """
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self.lag_interval = lag_interval
+        self.registry = registry
+        self._server: asyncio.AbstractServer | None = None
+        self._lag_task: asyncio.Task | None = None
+        self._register_callbacks()
+
+    def _register_callbacks(self) -> None:
+        bot = self.bot
+        cache = bot.cache_manager
+        outbound = bot.outbound_manager
+        self.registry.register(CallbackMetric(
+            "nba_bot_cache_requests_total", "Cache lookups per tier and result.",
+            "counter", ("tier", "result"),
+            lambda: {
+                (tier, result): count
+                for tier, counts in cache.stats.items()
+                for result, count in counts.items()
+            },
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_cache_hit_ratio", "Cache hit ratio per tier since startup.",
+            "gauge", ("tier",),
+            lambda: {(tier,): cache.hit_rate(tier) for tier in cache.stats},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_cache_stale_served_total", "Stale cache entries served during a refresh.",
+            "counter", (), lambda: {(): cache.stale_served},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_singleflight_total", "Cache misses by how they were coalesced.",
+            "counter", ("role",),
+            lambda: {(role,): count for role, count in cache.singleflight.stats.items()},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_outbound_queue_depth", "Chat messages waiting to be sent.",
+            "gauge", (), lambda: {(): outbound.depth},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_outbound_messages_total", "Outbound chat messages by outcome.",
+            "counter", ("outcome",),
+            lambda: {
+                (outcome,): outbound.stats[outcome]
+                for outcome in ("sent", "merged", "dropped_overflow", "dropped_expired", "failed")
+            },
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_proxy_latency_seconds", "EWMA latency per proxy.",
+            "gauge", ("proxy",),
+            lambda: {(proxy_label(proxy.url),): proxy.latency
+                     for proxy in bot.proxy_manager.stats},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_proxy_error_rate", "EWMA error rate per proxy.",
+            "gauge", ("proxy",),
+            lambda: {(proxy_label(proxy.url),): proxy.error_rate
+                     for proxy in bot.proxy_manager.stats},
+        ))
+        startup = bot.startup
+        self.registry.register(CallbackMetric(
+            "nba_bot_startup_phase_seconds", "Duration of each startup phase.",
+            "gauge", ("phase",),
+            lambda: {(phase,): seconds for phase, seconds in startup.phases.items()},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_time_to_first_reply_seconds",
+            "Seconds from process start to the first chat message sent.",
+            "gauge", (),
+            lambda: {} if outbound.first_sent_at is None else
+            {(): outbound.first_sent_at - startup.started},
+        ))
+        self.registry.register(CallbackMetric(
+            "nba_bot_subscribed_channels", "Channels with a chat subscription.",
+            "gauge", (), lambda: {(): len(bot.websocket_manager.subscribed())},
+        ))
+
+    async def start(self) -> None:
+        """
+        Start the lag probe and the HTTP endpoint. A port that cannot be
+        bound (e.g. a second worker on the same host) is logged, not fatal.
+        """
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = asyncio.create_task(self._probe_lag())
+        if not self.port or self._server is not None:
+            return
+        try:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        except OSError as e:
+            logger.error("Could not serve metrics on %s:%s: %s", self.host, self.port, e)
+
+    async def close(self) -> None:
+        """
+        Stop the lag probe and the HTTP endpoint.
+        """
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _probe_lag(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.lag_interval)
+            LOOP_LAG.observe(max(0.0, time.monotonic() - started - self.lag_interval))
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), 5)
+            while (await asyncio.wait_for(reader.readline(), 5)).strip():
+                pass  # Skip the request headers.
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", self.registry.render().encode()
+            else:
+                status, body = "404 Not Found", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {self.CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
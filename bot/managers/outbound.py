@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import twitchio
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `capacity` tokens, refilled continuously at
+    `capacity / per` tokens per second.
+    """
+
+    def __init__(self, capacity: int, per: float):
+        self.capacity = capacity
+        self.rate = capacity / per
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """
+        Seconds until a token is available (0 if one is available now).
+        """
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self._refill()
+        self.tokens -= 1
+
+
+@dataclass
+class _Pending:
+    text: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class OutboundManager:
+    """
+    Schedules every outgoing chat message through per-channel and global
+    token buckets so the bot stays inside Twitch's send limits instead of
+    having replies silently rejected.
+
+    Channels with pending messages are served round-robin, so a burst in one
+    channel cannot delay replies in another. Several replies waiting for the
+    same channel are merged into one message while they fit within Twitch's
+    length limit. Each channel queue is bounded; the oldest message is
+    dropped when it overflows, and messages that waited longer than
+    `max_age` are dropped rather than sent late.
+    """
+
+    MAX_MESSAGE_LENGTH = 500
+    SEPARATOR = " | "
+
+    def __init__(self, bot, channel_limit: int, global_limit: int, per: float = 30.0,
+                 max_depth: int = 20, max_age: float = 30.0, max_in_flight: int = 8):
+        """
+        Initialize the OutboundManager.
+
+        Args:
+            bot: The TwitchIO Bot instance; its bot_id is used as the sender.
+            channel_limit (int): Messages allowed per channel every `per` seconds
+                (100 where the bot is a moderator).
+            global_limit (int): Messages allowed across all channels every `per`
+                seconds (Config default 20; 7500 only for a verified bot); the
+                per-channel buckets already enforce each channel's own limit.
+            per (float): Length of the rate-limit window in seconds.
+            max_depth (int): Maximum queued messages per channel.
+            max_age (float): Seconds after which a queued message is dropped.
+            max_in_flight (int): Maximum concurrent send requests to Twitch.
+        """
+        self.bot = bot
+        self.channel_limit = channel_limit
+        self.per = per
+        self.max_depth = max_depth
+        self.max_age = max_age
+        self.global_bucket = TokenBucket(global_limit, per)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._queues: dict[str, deque[_Pending]] = {}
+        self._broadcasters: dict[str, twitchio.PartialUser] = {}
+        self._ready: deque[str] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._deliveries: set[asyncio.Task] = set()
+        self.stats = {
+            "sent": 0,
+            "merged": 0,
+            "dropped_overflow": 0,
+            "dropped_expired": 0,
+            "failed": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+        self.first_sent_at: float | None = None
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of messages currently waiting across all channels.
+        """
+        return sum(len(queue) for queue in self._queues.values())
+
+    def send(self, broadcaster: twitchio.PartialUser, message: str) -> None:
+        """
+        Queue a message for the broadcaster's chat. Returns immediately.
+        """
+        channel_id = broadcaster.id
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = deque()
+        if not queue:
+            self._ready.append(channel_id)
+        if len(queue) >= self.max_depth:
+            queue.popleft()
+            self.stats["dropped_overflow"] += 1
+        queue.append(_Pending(message[:self.MAX_MESSAGE_LENGTH]))
+        self._broadcasters[channel_id] = broadcaster
+        self._wakeup.set()
+
+    def forget(self, channel_id: str) -> None:
+        """
+        Drop a channel's queue, bucket and broadcaster, e.g. once the bot
+        leaves it. Anything still queued for it is discarded.
+        """
+        self._queues.pop(channel_id, None)
+        self._buckets.pop(channel_id, None)
+        self._broadcasters.pop(channel_id, None)
+        try:
+            self._ready.remove(channel_id)
+        except ValueError:
+            pass
+
+    async def start(self) -> None:
+        """
+        Start the background sender task. Calling start twice is a no-op.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Cancel the sender task; anything still queued is discarded.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _bucket(self, channel_id: str) -> TokenBucket:
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._buckets[channel_id] = TokenBucket(self.channel_limit, self.per)
+        return bucket
+
+    def _expire(self, queue: deque[_Pending]) -> None:
+        cutoff = time.monotonic() - self.max_age
+        while queue and queue[0].enqueued_at < cutoff:
+            queue.popleft()
+            self.stats["dropped_expired"] += 1
+
+    def _merge(self, queue: deque[_Pending]) -> _Pending:
+        """
+        Pop the next message, folding in following ones while they fit.
+        """
+        first = queue.popleft()
+        text = first.text
+        while queue:
+            candidate = text + self.SEPARATOR + queue[0].text
+            if len(candidate) > self.MAX_MESSAGE_LENGTH:
+                break
+            text = candidate
+            queue.popleft()
+            self.stats["merged"] += 1
+        return _Pending(text, first.enqueued_at)
+
+    def _next_channel(self) -> tuple[str | None, float]:
+        """
+        Return the next channel (round-robin) whose bucket has a token, or
+        None and the time until one does.
+        """
+        wait = float("inf")
+        for _ in range(len(self._ready)):
+            channel_id = self._ready.popleft()
+            queue = self._queues[channel_id]
+            self._expire(queue)
+            if not queue:
+                continue
+            channel_wait = self._bucket(channel_id).wait_time()
+            if channel_wait == 0:
+                return channel_id, 0.0
+            self._ready.append(channel_id)
+            wait = min(wait, channel_wait)
+        return None, wait
+
+    async def _run(self) -> None:
+        while True:
+            if not self._ready:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            global_wait = self.global_bucket.wait_time()
+            if global_wait:
+                await asyncio.sleep(global_wait)
+                continue
+
+            channel_id, wait = self._next_channel()
+            if channel_id is None:
+                if wait != float("inf"):
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                continue
+
+            queue = self._queues[channel_id]
+            pending = self._merge(queue)
+            if queue:
+                self._ready.append(channel_id)
+            self._bucket(channel_id).take()
+            self.global_bucket.take()
+
+            await self._slots.acquire()
+            task = asyncio.create_task(
+                self._deliver(channel_id, self._broadcasters[channel_id], pending))
+            self._deliveries.add(task)
+            task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, channel_id: str, broadcaster: twitchio.PartialUser,
+                       pending: _Pending) -> None:
+        try:
+            await broadcaster.send_message(sender=self.bot.bot_id, message=pending.text)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error("Failed to send message to %s: %s", channel_id, e)
+            return
+        finally:
+            self._slots.release()
+        if self.first_sent_at is None:
+            self.first_sent_at = time.monotonic()
+        latency = time.monotonic() - pending.enqueued_at
+        self.stats["sent"] += 1
+        self.stats["latency_total"] += latency
+        self.stats["latency_max"] = max(self.stats["latency_max"], latency)
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+
+from api.transport import NBATransport
+from managers.scoreboard import ScoreboardManager, ScoreboardSnapshot
+from utils.cache_policy import GAME_STATUS_FINAL, GAME_STATUS_LIVE
+from utils.play_by_play import GamePlays
+from utils.team_index import TEAM_INDEX
+
+logger = logging.getLogger(__name__)
+
+
+class PlayByPlayManager:
+    """
+    Ingests the live play-by-play feed of every game in progress and serves
+    !last from it.
+
+    The feed is polled after each scoreboard refresh with a conditional
+    request, so an unchanged feed costs a 304 and nothing is decoded. Each
+    game keeps a cursor on the last actionNumber it ingested and only the
+    actions after it are turned into plays, which go into a bounded ring
+    buffer per game (and a short one per player). A game is polled one last
+    time after it goes final, and dropped when it leaves the scoreboard.
+    """
+
+    UNAVAILABLE = "Live NBA data is not available yet. Please try again shortly."
+    PLAYER_PLAYS = 3
+
+    def __init__(self, proxy_manager, transport: NBATransport,
+                 scoreboard_manager: ScoreboardManager, size: int = 200, per_player: int = 5):
+        """
+        Initialize the PlayByPlayManager.
+
+        Args:
+            proxy_manager (ProxyManager): Provides the rotating proxy URL.
+            transport (NBATransport): Fetches the live play-by-play feed.
+            scoreboard_manager (ScoreboardManager): Publishes the games to follow.
+            size (int): Plays kept per game.
+            per_player (int): Plays kept per player.
+        """
+        self.proxy_manager = proxy_manager
+        self.transport = transport
+        self.scoreboard = scoreboard_manager
+        self.size = size
+        self.per_player = per_player
+        self._games: dict[str, GamePlays] = {}
+        self._etags: dict[str, str] = {}
+        self._finished: set[str] = set()
+        self._task: asyncio.Task | None = None
+        scoreboard_manager.add_snapshot_listener(self._on_snapshot)
+
+    def plays(self, game_id: str) -> GamePlays | None:
+        """
+        Return the ingested plays of a game, or None if it has none yet.
+        """
+        return self._games.get(game_id)
+
+    async def _on_snapshot(self, previous: ScoreboardSnapshot | None,
+                           current: ScoreboardSnapshot) -> None:
+        on_slate = {game["gameId"] for game in current.games}
+        for game_id in set(self._games) - on_slate:
+            del self._games[game_id]
+            self._etags.pop(game_id, None)
+        self._finished &= on_slate
+
+        game_ids = [
+            game["gameId"] for game in current.games
+            if game["gameStatus"] == GAME_STATUS_LIVE
+            or (game["gameStatus"] == GAME_STATUS_FINAL and game["gameId"] not in self._finished)
+        ]
+        # Polling runs beside the scoreboard loop; a slow poll is not stacked.
+        if game_ids and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self.poll(game_ids, current))
+
+    async def poll(self, game_ids: list[str], snapshot: ScoreboardSnapshot) -> None:
+        """
+        Fetch and ingest the play-by-play of the given games concurrently.
+        """
+        results = await asyncio.gather(
+            *(self._poll_game(game_id) for game_id in game_ids), return_exceptions=True)
+        finals = {
+            game["gameId"] for game in snapshot.games if game["gameStatus"] == GAME_STATUS_FINAL
+        }
+        for game_id, result in zip(game_ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Play-by-play fetch failed for %s: %s", game_id, result)
+            elif game_id in finals:
+                self._finished.add(game_id)
+
+    async def _poll_game(self, game_id: str) -> int:
+        proxy = await self.proxy_manager.get_proxy()
+        payload, etag = await self.transport.get_live_json_if_changed(
+            "PlayByPlay", f"playbyplay/playbyplay_{game_id}.json", proxy,
+            self._etags.get(game_id))
+        if etag:
+            self._etags[game_id] = etag
+        if payload is None:
+            return 0
+        plays = self._games.get(game_id)
+        if plays is None:
+            plays = self._games[game_id] = GamePlays(self.size, self.per_player)
+        return plays.ingest(payload["game"]["actions"])
+
+    async def get_last(self, name: str) -> str:
+        """
+        Return the latest play of a team's game, or the latest few plays of
+        a player, from the ingested play-by-play.
+
+        Args:
+            name (str): A team (name, abbreviation, city, slang) or a player
+                playing today.
+        """
+        snapshot = self.scoreboard.snapshot
+        if snapshot is None:
+            return self.UNAVAILABLE
+
+        teams = TEAM_INDEX.lookup(name)
+        if len(teams) > 1:
+            names = ", ".join(team["full_name"] for team in teams)
+            return f"{name} is ambiguous: {names}."
+        if teams:
+            team = teams[0]
+            game = snapshot.find_game(team["id"])
+            if game is None:
+                return f"The {team['full_name']} are not currently playing."
+            plays = self._games.get(game["gameId"])
+            play = plays.last() if plays else None
+            if play is None:
+                return f"No plays yet for the {team['full_name']}."
+            return self._format(game, [play])
+
+        refs = snapshot.players.lookup(name)
+        if not refs:
+            return f"{name} is not currently playing."
+        if len(refs) > 1:
+            names = ", ".join(snapshot.player(ref)["name"] for ref in refs)
+            return f"Did you mean: {names}?"
+        player = snapshot.player(refs[0])
+        plays = self._games.get(refs[0].game_id)
+        recent = plays.recent_for_player(player["personId"]) if plays else []
+        if not recent:
+            return f"No plays yet for {player['name']}."
+        game = next(game for game in snapshot.games if game["gameId"] == refs[0].game_id)
+        return self._format(game, recent[-self.PLAYER_PLAYS:])
+
+    @staticmethod
+    def _format(game: dict, plays: list) -> str:
+        away, home = game["awayTeam"]["teamTricode"], game["homeTeam"]["teamTricode"]
+        return " | ".join(play.format(away, home) for play in plays)
+
+    async def close(self) -> None:
+        """
+        Cancel a poll in progress.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+
+from api.transport import NBATransport
+from managers.cache import CacheManager
+from utils.cache_policy import seconds_until_et_hour
+from utils.career import career_params, compact_career
+from utils.codec import payload_key
+from utils.player_index import PlayerIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CareerPrecomputer:
+    """
+    Warms the career cache for every active player once a night, so that
+    !career is served from the cache instead of paying an upstream call on
+    the first request after an entry expires.
+
+    Career stats are fetched with bounded concurrency through the shared
+    NBATransport and written to the cache in batches (one pipelined Redis
+    round trip per batch) in the same shape NBAClient.get_player_career
+    reads. Entries stay fresh until shortly after the next run. When several
+    workers run, a Redis lock lets only one of them do the nightly run.
+    """
+
+    LOCK_KEY = "precompute:careers"
+    LOCK_TTL = 3600
+    FRESH_MARGIN = 3600
+    BATCH_SIZE = 50
+
+    def __init__(self, proxy_manager, transport: NBATransport, cache_manager: CacheManager,
+                 player_index: PlayerIndex, hour: int = 5, concurrency: int = 4):
+        """
+        Initialize the CareerPrecomputer.
+
+        Args:
+            proxy_manager (ProxyManager): Provides the proxy for each request.
+            transport (NBATransport): Runs the PlayerCareerStats requests off the event loop.
+            cache_manager (CacheManager): Receives the career payloads.
+            player_index (PlayerIndex): Supplies the list of active players.
+            hour (int): Hour of the day (US/Eastern) at which the nightly run starts.
+            concurrency (int): Maximum number of career requests in flight.
+        """
+        self.proxy_manager = proxy_manager
+        self.transport = transport
+        self.cache = cache_manager
+        self.players = player_index
+        self.hour = hour
+        self.concurrency = concurrency
+        self._task: asyncio.Task | None = None
+
+    async def run(self) -> int:
+        """
+        Fetch and cache the career stats of every active player.
+
+        Returns:
+            int: The number of players cached.
+        """
+        started = time.monotonic()
+        players = [player for player in self.players.players if player["is_active"]]
+        ttl = seconds_until_et_hour(self.hour) + self.FRESH_MARGIN
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(player: dict) -> tuple[str, dict, float] | None:
+            async with semaphore:
+                proxy = await self.proxy_manager.get_proxy()
+                try:
+                    payload = await self.transport.get_stats_json(
+                        "PlayerCareerStats", career_params(player["id"]), proxy)
+                except Exception as e:
+                    logger.warning("Career precompute failed for %s: %s",
+                                   player["full_name"], e)
+                    return None
+            return payload_key("career", player["id"]), compact_career(payload), ttl
+
+        cached = 0
+        for i in range(0, len(players), self.BATCH_SIZE):
+            results = await asyncio.gather(
+                *(fetch(player) for player in players[i:i + self.BATCH_SIZE]))
+            items = [result for result in results if result is not None]
+            await self.cache.set_entries(items)
+            cached += len(items)
+
+        logger.info(
+            "Precomputed careers for %d/%d active players in %.1fs",
+            cached, len(players), time.monotonic() - started,
+        )
+        return cached
+
+    async def start(self) -> None:
+        """
+        Start the nightly schedule. Calling start twice is a no-op.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Cancel the schedule, abandoning a run in progress.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(seconds_until_et_hour(self.hour))
+            try:
+                # The lock is left to expire so that a worker waking up a
+                # little later does not repeat tonight's run.
+                if await self.cache.redis.acquire_lock(self.LOCK_KEY, self.LOCK_TTL):
+                    await self.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Nightly career precompute failed: %s", e)
@@ -1,16 +1,172 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class ProxyStats:
+    """
+    Health of one proxy endpoint: EWMA latency and error rate, plus the
+    state of its circuit breaker.
+    """
+    url: str
+    latency: float = 0.5
+    error_rate: float = 0.0
+    consecutive_failures: int = 0
+    state: str = CLOSED
+    opened_at: float = 0.0
+    probe_until: float = 0.0
+
+    @property
+    def score(self) -> float:
+        """
+        Lower is better: expected latency, penalized by the recent error rate.
+        """
+        return self.latency * (1 + 4 * self.error_rate)
+
+
+def proxy_label(url: str | None) -> str:
+    """
+    The proxy's host and port, without credentials, for logs and metrics.
+    """
+    return url.rsplit("@", 1)[-1] if url else "direct"
+
+
 class ProxyManager:
     """
-    Provides a single rotating-proxy URL for all requests.
+    Pool of proxy endpoints with latency-aware selection and circuit breaking.
+
+    Every upstream call reports its latency and outcome back through report().
+    Selection picks the healthier of two random closed proxies (power of two
+    choices), which tracks the fastest endpoints without sending the whole
+    load to a single one. A proxy whose errors pile up is opened and skipped;
+    after `cooldown` seconds it is half-opened and a single probe request
+    decides whether it rejoins the pool. A probe that never reports back
+    (e.g. its caller was cancelled) is replaced by another after
+    PROBE_TIMEOUT seconds.
     """
-    def __init__(self, proxy_url: str):
+
+    ALPHA = 0.2
+    FAILURE_THRESHOLD = 5
+    ERROR_RATE_THRESHOLD = 0.5
+    PROBE_TIMEOUT = 30.0
+
+    def __init__(self, proxy_urls: list[str] | str | None, cooldown: float = 30.0):
         """
         Args:
-            proxy_url (str): The full HTTP(s) proxy URL, including credentials and port.
+            proxy_urls (list[str] | str | None): The full HTTP(s) proxy URLs,
+                including credentials and port. None routes requests directly.
+            cooldown (float): Seconds an opened proxy is skipped before being probed.
+        """
+        if isinstance(proxy_urls, str):
+            proxy_urls = [proxy_urls]
+        self.cooldown = cooldown
+        self._proxies = {url: ProxyStats(url) for url in proxy_urls or [] if url}
+
+    @classmethod
+    def from_config(cls, config) -> "ProxyManager":
+        """
+        Build the pool from PROXY_URL (comma-separated) and the Webshare
+        credentials. With WEBSHARE_PROXY_COUNT > 1, one endpoint is added per
+        numbered Webshare session user ("<username>-1", "<username>-2", ...).
+        """
+        urls = [url.strip() for url in (config.PROXY_URL or "").split(",") if url.strip()]
+        if config.WEBSHARE_USERNAME and config.WEBSHARE_PASSWORD:
+            host = config.WEBSHARE_HOST
+            count = config.WEBSHARE_PROXY_COUNT
+            usernames = (
+                [config.WEBSHARE_USERNAME] if count <= 1 else
+                [f"{config.WEBSHARE_USERNAME}-{i}" for i in range(1, count + 1)]
+            )
+            urls.extend(
+                f"http://{username}:{config.WEBSHARE_PASSWORD}@{host}"
+                for username in usernames
+            )
+        return cls(urls)
+
+    @property
+    def stats(self) -> list[ProxyStats]:
+        return list(self._proxies.values())
+
+    def _available(self, now: float) -> list[ProxyStats]:
+        available = []
+        for proxy in self._proxies.values():
+            if proxy.state == OPEN and now - proxy.opened_at >= self.cooldown:
+                proxy.state = HALF_OPEN
+                proxy.probe_until = 0.0
+            if proxy.state == CLOSED:
+                available.append(proxy)
+        return available
+
+    async def get_proxy(self) -> str | None:
         """
-        self._proxy = proxy_url
+        Return the URL of the proxy to use for the next request, or None when
+        no proxies are configured.
+        """
+        if not self._proxies:
+            return None
+        now = time.monotonic()
+        available = self._available(now)
+
+        for proxy in self._proxies.values():
+            if proxy.state == HALF_OPEN and now >= proxy.probe_until:
+                proxy.probe_until = now + self.PROBE_TIMEOUT
+                return proxy.url
 
-    async def get_proxy(self) -> str:
+        if not available:
+            # Every circuit is open: fail open on the one that tripped first.
+            oldest = min(self._proxies.values(), key=lambda proxy: proxy.opened_at)
+            return oldest.url
+        if len(available) == 1:
+            return available[0].url
+        first, second = random.sample(available, 2)
+        return (first if first.score <= second.score else second).url
+
+    def report(self, url: str | None, latency: float, ok: bool) -> None:
         """
-        Return the rotating-proxy URL.
+        Record the outcome of a request made through a proxy.
+
+        Args:
+            url (str | None): The proxy that served the request.
+            latency (float): Seconds the request took.
+            ok (bool): Whether the proxy did its job; upstream answers such as a
+                404 count as success, only transport errors, timeouts and
+                429/5xx as failure.
         """
-        return self._proxy
+        proxy = self._proxies.get(url)
+        if proxy is None:
+            return
+        proxy.latency += self.ALPHA * (latency - proxy.latency)
+        proxy.error_rate += self.ALPHA * ((0.0 if ok else 1.0) - proxy.error_rate)
+
+        if ok:
+            proxy.consecutive_failures = 0
+            if proxy.state != CLOSED:
+                logger.info("Proxy %s recovered", self._label(proxy))
+                proxy.state = CLOSED
+                proxy.probe_until = 0.0
+                proxy.error_rate = 0.0
+            return
+
+        proxy.consecutive_failures += 1
+        if proxy.state == HALF_OPEN or (
+            proxy.state == CLOSED and (
+                proxy.consecutive_failures >= self.FAILURE_THRESHOLD or
+                proxy.error_rate >= self.ERROR_RATE_THRESHOLD
+            )
+        ):
+            logger.warning("Opening circuit for proxy %s", self._label(proxy))
+            proxy.state = OPEN
+            proxy.opened_at = time.monotonic()
+            proxy.probe_until = 0.0
+
+    @staticmethod
+    def _label(proxy: ProxyStats) -> str:
+        return proxy_label(proxy.url)
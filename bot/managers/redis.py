@@ -1,14 +1,38 @@
 import os
+import time
+import uuid
+from typing import AsyncIterator
+
 import redis.asyncio as redis
 
 class RedisManager:
+    _RELEASE_LOCK = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
     def __init__(self, url: str | None = None):
         self.url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
         self.client = redis.from_url(self.url, encoding="utf-8", decode_responses=True)
+        self.binary_client = redis.from_url(self.url)
     
     async def get(self, key: str) -> str | None:
         return await self.client.get(key)
     
+    async def get_bytes_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        async with self.binary_client.pipeline(transaction=False) as pipe:
+            value, pttl = await pipe.get(key).pttl(key).execute()
+        return value, (pttl / 1000 if pttl and pttl > 0 else None)
+
+    async def set_bytes(self, key: str, value: bytes, expire_seconds: int | None = None) -> None:
+        await self.binary_client.set(key, value, ex=expire_seconds or None)
+
+    async def set_many_bytes(self, items: list[tuple[str, bytes, int | None]]) -> None:
+        async with self.binary_client.pipeline(transaction=False) as pipe:
+            for key, value, expire_seconds in items:
+                pipe.set(key, value, ex=expire_seconds or None)
+            await pipe.execute()
+
     async def set(self, key: str, value: str, expire_seconds: int | None = None) -> None:
         if expire_seconds:
             await self.client.set(key, value, ex=expire_seconds)
@@ -16,4 +40,41 @@ class RedisManager:
             await self.client.set(key, value)
     
     async def delete(self, key: str) -> None:
-        await self.client.delete(key)
\ No newline at end of file
+        await self.client.delete(key)
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self.client.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
+    async def heartbeat(self, key: str, member: str, ttl_seconds: float) -> list[str]:
+        now = time.time()
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {member: now})
+            pipe.zremrangebyscore(key, "-inf", now - ttl_seconds)
+            pipe.zrange(key, 0, -1)
+            *_, members = await pipe.execute()
+        return members
+
+    async def remove_member(self, key: str, member: str) -> None:
+        await self.client.zrem(key, member)
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.client.exists(key))
+
+    async def acquire_lock(self, key: str, ttl_seconds: float) -> str | None:
+        token = uuid.uuid4().hex
+        acquired = await self.client.set(key, token, nx=True, px=int(ttl_seconds * 1000))
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self.client.eval(self._RELEASE_LOCK, 1, key, token)
@@ -0,0 +1,376 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Awaitable, Callable, Iterable, Mapping, NamedTuple
+
+from api.transport import NBATransport
+from managers.cache import CacheManager
+from utils.cache_policy import (
+    CachePolicy,
+    GAME_STATUS_FINAL,
+    GAME_STATUS_SCHEDULED,
+)
+from utils.codec import payload_key
+from utils.schedule_formatter import format_schedule
+from utils.text import normalize_name
+
+logger = logging.getLogger(__name__)
+
+_NAME_SUFFIXES = ("jr", "sr", "ii", "iii", "iv")
+
+
+class PlayerRef(NamedTuple):
+    """
+    Location of a player's row inside a snapshot box score.
+    """
+    game_id: str
+    side: str
+    row: int
+
+
+class LivePlayerIndex:
+    """
+    Lookup tables from player name or personId to their box-score row, built
+    once per snapshot so that !stats is a dictionary probe rather than a scan
+    over every player of every game.
+    """
+
+    def __init__(self, boxscores: Mapping[str, dict]):
+        """
+        Build the index from the given box scores.
+
+        Args:
+            boxscores (Mapping[str, dict]): Box-score "game" payloads keyed by gameId.
+        """
+        self.by_id: dict[int, PlayerRef] = {}
+        self.by_name: dict[str, PlayerRef] = {}
+        self.by_last_name: dict[str, list[PlayerRef]] = {}
+
+        for game_id, box in boxscores.items():
+            for side in ("homeTeam", "awayTeam"):
+                for row, player in enumerate(box[side]["players"]):
+                    ref = PlayerRef(game_id, side, row)
+                    self.by_id[player["personId"]] = ref
+
+                    full = normalize_name(player["name"])
+                    self.by_name[full] = ref
+                    words = full.split()
+                    if len(words) > 2 and words[-1] in _NAME_SUFFIXES:
+                        self.by_name.setdefault(" ".join(words[:-1]), ref)
+
+                    last = normalize_name(player.get("familyName") or words[-1])
+                    self.by_last_name.setdefault(last, []).append(ref)
+
+    def lookup(self, query: str) -> list[PlayerRef]:
+        """
+        Resolve a query to matching players.
+
+        Tries personId, then the full normalized name, then the last name.
+        Accents, case and punctuation are ignored.
+
+        Args:
+            query (str): Player name, last name or personId as typed in chat.
+
+        Returns:
+            list[PlayerRef]: A single match, several candidates for an ambiguous
+                last name, or an empty list.
+        """
+        query = query.strip()
+        if query.isdigit():
+            ref = self.by_id.get(int(query))
+            return [ref] if ref else []
+
+        normalized = normalize_name(query)
+        ref = self.by_name.get(normalized)
+        if ref:
+            return [ref]
+        return list(self.by_last_name.get(normalized, ()))
+
+
+@dataclass(frozen=True)
+class ScoreboardSnapshot:
+    """
+    Immutable view of today's scoreboard and the box scores of every game
+    that has tipped off. Snapshots are replaced wholesale on each refresh, so
+    readers can hold on to one without locking; the nested payload dicts are
+    shared between readers and must be treated as read-only.
+    """
+    games: tuple[dict, ...]
+    boxscores: Mapping[str, dict]
+    schedule: str
+    players: LivePlayerIndex
+    updated_at: float = field(default_factory=time.time)
+
+    def find_game(self, team_id: int) -> dict | None:
+        """
+        Return today's game for the given team id, or None if the team is idle.
+        """
+        for game in self.games:
+            if team_id in (game["homeTeam"]["teamId"], game["awayTeam"]["teamId"]):
+                return game
+        return None
+
+    def player(self, ref: PlayerRef) -> dict:
+        """
+        Return the box-score player row referenced by ref.
+        """
+        return self.boxscores[ref.game_id][ref.side]["players"][ref.row]
+
+
+SnapshotListener = Callable[[ScoreboardSnapshot | None, ScoreboardSnapshot], Awaitable[None]]
+
+
+class ScoreboardManager:
+    """
+    Background poller that refreshes the live scoreboard (and the box scores of
+    in-progress games) and publishes the result as a ScoreboardSnapshot. All
+    live commands read the latest snapshot instead of calling stats.nba.com
+    themselves, so upstream load stays constant no matter how many channels
+    are issuing commands.
+
+    The polling interval follows the CachePolicy: seconds while a game is
+    live, slower otherwise. Listeners registered with add_final_listener are
+    notified once when a game goes final, so that caches derived from it can
+    be invalidated. Listeners registered with add_snapshot_listener receive
+    the previous and the new snapshot after every refresh.
+
+    Raw scoreboard and box-score payloads are shared through the CacheManager
+    under versioned keys, so several bot processes polling at once only hit
+    the CDN once per interval between them.
+    """
+
+    def __init__(self, proxy_manager, transport: NBATransport,
+                 cache_manager: CacheManager, policy: CachePolicy):
+        """
+        Initialize the ScoreboardManager.
+
+        Args:
+            proxy_manager (ProxyManager): Provides the rotating proxy URL.
+            transport (NBATransport): Runs nba_api endpoints off the event loop.
+            cache_manager (CacheManager): Shares raw payloads between processes.
+            policy (CachePolicy): Decides how long to wait between refreshes.
+        """
+        self.proxy_manager = proxy_manager
+        self.transport = transport
+        self.cache = cache_manager
+        self.policy = policy
+        self._snapshot: ScoreboardSnapshot | None = None
+        self._task: asyncio.Task | None = None
+        self._final_listeners: list[Callable[[dict], Awaitable[None]]] = []
+        self._snapshot_listeners: list[SnapshotListener] = []
+
+    def add_final_listener(self, callback: Callable[[dict], Awaitable[None]]) -> None:
+        """
+        Register a coroutine called with the box score of each game that goes final.
+        """
+        self._final_listeners.append(callback)
+
+    def add_snapshot_listener(self, callback: SnapshotListener) -> None:
+        """
+        Register a coroutine called with the previous snapshot (None on the
+        first refresh) and the new one each time a snapshot is published.
+        """
+        self._snapshot_listeners.append(callback)
+
+    @property
+    def snapshot(self) -> ScoreboardSnapshot | None:
+        """
+        The most recently published snapshot, or None before the first refresh.
+        """
+        return self._snapshot
+
+    async def start(self) -> None:
+        """
+        Start the background polling task. Calling start twice is a no-op.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Cancel the background polling task and wait for it to exit.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _boxscore_ttl(self, box: dict) -> float:
+        """
+        How long a raw box score stays fresh for other processes: half a poll
+        interval while the game can still change, by the CachePolicy once final.
+        """
+        if box["gameStatus"] == GAME_STATUS_FINAL:
+            return self.policy.ttl_for_game(box)
+        return self.policy.poll_interval((box,)) / 2
+
+    async def fetch_scoreboard(self) -> list[dict]:
+        """
+        Return today's scoreboard games from the live CDN.
+
+        A copy published by another bot process within the current poll
+        interval is used instead of an upstream fetch, and the last stored
+        copy is served if the CDN request fails.
+        """
+        key = payload_key("scoreboard")
+        entry = await self.cache.get_entry(key)
+        if entry is not None and entry.fresh:
+            return entry.value
+
+        proxy = await self.proxy_manager.get_proxy()
+        try:
+            payload = await self.transport.get_live_json(
+                "ScoreBoard", "scoreboard/todaysScoreboard_00.json", proxy)
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning("Scoreboard fetch failed, serving stored copy: %s", e)
+            return entry.value
+
+        games = payload["scoreboard"]["games"]
+        await self.cache.set_entry(key, games, self.policy.poll_interval(games) / 2)
+        return games
+
+    async def _fetch_boxscore(self, game_id: str) -> dict:
+        """
+        Fetch one raw box score, through the proxy the pool picks for it.
+        """
+        proxy = await self.proxy_manager.get_proxy()
+        return await self.transport.get_live_json(
+            "BoxScore", f"boxscore/boxscore_{game_id}.json", proxy)
+
+    async def fetch_boxscores(self, game_ids: Iterable[str]) -> dict[str, dict]:
+        """
+        Download the box scores of several games concurrently.
+
+        Fresh copies published by other bot processes are reused. The rest
+        share one pooled session per proxy and are capped by the transport's
+        BoxScore concurrency limit, so a full slate loads in roughly the time
+        of the slowest single request. Games whose request fails are logged
+        and left out of the result.
+
+        Args:
+            game_ids (Iterable[str]): The gameIds to fetch.
+
+        Returns:
+            dict[str, dict]: Box-score "game" payloads keyed by gameId.
+        """
+        game_ids = list(game_ids)
+        entries = await asyncio.gather(
+            *(self.cache.get_entry(payload_key("boxscore", game_id)) for game_id in game_ids))
+
+        boxscores: dict[str, dict] = {}
+        missing: list[str] = []
+        for game_id, entry in zip(game_ids, entries):
+            if entry is not None and entry.fresh:
+                boxscores[game_id] = entry.value
+            else:
+                missing.append(game_id)
+        if not missing:
+            return boxscores
+
+        results = await asyncio.gather(
+            *(self._fetch_boxscore(game_id) for game_id in missing),
+            return_exceptions=True,
+        )
+
+        writes = []
+        for game_id, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.warning("Box score fetch failed for %s: %s", game_id, result)
+                continue
+            box = result["game"]
+            boxscores[game_id] = box
+            writes.append(self.cache.set_entry(
+                payload_key("boxscore", game_id), box, self._boxscore_ttl(box)))
+        await asyncio.gather(*writes)
+        return boxscores
+
+    async def refresh(self) -> ScoreboardSnapshot:
+        """
+        Fetch the scoreboard and the box scores of started games, then publish
+        a new snapshot.
+
+        Box scores of games that were already final in the previous snapshot
+        are reused as-is, since they can no longer change. If a box score
+        cannot be fetched, the previous one for that game is kept.
+        """
+        games = await self.fetch_scoreboard()
+
+        previous_snapshot = self._snapshot
+        previous = previous_snapshot.boxscores if previous_snapshot else {}
+        boxscores: dict[str, dict] = {}
+        stale: list[str] = []
+        for game in games:
+            game_id = game["gameId"]
+            if game["gameStatus"] == GAME_STATUS_SCHEDULED:
+                continue
+            cached = previous.get(game_id)
+            if cached and cached["gameStatus"] == GAME_STATUS_FINAL:
+                boxscores[game_id] = cached
+            else:
+                stale.append(game_id)
+
+        fetched = await self.fetch_boxscores(stale)
+        for game_id in stale:
+            box = fetched.get(game_id) or previous.get(game_id)
+            if box:
+                boxscores[game_id] = box
+
+        snapshot = ScoreboardSnapshot(
+            games=tuple(games),
+            boxscores=MappingProxyType(boxscores),
+            schedule=format_schedule(games),
+            players=LivePlayerIndex(boxscores),
+        )
+        self._snapshot = snapshot
+        if previous_snapshot is not None:
+            await self._notify_finals(previous_snapshot, boxscores)
+        for callback in self._snapshot_listeners:
+            try:
+                await callback(previous_snapshot, snapshot)
+            except Exception as e:
+                logger.error("Snapshot listener failed: %s", e)
+        return snapshot
+
+    async def _notify_finals(self, previous: ScoreboardSnapshot,
+                             current: Mapping[str, dict]) -> None:
+        """
+        Call the final listeners for every game that turned final in this
+        refresh, i.e. was on the previous snapshot and not final there.
+        Games already final when the process starts are not reported, so a
+        restart does not invalidate caches that are still correct.
+        """
+        before = {game["gameId"]: game["gameStatus"] for game in previous.games}
+        before.update(
+            (game_id, box["gameStatus"]) for game_id, box in previous.boxscores.items())
+        for game_id, box in current.items():
+            if box["gameStatus"] != GAME_STATUS_FINAL:
+                continue
+            if before.get(game_id, GAME_STATUS_FINAL) == GAME_STATUS_FINAL:
+                continue
+            for callback in self._final_listeners:
+                try:
+                    await callback(box)
+                except Exception as e:
+                    logger.error("Final listener failed for %s: %s", game_id, e)
+
+    async def _run(self) -> None:
+        """
+        Refresh forever, logging (and surviving) any upstream failure.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Scoreboard refresh failed: %s", e)
+            games = self._snapshot.games if self._snapshot else ()
+            await asyncio.sleep(self.policy.poll_interval(games))
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import logging
+import os
+import socket
+from typing import Awaitable, Callable
+
+from managers.redis import RedisManager
+
+logger = logging.getLogger(__name__)
+
+RebalanceCallback = Callable[[tuple[str, ...], tuple[str, ...]], Awaitable[None]]
+
+
+def owner_of(channel_id: str, workers: tuple[str, ...]) -> str | None:
+    """
+    Pick the worker that owns a channel with rendezvous (highest random
+    weight) hashing: when a worker joins or leaves, only the channels it
+    gains or loses move, and every worker computes the same answer from
+    the same membership list.
+    """
+    if not workers:
+        return None
+    return max(
+        workers,
+        key=lambda worker: hashlib.blake2b(
+            f"{worker}:{channel_id}".encode(), digest_size=8).digest(),
+    )
+
+
+class ShardManager:
+    """
+    Splits channels across several bot worker processes.
+
+    Each worker keeps a lease in the Redis sorted set `shard:workers` by
+    heartbeating its score (the current time); workers whose lease is older
+    than `lease_ttl` are pruned. Channel ownership is derived from the live
+    membership with rendezvous hashing, so no assignment table is stored.
+    Whenever the membership changes, the registered rebalance callback is
+    invoked with the old and new member lists.
+    """
+
+    WORKERS_KEY = "shard:workers"
+
+    def __init__(self, redis_manager: RedisManager, worker_id: str | None = None,
+                 heartbeat_interval: float = 5.0, lease_ttl: float = 15.0):
+        """
+        Initialize the ShardManager.
+
+        Args:
+            redis_manager (RedisManager): Holds the worker leases.
+            worker_id (str | None): Unique name for this worker; defaults to host-pid.
+            heartbeat_interval (float): Seconds between lease renewals.
+            lease_ttl (float): Seconds without a heartbeat before a worker is
+                considered dead and its channels are rebalanced.
+        """
+        self.redis = redis_manager
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.heartbeat_interval = heartbeat_interval
+        self.lease_ttl = lease_ttl
+        self.workers: tuple[str, ...] = (self.worker_id,)
+        self._callbacks: list[RebalanceCallback] = []
+        self._task: asyncio.Task | None = None
+
+    def on_rebalance(self, callback: RebalanceCallback) -> None:
+        """
+        Register a coroutine called with (old_workers, new_workers) on membership changes.
+        """
+        self._callbacks.append(callback)
+
+    def owns(self, channel_id: str) -> bool:
+        """
+        Whether this worker currently owns the channel.
+        """
+        return owner_of(channel_id, self.workers) == self.worker_id
+
+    async def start(self) -> None:
+        """
+        Register this worker, load the current membership and start heartbeating.
+        """
+        self.workers = await self._heartbeat()
+        logger.info("Worker %s joined shard set %s", self.worker_id, self.workers)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stop heartbeating and give up the lease so peers rebalance immediately.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.redis.remove_member(self.WORKERS_KEY, self.worker_id)
+
+    async def _heartbeat(self) -> tuple[str, ...]:
+        members = await self.redis.heartbeat(
+            self.WORKERS_KEY, self.worker_id, self.lease_ttl)
+        return tuple(sorted(members))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                workers = await self._heartbeat()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Shard heartbeat failed: %s", e)
+                continue
+            if workers == self.workers:
+                continue
+
+            previous, self.workers = self.workers, workers
+            logger.info("Shard membership changed: %s -> %s", previous, workers)
+            for callback in self._callbacks:
+                try:
+                    await callback(previous, workers)
+                except Exception as e:
+                    logger.error("Rebalance callback failed: %s", e)
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+
+from api.transport import NBATransport
+from managers.cache import CacheManager
+from managers.scoreboard import ScoreboardManager
+from utils.codec import payload_key
+from utils.stats_formatter import TeamStanding, compact_standings, standings_params
+
+logger = logging.getLogger(__name__)
+
+
+class StandingsManager:
+    """
+    Serves every team's record from one league-wide standings payload.
+
+    The parsed LeagueStandingsV3 table is cached under a single key
+    until the next ET day, and refreshed shortly after games go final
+    (detected by the ScoreboardManager). Finals that arrive close together
+    are coalesced into one refresh, and a Redis lock keeps several workers
+    from refreshing at once, so records cost a handful of upstream calls
+    per night instead of one per team.
+    """
+
+    KEY = payload_key("standings")
+    LOCK_KEY = "standings:refresh"
+    REFRESH_DELAY = 120.0
+
+    def __init__(self, proxy_manager, transport: NBATransport,
+                 cache_manager: CacheManager, scoreboard_manager: ScoreboardManager):
+        """
+        Initialize the StandingsManager.
+
+        Args:
+            proxy_manager (ProxyManager): Provides the rotating proxy URL.
+            transport (NBATransport): Runs the standings endpoint off the event loop.
+            cache_manager (CacheManager): Shares the standings between processes.
+            scoreboard_manager (ScoreboardManager): Reports games going final.
+        """
+        self.proxy_manager = proxy_manager
+        self.transport = transport
+        self.cache = cache_manager
+        self.policy = scoreboard_manager.policy
+        self._refresh: asyncio.Task | None = None
+        scoreboard_manager.add_final_listener(self._on_game_final)
+
+    async def get_standing(self, team_id: int) -> TeamStanding | None:
+        """
+        Return a team's row of the standings, or None if it has none.
+
+        Raises:
+            asyncio.TimeoutError: If the standings are not cached and the
+                upstream call times out.
+            requests.RequestException: If the standings are not cached and
+                the upstream call fails (connection error or error status).
+        """
+        table = await self.cache.get_or_refresh(self.KEY, self._fetch_standings)
+        row = table.get(str(team_id))
+        return TeamStanding(*row) if row else None
+
+    async def _fetch_standings(self) -> tuple[dict, float]:
+        """
+        Fetch the league standings upstream.
+
+        Returns:
+            tuple[dict, float]: The standings table and how long it may be cached.
+        """
+        proxy = await self.proxy_manager.get_proxy()
+        payload = await self.transport.get_stats_json(
+            "LeagueStandingsV3", standings_params(), proxy)
+        return compact_standings(payload), self.policy.ttl_for_game(None)
+
+    async def _on_game_final(self, box: dict) -> None:
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self._refresh_after_delay())
+
+    async def _refresh_after_delay(self) -> None:
+        """
+        Wait for upstream standings to catch up with the final (and for any
+        other games finishing around the same time), then replace the cache.
+        """
+        await asyncio.sleep(self.REFRESH_DELAY)
+        try:
+            if not await self.cache.redis.acquire_lock(self.LOCK_KEY, self.REFRESH_DELAY):
+                return
+            table, ttl = await self._fetch_standings()
+            await self.cache.set_entry(self.KEY, table, ttl)
+        except Exception as e:
+            logger.error("Standings refresh failed: %s", e)
+
+    async def close(self) -> None:
+        """
+        Cancel a pending refresh.
+        """
+        if self._refresh is not None:
+            self._refresh.cancel()
+            self._refresh = None
@@ -1,14 +1,38 @@
 import logging
+from dataclasses import dataclass
 
 from twitchio import eventsub
 
 logger = logging.getLogger(__name__)
 
+PENDING = "pending"
+ENABLED = "enabled"
+
+
+@dataclass
+class SubscriptionEntry:
+    """
+    Local record of one chat subscription.
+
+    Attributes:
+        subscription_id (str | None): The EventSub subscription id, once known.
+        state (str): PENDING while the subscribe call is in flight, then ENABLED.
+    """
+    subscription_id: str | None = None
+    state: str = PENDING
+
 
 class WebSocketManager:
     """
     Handles Twitch EventSub websocket subscriptions for chat messages.
     Provides methods to subscribe and unsubscribe to chat events for a given broadcaster.
+
+    A local registry maps broadcaster_user_id to its subscription id and
+    state, which makes subscribe idempotent (replayed Supabase UPDATEs are
+    no-ops) and unsubscribe a single dictionary lookup. The registry is kept
+    in sync with revocation messages and is rebuilt from the bot's live
+    subscriptions (websocket_subscriptions) on every reconciliation, since
+    a reconnect resubscribes under new ids without telling us (see resync).
     """
 
     def __init__(self, bot):
@@ -19,35 +43,127 @@ class WebSocketManager:
             bot: The TwitchIO Bot instance which exposes methods to manage websocket subscriptions.
         """
         self.bot = bot
+        self._registry: dict[str, SubscriptionEntry] = {}
+        self._by_subscription_id: dict[str, str] = {}
+
+    def subscribed(self) -> set[str]:
+        """
+        Return the broadcaster_user_ids with a pending or enabled subscription.
+        """
+        return set(self._registry)
+
+    def _register(self, broadcaster_user_id: str, subscription_id: str | None) -> None:
+        entry = self._registry.setdefault(broadcaster_user_id, SubscriptionEntry())
+        entry.subscription_id = subscription_id
+        entry.state = ENABLED
+        if subscription_id:
+            self._by_subscription_id[subscription_id] = broadcaster_user_id
+
+    def _forget(self, broadcaster_user_id: str) -> SubscriptionEntry | None:
+        entry = self._registry.pop(broadcaster_user_id, None)
+        if entry is not None and entry.subscription_id:
+            self._by_subscription_id.pop(entry.subscription_id, None)
+        return entry
+
+    def _find_subscription_id(self, broadcaster_user_id: str) -> str | None:
+        """
+        Fall back to scanning the bot's subscriptions for a broadcaster whose
+        subscription id was not returned by the subscribe call (Twitch
+        answers 409 when the subscription already exists).
+        """
+        for subscription_id, data in self.bot.websocket_subscriptions().items():
+            if data.condition.get("broadcaster_user_id") == broadcaster_user_id:
+                return subscription_id
+        return None
 
     async def subscribe(self, broadcaster_user_id: str) -> None:
         """
         Subscribe to chat message events for a specific broadcaster.
 
         Creates a ChatMessageSubscription for the given broadcaster_user_id and
-        registers it with the bot's websocket connection.
+        registers it with the bot's websocket connection. Does nothing if the
+        broadcaster is already subscribed or a subscribe call is in flight.
 
         Args:
             broadcaster_user_id (str): The Twitch user ID of the channel to subscribe to.
         """
+        if broadcaster_user_id in self._registry:
+            return
+        self._registry[broadcaster_user_id] = SubscriptionEntry()
+
         subscription = eventsub.ChatMessageSubscription(
             broadcaster_user_id=broadcaster_user_id,
             user_id=self.bot.bot_id,
         )
-        await self.bot.subscribe_websocket(payload=subscription)
+        try:
+            response = await self.bot.subscribe_websocket(payload=subscription)
+        except Exception:
+            self._registry.pop(broadcaster_user_id, None)
+            raise
+        # subscribe_websocket returns Twitch's response, or None on a 409.
+        if response:
+            subscription_id = response["data"][0]["id"]
+        else:
+            subscription_id = self._find_subscription_id(broadcaster_user_id)
+        if broadcaster_user_id not in self._registry:
+            # Unsubscribed while the subscribe call was in flight.
+            if subscription_id:
+                await self.bot.delete_websocket_subscription(subscription_id)
+            return
+
+        self._register(broadcaster_user_id, subscription_id)
         logger.info("Successfully joined channel: %s", broadcaster_user_id)
 
     async def unsubscribe(self, broadcaster_user_id: str) -> None:
         """
         Unsubscribe from chat message events for a specific broadcaster.
 
-        Iterates through the bot's active websocket subscriptions, finds the one
-        matching the given broadcaster_user_id, and deletes it.
+        Looks up the broadcaster's subscription id in the registry and deletes it.
 
         Args:
             broadcaster_user_id (str): The Twitch user ID of the channel to unsubscribe from.
         """
-        subscriptions = self.bot.websocket_subscriptions()
-        for subscription_id, data in subscriptions.items():
-            if data.condition.get("broadcaster_user_id") == broadcaster_user_id:
-                await self.bot.delete_websocket_subscription(subscription_id)
+        entry = self._forget(broadcaster_user_id)
+        self.bot.outbound_manager.forget(broadcaster_user_id)
+        if entry is None or entry.state == PENDING:
+            return
+        subscription_id = entry.subscription_id
+        if subscription_id not in self.bot.websocket_subscriptions():
+            # Resubscribed under a new id after a reconnect since the last resync.
+            subscription_id = self._find_subscription_id(broadcaster_user_id)
+        if subscription_id:
+            await self.bot.delete_websocket_subscription(subscription_id)
+
+    def handle_revocation(self, subscription_id: str) -> None:
+        """
+        Drop a subscription that Twitch revoked (e.g. the bot was banned or the
+        broadcaster's authorization was removed), so that a later subscribe or
+        reconciliation can re-create it.
+        """
+        if subscription_id not in self._by_subscription_id:
+            # Possibly an id from a reconnect the registry has not seen yet.
+            self.resync()
+        broadcaster_user_id = self._by_subscription_id.pop(subscription_id, None)
+        if broadcaster_user_id is not None:
+            self._registry.pop(broadcaster_user_id, None)
+            self.bot.outbound_manager.forget(broadcaster_user_id)
+            logger.warning("Subscription revoked for channel: %s", broadcaster_user_id)
+
+    def resync(self) -> None:
+        """
+        Rebuild the registry from the bot's live websocket subscriptions.
+        Runs before each reconciliation, so ids reassigned by a reconnect are
+        picked up within one reconcile interval. In-flight subscribe calls
+        are kept.
+        """
+        pending = {
+            broadcaster_user_id: entry
+            for broadcaster_user_id, entry in self._registry.items()
+            if entry.state == PENDING
+        }
+        self._registry = pending
+        self._by_subscription_id = {}
+        for subscription_id, data in self.bot.websocket_subscriptions().items():
+            broadcaster_user_id = data.condition.get("broadcaster_user_id")
+            if broadcaster_user_id:
+                self._register(broadcaster_user_id, subscription_id)
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from api.transport import NBATransport
+from config import Config
+from managers.cache import CacheManager
+from managers.precompute import CareerPrecomputer
+from managers.proxy import ProxyManager
+from managers.redis import RedisManager
+from utils.player_index import PlayerIndex
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main() -> None:
+    """
+    Warm the career cache for every active player once and exit, e.g. from cron:
+
+        python precompute.py
+    """
+    async def runner() -> None:
+        proxy_manager = ProxyManager.from_config(Config)
+        cache_manager = CacheManager(
+            RedisManager(), Config.LOCAL_CACHE_MAX_BYTES,
+            Config.LOCAL_CACHE_TTL, Config.CACHE_STALE_TTL)
+        transport = NBATransport(Config.NBA_API_MAX_WORKERS, proxy_manager=proxy_manager)
+        precomputer = CareerPrecomputer(
+            proxy_manager, transport, cache_manager,
+            PlayerIndex.from_static(Config.PLAYER_ALIASES_FILE),
+            Config.CAREER_PRECOMPUTE_HOUR)
+        try:
+            await precomputer.run()
+        finally:
+            transport.close()
+    asyncio.run(runner())
+
+
+if __name__ == "__main__":
+    main()
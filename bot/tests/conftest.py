@@ -0,0 +1,7 @@
+import os
+
+# Config is read at import time; give the modules that derive URLs from it
+# something to work with. Nothing in the tests connects to these.
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("TWITCH_BOT_ID", "1")
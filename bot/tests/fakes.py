@@ -0,0 +1,125 @@
+"""
+In-memory stand-ins for the services the managers talk to.
+"""
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+from typing import AsyncIterator
+
+
+class FakeProxyManager:
+    async def get_proxy(self) -> None:
+        return None
+
+
+class FakeTwitchBot:
+    """
+    Stands in for the TwitchIO bot's websocket subscription API.
+    """
+
+    def __init__(self, return_ids: bool = True):
+        self.bot_id = "999"
+        self.return_ids = return_ids
+        self.live: dict[str, SimpleNamespace] = {}
+        self.subscribe_calls: list[str] = []
+        self.deleted: list[str] = []
+        self.failing: set[str] = set()
+        self.release = asyncio.Event()
+        self.release.set()
+        self.forgotten: list[str] = []
+        self.outbound_manager = SimpleNamespace(forget=self.forgotten.append)
+
+    async def subscribe_websocket(self, payload):
+        broadcaster_user_id = payload.condition["broadcaster_user_id"]
+        self.subscribe_calls.append(broadcaster_user_id)
+        await self.release.wait()
+        if broadcaster_user_id in self.failing:
+            raise RuntimeError("subscription rejected")
+        subscription_id = f"sub-{broadcaster_user_id}"
+        self.live[subscription_id] = SimpleNamespace(
+            condition={"broadcaster_user_id": broadcaster_user_id})
+        return {"data": [{"id": subscription_id}]} if self.return_ids else None
+
+    def websocket_subscriptions(self) -> dict:
+        return dict(self.live)
+
+    async def delete_websocket_subscription(self, subscription_id: str) -> None:
+        self.deleted.append(subscription_id)
+        self.live.pop(subscription_id, None)
+
+
+class FakeRedis:
+    """
+    The subset of RedisManager the bot uses, backed by a dict. Expiries are
+    recorded in `ttls` but never enforced; published messages are kept in
+    `published` and delivered to every subscriber.
+    """
+
+    def __init__(self):
+        self.data: dict[str, str | bytes] = {}
+        self.ttls: dict[str, float] = {}
+        self.published: list[tuple[str, str]] = []
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, expire_seconds: int | None = None) -> None:
+        self.data[key] = value
+        if expire_seconds:
+            self.ttls[key] = expire_seconds
+
+    async def get_bytes_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        return self.data.get(key), self.ttls.get(key)
+
+    async def set_bytes(self, key: str, value: bytes, expire_seconds: int | None = None) -> None:
+        await self.set(key, value, expire_seconds)
+
+    async def set_many_bytes(self, items: list[tuple[str, bytes, int | None]]) -> None:
+        for key, value, expire_seconds in items:
+            await self.set(key, value, expire_seconds)
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, message))
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(channel, []).append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].remove(queue)
+
+    async def exists(self, key: str) -> bool:
+        return key in self.data
+
+    async def acquire_lock(self, key: str, ttl_seconds: float) -> str | None:
+        if key in self.data:
+            return None
+        token = self.data[key] = uuid.uuid4().hex
+        return token
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if self.data.get(key) == token:
+            del self.data[key]
+
+    async def heartbeat(self, key: str, member: str, ttl_seconds: float) -> list[str]:
+        now = time.time()
+        members = self.sorted_sets.setdefault(key, {})
+        members[member] = now
+        for name, score in list(members.items()):
+            if score <= now - ttl_seconds:
+                del members[name]
+        return sorted(members, key=members.get)
+
+    async def remove_member(self, key: str, member: str) -> None:
+        self.sorted_sets.get(key, {}).pop(member, None)
@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks import run
+from benchmarks.fakes import FakeRedis, FixtureTransport, build_nba_stack
+
+
+async def _with_stack(scenario):
+    stack = build_nba_stack()
+    try:
+        await stack.scoreboard.refresh()
+        return await scenario(stack)
+    finally:
+        await stack.standings.close()
+        stack.transport.close()
+
+
+def test_commands_are_served_from_fixtures():
+    async def scenario(stack):
+        client = stack.client
+        return (await client.get_game_score("Lakers"), await client.get_player_career("LeBron James"),
+                await client.get_team_record("Lakers"), dict(stack.transport.calls))
+
+    score, career, record, calls = asyncio.run(_with_stack(scenario))
+    assert score == "Boston Celtics 143 - Los Angeles Lakers 131 (Q3 5:12)"
+    assert career == ("LeBron James: 23.8 PTS, 6.8 REB, 5.4 AST, 47.2% FG"
+                      " | Playoffs: 22.9 PTS, 6.7 REB, 6.1 AST, 48.4% FG")
+    assert record == "The Los Angeles Lakers are 55 - 24 (W4, 6th in the West, 5.5 GB)"
+    assert calls == {"ScoreBoard": 1, "BoxScore": 4, "PlayerCareerStats": 1, "LeagueStandingsV3": 1}
+
+
+def test_clear_caches_makes_the_next_call_cold():
+    async def scenario(stack):
+        await stack.client.get_player_career("LeBron James")
+        await stack.client.get_player_career("LeBron James")
+        warm = stack.transport.calls["PlayerCareerStats"]
+        stack.clear_caches()
+        await stack.client.get_player_career("LeBron James")
+        return warm, stack.transport.calls["PlayerCareerStats"]
+
+    assert asyncio.run(_with_stack(scenario)) == (1, 2)
+
+
+def test_unknown_fixture_raises():
+    transport = FixtureTransport()
+    try:
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(transport.get_live_json("BoxScore", "boxscore/boxscore_missing.json", None))
+    finally:
+        transport.close()
+
+
+def test_fake_redis_expires_keys(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("benchmarks.fakes.time.monotonic", lambda: now[0])
+    redis = FakeRedis()
+    asyncio.run(redis.set_bytes("key", b"value", expire_seconds=10))
+    assert asyncio.run(redis.get_bytes_with_ttl("key")) == (b"value", 10)
+    now[0] += 10
+    assert asyncio.run(redis.get("key")) is None
+
+
+def test_measure_reports_latency_and_allocations():
+    async def call(query: str) -> str:
+        return query.upper()
+
+    result = asyncio.run(run._measure("upper", call, ["a", "b"], 20, None))
+    assert result["path"] == "upper" and result["cache"] == "warm"
+    assert result["iterations"] == 20
+    assert 0 <= result["p50_ms"] <= result["p99_ms"]
+    assert set(result) >= {"ops_per_sec", "mean_ms", "alloc_peak_bytes", "alloc_blocks"}
+
+
+def test_snapshot_paths_are_only_run_warm():
+    results = asyncio.run(run.run(2, 0.0, ["score", "career"]))
+    assert [(r["path"], r["cache"]) for r in results] == [
+        ("score", "warm"), ("career", "cold"), ("career", "warm")]
+
+
+def test_percentile_of_a_single_sample():
+    assert run._percentile([0.5], 99) == 0.5
+
+
+def test_compare_prints_relative_change(tmp_path, capsys):
+    baseline = tmp_path / "before.json"
+    baseline.write_text(json.dumps({"results": [
+        {"path": "score", "cache": "warm", "ops_per_sec": 100.0, "p50_ms": 2.0,
+         "p99_ms": 4.0, "alloc_blocks": 10.0},
+    ]}))
+    run.compare([{"path": "score", "cache": "warm", "ops_per_sec": 150.0, "p50_ms": 1.0,
+                  "p99_ms": 4.0, "alloc_blocks": 12.0},
+                 {"path": "new", "cache": "warm"}], str(baseline))
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert lines[-1].split() == ["score", "warm", "ops_per_sec", "+50.0%", "p50_ms", "-50.0%",
+                                 "p99_ms", "+0.0%", "alloc_blocks", "+20.0%"]
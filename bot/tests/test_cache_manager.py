@@ -0,0 +1,173 @@
+import asyncio
+import json
+import time
+
+from managers.cache import CacheManager
+from tests.fakes import FakeRedis
+from utils.codec import pack, unpack
+
+
+def test_redis_hit_is_copied_into_memory():
+    async def scenario():
+        redis = FakeRedis()
+        await redis.set_bytes("key", pack(["value", time.time() + 60]), expire_seconds=30)
+        cache = CacheManager(redis, local_ttl=300)
+        first = await cache.get_entry("key")
+        await redis.delete("key")
+        return first, await cache.get_entry("key"), cache
+
+    first, second, cache = asyncio.run(scenario())
+    assert first == second
+    assert first.value == "value" and first.fresh
+    assert cache.stats == {"local": {"hits": 1, "misses": 1}, "redis": {"hits": 1, "misses": 0}}
+    assert cache.hit_rate("local") == 0.5
+
+
+def test_local_copy_never_outlives_redis_ttl():
+    async def scenario():
+        redis = FakeRedis()
+        await redis.set_bytes("key", pack(["value", time.time() + 60]), expire_seconds=30)
+        cache = CacheManager(redis, local_ttl=300)
+        await cache.get_entry("key")
+        return cache.local._entries["key"][1] - time.monotonic()
+
+    assert 29 < asyncio.run(scenario()) <= 30
+
+
+def test_miss_in_both_tiers():
+    cache = CacheManager(FakeRedis())
+    assert asyncio.run(cache.get_entry("key")) is None
+    assert cache.stats["redis"]["misses"] == 1
+    assert cache.hit_rate("redis") == 0.0
+
+
+def test_set_entry_and_delete_reach_both_tiers_and_broadcast():
+    async def scenario():
+        redis = FakeRedis()
+        cache = CacheManager(redis, stale_ttl=0)
+        await cache.set_entry("key", "value", 60)
+        stored = unpack(redis.data["key"])[0], redis.ttls["key"], cache.local.get("key").value
+        await cache.delete("key")
+        return redis, cache, stored
+
+    redis, cache, stored = asyncio.run(scenario())
+    assert stored == ("value", 60, "value")
+    assert "key" not in redis.data and cache.local.get("key") is None
+    messages = [json.loads(message) for _, message in redis.published]
+    assert messages == [{"origin": cache.origin, "keys": ["key"]}] * 2
+
+
+def test_other_processes_drop_their_local_copy():
+    async def scenario():
+        redis = FakeRedis()
+        writer, reader = CacheManager(redis), CacheManager(redis)
+        await reader.listen()
+        await writer.listen()
+        await asyncio.sleep(0)
+        reader.local.set("key", "old", 60)
+        await writer.set_entry("key", "new", 60)
+        await asyncio.sleep(0.01)
+        values = reader.local.get("key"), writer.local.get("key").value, \
+            (await reader.get_entry("key")).value
+        await reader.close()
+        await writer.close()
+        return values
+
+    assert asyncio.run(scenario()) == (None, "new", "new")
+
+
+class Loader:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def _settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_get_or_refresh_loads_once_then_serves_fresh():
+    async def scenario():
+        cache = CacheManager(FakeRedis())
+        loader = Loader(("v1", 60))
+        first = await cache.get_or_refresh("key", loader)
+        second = await cache.get_or_refresh("key", loader)
+        return first, second, loader.calls
+
+    assert asyncio.run(scenario()) == ("v1", "v1", 1)
+
+
+def test_zero_ttl_is_returned_but_not_cached():
+    async def scenario():
+        redis = FakeRedis()
+        cache = CacheManager(redis)
+        loader = Loader(("timed out", 0), ("v1", 60))
+        first = await cache.get_or_refresh("key", loader)
+        second = await cache.get_or_refresh("key", loader)
+        return first, second
+
+    assert asyncio.run(scenario()) == ("timed out", "v1")
+
+
+def test_stale_value_is_served_while_one_refresh_runs():
+    async def scenario():
+        cache = CacheManager(FakeRedis())
+        loader = Loader(("v1", 60), ("v2", 60))
+        await cache.get_or_refresh("key", loader)
+        await cache.set_entry("key", "v1", -1)
+        stale = await asyncio.gather(*(cache.get_or_refresh("key", loader) for _ in range(3)))
+        await _settle()
+        return stale, await cache.get_or_refresh("key", loader), loader.calls, cache.stale_served
+
+    stale, fresh, calls, stale_served = asyncio.run(scenario())
+    assert stale == ["v1"] * 3
+    assert fresh == "v2"
+    assert calls == 2
+    assert stale_served == 3
+
+
+def test_failed_background_refresh_keeps_the_stale_value():
+    async def scenario():
+        cache = CacheManager(FakeRedis())
+        loader = Loader(ConnectionError("upstream down"), ("v2", 60))
+        await cache.set_entry("key", "v1", -1)
+        first = await cache.get_or_refresh("key", loader)
+        await _settle()
+        second = await cache.get_or_refresh("key", loader)
+        await _settle()
+        return first, second, await cache.get_or_refresh("key", loader), cache._refreshing
+
+    assert asyncio.run(scenario()) == ("v1", "v1", "v2", set())
+
+
+def test_entries_expire_after_the_stale_window():
+    async def scenario():
+        redis = FakeRedis()
+        cache = CacheManager(redis, stale_ttl=100)
+        await cache.set_entry("key", "v1", 60)
+        return redis.ttls["key"], unpack(redis.data["key"])[0]
+
+    assert asyncio.run(scenario()) == (160, "v1")
+
+
+def test_set_entries_writes_a_batch_with_one_invalidation():
+    async def scenario():
+        redis = FakeRedis()
+        cache = CacheManager(redis, stale_ttl=100)
+        await cache.set_entries([("a", {"x": 1}, 60), ("b", [2], 30)])
+        await cache.set_entries([])
+        return redis, cache
+
+    redis, cache = asyncio.run(scenario())
+    assert {key: unpack(redis.data[key])[0] for key in ("a", "b")} == {"a": {"x": 1}, "b": [2]}
+    assert redis.ttls == {"a": 160, "b": 130}
+    assert cache.local.get("b").value == [2]
+    assert [json.loads(message)["keys"] for _, message in redis.published] == [["a", "b"]]
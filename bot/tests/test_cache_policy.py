@@ -0,0 +1,63 @@
+import datetime
+
+from utils.cache_policy import (
+    CachePolicy,
+    GAME_STATUS_FINAL,
+    GAME_STATUS_LIVE,
+    GAME_STATUS_SCHEDULED,
+    seconds_until_et_hour,
+    seconds_until_next_et_day,
+    seconds_until_tipoff,
+)
+
+# 18:00 UTC is 14:00 EDT, ten hours before the ET day boundary.
+NOW = datetime.datetime(2025, 5, 15, 18, 0, tzinfo=datetime.timezone.utc)
+UNTIL_MIDNIGHT_ET = 10 * 3600
+
+
+def _game(status: int, tipoff: str = "2025-05-15T23:30:00Z") -> dict:
+    return {"gameStatus": status, "gameTimeUTC": tipoff}
+
+
+def test_seconds_until_next_et_day():
+    assert seconds_until_next_et_day(NOW) == UNTIL_MIDNIGHT_ET
+    just_before = datetime.datetime(2025, 5, 16, 3, 59, 59, 900000, tzinfo=datetime.timezone.utc)
+    assert seconds_until_next_et_day(just_before) == 1
+
+
+def test_seconds_until_et_hour():
+    assert seconds_until_et_hour(15, NOW) == 3600
+    assert seconds_until_et_hour(14, NOW) == 24 * 3600
+    assert seconds_until_et_hour(5, NOW) == 15 * 3600
+
+
+def test_seconds_until_tipoff():
+    assert seconds_until_tipoff(_game(GAME_STATUS_SCHEDULED), NOW) == 5.5 * 3600
+    assert seconds_until_tipoff({"gameStatus": GAME_STATUS_SCHEDULED}, NOW) is None
+    assert seconds_until_tipoff(_game(GAME_STATUS_SCHEDULED, "TBD"), NOW) is None
+
+
+def test_ttl_for_game():
+    policy = CachePolicy()
+    assert policy.ttl_for_game(None, NOW) == UNTIL_MIDNIGHT_ET
+    assert policy.ttl_for_game(_game(GAME_STATUS_FINAL), NOW) == UNTIL_MIDNIGHT_ET
+    assert policy.ttl_for_game(_game(GAME_STATUS_LIVE), NOW) == CachePolicy.LIVE_TTL
+    assert policy.ttl_for_game(_game(GAME_STATUS_SCHEDULED), NOW) == 5.5 * 3600
+    # Past tip-off but not yet marked live: treat it as live.
+    assert policy.ttl_for_game(_game(GAME_STATUS_SCHEDULED, "2025-05-15T17:00:00Z"), NOW) == \
+        CachePolicy.LIVE_TTL
+
+
+def test_poll_interval():
+    policy = CachePolicy(live_poll_interval=5.0)
+    assert policy.poll_interval([], NOW) == CachePolicy.IDLE_POLL_INTERVAL
+    assert policy.poll_interval([_game(GAME_STATUS_SCHEDULED)], NOW) == CachePolicy.IDLE_POLL_INTERVAL
+    soon = _game(GAME_STATUS_SCHEDULED, "2025-05-15T18:10:00Z")
+    assert policy.poll_interval([_game(GAME_STATUS_FINAL), soon], NOW) == \
+        CachePolicy.PREGAME_POLL_INTERVAL
+    assert policy.poll_interval([soon, _game(GAME_STATUS_LIVE)], NOW) == 5.0
+
+
+def test_poll_interval_never_sleeps_past_the_day_boundary():
+    late = datetime.datetime(2025, 5, 16, 3, 59, 0, tzinfo=datetime.timezone.utc)
+    assert CachePolicy().poll_interval([], late) == 61
@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from utils.career import CareerStats, compact_career, parse_season, season_label, split_season
+from utils.stats_formatter import format_career
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+TRADED = [
+    [2017, "MIA", 30, 833, 154, 101, 262, 550],
+    [2017, "LAL", 44, 1089, 263, 186, 369, 718],
+]
+COMBINED = [2017, "TOT", 74, 1922, 417, 287, 631, 1268]
+
+
+def _career() -> CareerStats:
+    payload = json.loads((FIXTURES / "career.json").read_text())
+    return CareerStats.from_compact(compact_career(payload))
+
+
+def _totals(line) -> tuple[int, ...]:
+    return line.gp, line.pts, line.reb, line.ast, line.fgm, line.fga
+
+
+@pytest.mark.parametrize("rows", [[COMBINED, *TRADED], [*TRADED, COMBINED]])
+def test_combined_row_replaces_team_rows(rows):
+    (line,) = CareerStats._seasons(rows)
+    assert line.teams == ["MIA", "LAL"]
+    assert _totals(line) == (74, 1922, 417, 287, 631, 1268)
+
+
+def test_team_rows_are_summed_without_combined_row():
+    rows = [[2017, "MIA", 30, 800, 150, 100, 260, 550], [2017, "LAL", 40, 1000, 250, 180, 360, 700]]
+    (line,) = CareerStats._seasons(rows)
+    assert _totals(line) == (70, 1800, 400, 280, 620, 1250)
+
+
+def test_seasons_are_sorted():
+    rows = [[2019, "LAL", 1, 0, 0, 0, 0, 0], [2018, "LAL", 1, 0, 0, 0, 0, 0]]
+    assert [line.season for line in CareerStats._seasons(rows)] == [2018, 2019]
+
+
+def test_compact_career_fixture_totals():
+    career = _career()
+    regular, playoffs = career.total(career.regular), career.total(career.playoffs)
+    assert (regular.gp, regular.pts) == (936, 22257)
+    assert playoffs.gp == 116
+
+
+def test_compact_career_without_playoffs():
+    payload = {"resultSets": [{
+        "name": "SeasonTotalsRegularSeason",
+        "headers": ["SEASON_ID", "TEAM_ABBREVIATION", "GP", "PTS", "REB", "AST", "FGM", "FGA"],
+        "rowSet": [["2024-25", "LAL", 70, 1710, None, 600, 640, 1250]],
+    }]}
+    assert compact_career(payload) == {
+        "regular": [[2024, "LAL", 70, 1710, 0, 600, 640, 1250]], "playoffs": []}
+
+
+def test_season_label():
+    assert season_label(2017) == "2017-18"
+    assert season_label(1999) == "1999-00"
+
+
+@pytest.mark.parametrize("text, season", [
+    ("2017-18", 2017), ("2017-2018", 2017), ("17-18", 2017), ("99-00", 1999),
+    ("1999-2000", 1999), ("2018", 2017), ("18", None), ("2017-19", None), ("abc", None),
+])
+def test_parse_season(text, season):
+    assert parse_season(text) == season
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("LeBron James 2017-18", ("LeBron James", 2017)),
+    ("LeBron 2018", ("LeBron", 2017)),
+    ("KD 99-00", ("KD", 1999)),
+    ("LeBron 2017-19", ("LeBron 2017-19", None)),
+    ("LeBron James", ("LeBron James", None)),
+    ("2018", ("2018", None)),
+])
+def test_split_season(text, expected):
+    assert split_season(text) == expected
+
+
+def test_format_career_totals_with_playoffs():
+    assert format_career("Jimmy", _career()) == (
+        "Jimmy: 23.8 PTS, 6.8 REB, 5.4 AST, 47.2% FG"
+        " | Playoffs: 22.9 PTS, 6.7 REB, 6.1 AST, 48.4% FG")
+
+
+def test_format_career_season():
+    assert format_career("Jimmy", _career(), 2017) == \
+        "Jimmy 2017-18 (MIA/LAL): 26.0 PTS, 5.6 REB, 3.9 AST, 49.8% FG in 74 GP"
+    assert format_career("Jimmy", _career(), 2012).endswith(
+        "in 55 GP | Playoffs: 23.1 PTS, 6.7 REB, 6.4 AST, 49.7% FG")
+
+
+def test_format_career_without_data():
+    assert format_career("Jimmy", _career(), 1990) == "Jimmy did not play in 1990-91."
+    assert format_career("Jimmy", CareerStats([], [])) == "No career data available."
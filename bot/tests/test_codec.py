@@ -0,0 +1,36 @@
+import zlib
+
+import msgpack
+import pytest
+
+from utils import codec
+
+PAYLOAD = {"gameId": "0022400001", "scores": [101, 99], "final": True,
+           "note": "Jokić", "raw": b"\x00\x01", "nested": {"period": 4}}
+
+
+def test_round_trip():
+    assert codec.unpack(codec.pack(PAYLOAD)) == PAYLOAD
+
+
+def test_round_trip_with_zlib(monkeypatch):
+    monkeypatch.setattr(codec, "_zstd_compressor", None)
+    data = codec.pack(PAYLOAD)
+    assert data[:1] == codec._ZLIB
+    assert codec.unpack(data) == PAYLOAD
+
+
+def test_zlib_payload_is_readable_with_zstd_installed():
+    data = codec._ZLIB + zlib.compress(msgpack.packb(PAYLOAD, use_bin_type=True))
+    assert codec.unpack(data) == PAYLOAD
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        codec.unpack(b"x" + b"payload")
+
+
+def test_payload_key_is_versioned():
+    assert codec.payload_key("boxscore", "0022400001") == \
+        f"nba:v{codec.PAYLOAD_VERSION}:boxscore:0022400001"
+    assert codec.payload_key("career", 2544, 2017) == f"nba:v{codec.PAYLOAD_VERSION}:career:2544:2017"
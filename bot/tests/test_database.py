@@ -0,0 +1,254 @@
+import asyncio
+from types import SimpleNamespace
+
+from managers.database import DatabaseManager
+from managers.shard import ShardManager, owner_of
+from managers.websocket import WebSocketManager
+from tests.fakes import FakeRedis, FakeTwitchBot
+from utils.keyword_handler import KeywordHandler
+
+
+class FakeQuery:
+    """
+    Records the filters of a chained Supabase query and answers range() from rows.
+    """
+
+    def __init__(self, client: "FakeSupabase", rows: list[dict]):
+        self.client = client
+        self.rows = rows
+        self.filters: dict = {}
+
+    def select(self, columns: str, count: str | None = None) -> "FakeQuery":
+        return self
+
+    def eq(self, column: str, value) -> "FakeQuery":
+        self.filters[column] = value
+        return self
+
+    def order(self, column: str) -> "FakeQuery":
+        self.rows = sorted(self.rows, key=lambda row: row[column] or "")
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.bounds = (start, end)
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        self.client.ranges.append(self.bounds)
+        rows = [row for row in self.rows
+                if all(row.get(column) == value for column, value in self.filters.items())]
+        start, end = self.bounds
+        return SimpleNamespace(data=rows[start:end + 1], count=len(rows))
+
+
+class FakeSupabase:
+    def __init__(self, rows: list[dict], keywords: list[dict] | None = None):
+        self.tables = {"channels": rows, "keywords": keywords or []}
+        self.ranges: list[tuple[int, int]] = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, self.tables[name])
+
+
+class RateLimited(Exception):
+    status = 429
+
+
+class FakeWebSocketManager:
+    def __init__(self, errors: dict[str, list[Exception]] | None = None):
+        self.errors = errors or {}
+        self.attempts: list[str] = []
+        self.subscribed: list[str] = []
+        self.unsubscribed: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def subscribe(self, broadcaster_user_id: str) -> None:
+        self.attempts.append(broadcaster_user_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            pending = self.errors.get(broadcaster_user_id)
+            if pending:
+                raise pending.pop(0)
+            self.subscribed.append(broadcaster_user_id)
+        finally:
+            self.in_flight -= 1
+
+    async def unsubscribe(self, broadcaster_user_id: str) -> None:
+        self.unsubscribed.append(broadcaster_user_id)
+
+
+def _channels(count: int) -> list[dict]:
+    return [{"broadcaster_user_id": f"{i:05d}", "is_active": True} for i in range(count)]
+
+
+def _manager(rows: list[dict], websocket_manager: FakeWebSocketManager,
+             shard_manager: ShardManager | None = None,
+             redis: FakeRedis | None = None) -> DatabaseManager:
+    manager = DatabaseManager(FakeSupabase(rows), websocket_manager, shard_manager,
+                              redis_manager=redis)
+    manager.PAGE_SIZE = 10
+    manager.BASE_BACKOFF = 0
+    return manager
+
+
+def test_init_pages_through_active_channels():
+    rows = _channels(25) + [{"broadcaster_user_id": "inactive", "is_active": False},
+                            {"broadcaster_user_id": None, "is_active": True}]
+    websocket_manager = FakeWebSocketManager()
+    manager = _manager(rows, websocket_manager)
+    asyncio.run(manager.init())
+    assert manager.supabase_client.ranges == [(0, 9), (10, 19), (20, 29)]
+    assert sorted(websocket_manager.subscribed) == [row["broadcaster_user_id"] for row in _channels(25)]
+
+
+def test_init_caps_subscriptions_in_flight():
+    websocket_manager = FakeWebSocketManager()
+    manager = _manager(_channels(30), websocket_manager)
+    manager.SUBSCRIBE_CONCURRENCY = 4
+    asyncio.run(manager.init())
+    assert len(websocket_manager.subscribed) == 30
+    assert websocket_manager.peak == 4
+
+
+def test_only_rate_limited_subscriptions_are_retried():
+    websocket_manager = FakeWebSocketManager({
+        "00000": [RateLimited(), RateLimited()],
+        "00001": [ValueError("unknown broadcaster")],
+    })
+    manager = _manager(_channels(3), websocket_manager)
+    asyncio.run(manager.init())
+    assert websocket_manager.attempts.count("00000") == 3
+    assert websocket_manager.attempts.count("00001") == 1
+    assert sorted(websocket_manager.subscribed) == ["00000", "00002"]
+
+
+def test_retries_are_bounded():
+    websocket_manager = FakeWebSocketManager({"00000": [RateLimited()] * 10})
+    manager = _manager(_channels(1), websocket_manager)
+    manager.MAX_RETRIES = 2
+    asyncio.run(manager.init())
+    assert websocket_manager.attempts == ["00000"] * 3
+    assert websocket_manager.subscribed == []
+
+
+def _shard(worker_id: str, workers: tuple[str, ...]) -> ShardManager:
+    shard = ShardManager(FakeRedis(), worker_id)
+    shard.workers = workers
+    return shard
+
+
+def _owned(worker_id: str, workers: tuple[str, ...], rows: list[dict]) -> list[str]:
+    return sorted(row["broadcaster_user_id"] for row in rows
+                  if owner_of(row["broadcaster_user_id"], workers) == worker_id)
+
+
+def test_init_subscribes_only_owned_channels():
+    rows = _channels(40)
+    websocket_manager = FakeWebSocketManager()
+    manager = _manager(rows, websocket_manager, _shard("a", ("a", "b")))
+    asyncio.run(manager.init())
+    assert sorted(websocket_manager.subscribed) == _owned("a", ("a", "b"), rows)
+    assert 0 < len(websocket_manager.subscribed) < 40
+
+
+def test_rebalance_moves_only_gained_and_lost_channels():
+    rows = _channels(40)
+    websocket_manager = FakeWebSocketManager()
+    manager = _manager(rows, websocket_manager, _shard("a", ("a", "b", "c")))
+    asyncio.run(manager.rebalance(("a", "b"), ("a", "c")))
+
+    before, after = set(_owned("a", ("a", "b"), rows)), set(_owned("a", ("a", "c"), rows))
+    assert sorted(websocket_manager.subscribed) == sorted(after - before)
+    assert sorted(websocket_manager.unsubscribed) == sorted(before - after)
+
+
+def test_change_events_for_other_shards_are_ignored():
+    rows = _channels(40)
+    mine, theirs = _owned("a", ("a", "b"), rows)[0], _owned("b", ("a", "b"), rows)[0]
+    websocket_manager = FakeWebSocketManager()
+    manager = _manager(rows, websocket_manager, _shard("a", ("a", "b")))
+
+    async def scenario():
+        for channel, active in ((mine, True), (theirs, True), (mine, False)):
+            await manager.on_change(
+                {"data": {"record": {"broadcaster_user_id": channel, "is_active": active}}})
+
+    asyncio.run(scenario())
+    assert websocket_manager.subscribed == [mine]
+    assert websocket_manager.unsubscribed == [mine]
+
+
+def test_reconcile_fixes_drift_in_batches():
+    bot = FakeTwitchBot()
+    websocket_manager = WebSocketManager(bot)
+    rows = _channels(5)
+    manager = _manager(rows, websocket_manager)
+    manager.RECONCILE_BATCH_SIZE = 2
+
+    async def scenario():
+        for channel in ("00000", "00001", "stale"):
+            await websocket_manager.subscribe(channel)
+        # A revocation was missed: Twitch dropped 00001 without telling us.
+        del bot.live["sub-00001"]
+        bot.subscribe_calls.clear()
+        await manager.reconcile()
+
+    asyncio.run(scenario())
+    assert sorted(bot.subscribe_calls) == ["00001", "00002", "00003", "00004"]
+    assert bot.deleted == ["sub-stale"]
+    assert websocket_manager.subscribed() == {row["broadcaster_user_id"] for row in rows}
+
+
+def test_reconcile_is_a_no_op_without_drift():
+    bot = FakeTwitchBot()
+    websocket_manager = WebSocketManager(bot)
+    manager = _manager(_channels(3), websocket_manager)
+
+    async def scenario():
+        await manager.init()
+        bot.subscribe_calls.clear()
+        await manager.reconcile()
+
+    asyncio.run(scenario())
+    assert bot.subscribe_calls == [] and bot.deleted == []
+
+
+def test_load_keywords_pages_through_every_channel():
+    keywords = [{"broadcaster_user_id": str(i % 3), "keyword": f"kw{i:02d}", "response": f"r{i}"}
+                for i in range(25)]
+    handler = KeywordHandler()
+    manager = DatabaseManager(FakeSupabase([], keywords), FakeWebSocketManager(),
+                              keyword_handler=handler)
+    manager.PAGE_SIZE = 10
+    asyncio.run(manager.load_keywords())
+    assert manager.supabase_client.ranges == [(0, 9), (10, 19), (20, 29)]
+    assert set(handler._matchers) == {"0", "1", "2"}
+    assert handler.get_response("kw07", "1") == "r7"
+
+
+def test_restart_subscribes_from_remembered_channels():
+    rows = _channels(40)
+    redis = FakeRedis()
+    asyncio.run(_manager(rows, FakeWebSocketManager(), _shard("a", ("a", "b")), redis).init())
+
+    websocket_manager = FakeWebSocketManager()
+    manager = DatabaseManager(None, websocket_manager, _shard("b", ("a", "b")),
+                              redis_manager=redis)
+    assert asyncio.run(manager.subscribe_cached()) is True
+    assert sorted(websocket_manager.subscribed) == _owned("b", ("a", "b"), rows)
+
+
+def test_nothing_remembered_falls_back_to_init():
+    manager = DatabaseManager(None, FakeWebSocketManager(), redis_manager=FakeRedis())
+    assert asyncio.run(manager.subscribe_cached()) is False
+    assert asyncio.run(DatabaseManager(None, FakeWebSocketManager()).subscribe_cached()) is False
+
+
+def test_rebalance_before_connect_is_deferred():
+    websocket_manager = FakeWebSocketManager()
+    manager = DatabaseManager(None, websocket_manager, _shard("a", ("a", "b")))
+    asyncio.run(manager.rebalance(("a",), ("a", "b")))
+    assert websocket_manager.subscribed == [] and websocket_manager.unsubscribed == []
@@ -0,0 +1,151 @@
+import asyncio
+from types import SimpleNamespace
+
+from managers.follow import FollowManager
+from managers.scoreboard import LivePlayerIndex, ScoreboardSnapshot
+from utils.cache_policy import GAME_STATUS_LIVE, GAME_STATUS_SCHEDULED
+
+LAL, BOS, DEN = 1610612747, 1610612738, 1610612743
+
+
+class FakeScoreboard:
+    def __init__(self):
+        self.listeners = []
+
+    def add_snapshot_listener(self, callback) -> None:
+        self.listeners.append(callback)
+
+
+class FakeDatabase:
+    def __init__(self, failing: bool = False):
+        self.failing = failing
+        self.added: list[tuple[str, int]] = []
+        self.removed: list[tuple[str, int]] = []
+
+    async def add_follow(self, broadcaster_user_id: str, team_id: int) -> None:
+        if self.failing:
+            raise RuntimeError("database down")
+        self.added.append((broadcaster_user_id, team_id))
+
+    async def remove_follow(self, broadcaster_user_id: str, team_id: int) -> None:
+        self.removed.append((broadcaster_user_id, team_id))
+
+
+class FakeOutbound:
+    def __init__(self):
+        self.sent: list[tuple[str, str]] = []
+
+    def send(self, broadcaster, message: str) -> None:
+        self.sent.append((broadcaster.id, message))
+
+
+class FakeBot:
+    def __init__(self, subscribed: set[str], database: FakeDatabase | None = None):
+        self.database_manager = database or FakeDatabase()
+        self.outbound_manager = FakeOutbound()
+        self.websocket_manager = SimpleNamespace(subscribed=lambda: set(subscribed))
+
+    def create_partialuser(self, user_id: str) -> SimpleNamespace:
+        return SimpleNamespace(id=user_id)
+
+
+def _manager(subscribed: set[str] = frozenset(), database: FakeDatabase | None = None,
+             max_follows: int = 5) -> tuple[FollowManager, FakeBot, FakeScoreboard]:
+    bot = FakeBot(subscribed, database)
+    scoreboard = FakeScoreboard()
+    return FollowManager(bot, scoreboard, max_follows), bot, scoreboard
+
+
+def _snapshot(status: int, period: int = 0) -> ScoreboardSnapshot:
+    game = {
+        "gameId": "0022500101", "gameStatus": status, "gameStatusText": "",
+        "period": period, "gameClock": "PT11M40.00S",
+        "awayTeam": {"teamId": LAL, "teamTricode": "LAL", "score": 0},
+        "homeTeam": {"teamId": BOS, "teamTricode": "BOS", "score": 0},
+    }
+    return ScoreboardSnapshot(games=(game,), boxscores={}, schedule="",
+                              players=LivePlayerIndex({}))
+
+
+def test_load_replaces_follows_and_skips_incomplete_rows():
+    manager, _, _ = _manager()
+    manager.follow("9", DEN)
+    manager.load([
+        {"broadcaster_user_id": "1", "team_id": LAL},
+        {"broadcaster_user_id": "1", "team_id": BOS},
+        {"broadcaster_user_id": "2", "team_id": None},
+    ])
+    assert manager.following("1") == {LAL, BOS}
+    assert manager.following("2") == set()
+    assert manager.following("9") == set()
+
+
+def test_follow_team_stores_and_lists_the_follow():
+    manager, bot, _ = _manager()
+    reply = asyncio.run(manager.follow_team("1", "Lakers"))
+    assert reply.startswith("Following the Los Angeles Lakers")
+    assert bot.database_manager.added == [("1", LAL)]
+    assert asyncio.run(manager.follow_team("1", None)) == \
+        "This channel follows: Los Angeles Lakers."
+    assert asyncio.run(manager.follow_team("1", "Lakers")) == \
+        "This channel already follows the Los Angeles Lakers."
+
+
+def test_unknown_and_ambiguous_teams_are_rejected():
+    manager, bot, _ = _manager()
+    assert asyncio.run(manager.follow_team("1", "Zzyzx")) == "Team not found: Zzyzx"
+    reply = asyncio.run(manager.follow_team("1", "Los Angeles"))
+    assert reply.startswith("Los Angeles is ambiguous: ")
+    assert reply.endswith("Los Angeles Clippers, Los Angeles Lakers.")
+    assert bot.database_manager.added == []
+
+
+def test_unknown_followed_team_ids_are_skipped_in_the_list():
+    manager, _, _ = _manager()
+    manager.load([
+        {"broadcaster_user_id": "1", "team_id": LAL},
+        {"broadcaster_user_id": "1", "team_id": 1},
+        {"broadcaster_user_id": "2", "team_id": 2},
+    ])
+    assert asyncio.run(manager.follow_team("1", None)) == \
+        "This channel follows: Los Angeles Lakers."
+    assert asyncio.run(manager.follow_team("2", None)).startswith(
+        "This channel does not follow any team.")
+
+
+def test_follow_team_enforces_the_limit():
+    manager, bot, _ = _manager(max_follows=1)
+    manager.follow("1", BOS)
+    reply = asyncio.run(manager.follow_team("1", "Lakers"))
+    assert reply.startswith("This channel already follows 1 teams.")
+    assert bot.database_manager.added == []
+
+
+def test_failed_store_does_not_follow():
+    manager, _, _ = _manager(database=FakeDatabase(failing=True))
+    reply = asyncio.run(manager.follow_team("1", "Lakers"))
+    assert reply == "Could not save the follow. Please try again shortly."
+    assert manager.following("1") == set()
+
+
+def test_unfollow_team():
+    manager, bot, _ = _manager()
+    manager.follow("1", LAL)
+    assert asyncio.run(manager.unfollow_team("1", "Lakers")) == "Unfollowed the Los Angeles Lakers."
+    assert bot.database_manager.removed == [("1", LAL)]
+    assert manager.following("1") == set()
+    assert asyncio.run(manager.unfollow_team("1", "Lakers")) == \
+        "This channel does not follow the Los Angeles Lakers."
+
+
+def test_events_go_to_subscribed_followers_of_either_team():
+    manager, bot, scoreboard = _manager(subscribed={"1", "2", "3"})
+    manager.follow("1", LAL)
+    manager.follow("2", BOS)
+    manager.follow("3", DEN)
+    manager.follow("4", LAL)  # Subscribed on another worker.
+
+    listener, = scoreboard.listeners
+    asyncio.run(listener(_snapshot(GAME_STATUS_SCHEDULED), _snapshot(GAME_STATUS_LIVE, 1)))
+    assert sorted(bot.outbound_manager.sent) == [
+        ("1", "Tip-off: LAL @ BOS"), ("2", "Tip-off: LAL @ BOS")]
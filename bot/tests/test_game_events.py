@@ -0,0 +1,114 @@
+from managers.scoreboard import LivePlayerIndex, ScoreboardSnapshot
+from utils.cache_policy import GAME_STATUS_FINAL, GAME_STATUS_LIVE, GAME_STATUS_SCHEDULED
+from utils.game_events import GameDiffer, period_name
+
+GAME_ID = "0022500101"
+LAL, BOS = 1610612747, 1610612738
+
+
+def _game(status: int, away: int = 0, home: int = 0, period: int = 0,
+          clock: str = "", text: str = "") -> dict:
+    return {
+        "gameId": GAME_ID,
+        "gameStatus": status,
+        "gameStatusText": text,
+        "period": period,
+        "gameClock": clock,
+        "awayTeam": {"teamId": LAL, "teamTricode": "LAL", "score": away},
+        "homeTeam": {"teamId": BOS, "teamTricode": "BOS", "score": home},
+    }
+
+
+def _player(points: int, rebounds: int = 0, assists: int = 0) -> dict:
+    return {"personId": 2544, "name": "LeBron James", "familyName": "James",
+            "statistics": {"points": points, "reboundsTotal": rebounds, "assists": assists,
+                           "steals": 0, "blocks": 0}}
+
+
+def _snapshot(game: dict, player: dict | None = None) -> ScoreboardSnapshot:
+    boxscores = {}
+    if player is not None:
+        boxscores[GAME_ID] = {
+            "awayTeam": {"teamTricode": "LAL", "players": [player]},
+            "homeTeam": {"teamTricode": "BOS", "players": []},
+        }
+    return ScoreboardSnapshot(games=(game,), boxscores=boxscores, schedule="",
+                              players=LivePlayerIndex(boxscores))
+
+
+def _events(differ: GameDiffer, previous, current) -> list[tuple[str, str]]:
+    return [(event.kind, event.text) for event in differ.diff(previous, current)]
+
+
+def testperiod_name():
+    assert [period_name(period) for period in (1, 4, 5, 6)] == ["Q1", "Q4", "OT", "2OT"]
+
+
+def test_first_refresh_yields_nothing():
+    assert GameDiffer().diff(None, _snapshot(_game(GAME_STATUS_LIVE, 10, 2, 1))) == []
+
+
+def test_tipoff():
+    previous = _snapshot(_game(GAME_STATUS_SCHEDULED))
+    current = _snapshot(_game(GAME_STATUS_LIVE, period=1, clock="PT11M40.00S"))
+    events = GameDiffer().diff(previous, current)
+    assert [(event.kind, event.text) for event in events] == [("tipoff", "Tip-off: LAL @ BOS")]
+    assert events[0].team_ids == (LAL, BOS)
+
+
+def test_lead_change_survives_a_tie_in_between():
+    differ = GameDiffer()
+    first = _snapshot(_game(GAME_STATUS_LIVE, 10, 8, 1, "PT05M00.00S", "Q1 5:00"))
+    tied = _snapshot(_game(GAME_STATUS_LIVE, 10, 10, 1, "PT04M00.00S", "Q1 4:00"))
+    flipped = _snapshot(_game(GAME_STATUS_LIVE, 10, 12, 1, "PT03M00.00S", "Q1 3:00"))
+    differ.diff(None, first)
+    assert _events(differ, first, tied) == []
+    assert _events(differ, tied, flipped) == [
+        ("lead_change", "Lead change: BOS lead LAL 10 - BOS 12 (Q1 3:00)")]
+    assert _events(differ, flipped, flipped) == []
+
+
+def test_period_end_and_halftime():
+    differ = GameDiffer()
+    q1 = _snapshot(_game(GAME_STATUS_LIVE, 20, 20, 1, "PT00M05.00S"))
+    end_q1 = _snapshot(_game(GAME_STATUS_LIVE, 22, 20, 1, "PT00M00.00S"))
+    q2 = _snapshot(_game(GAME_STATUS_LIVE, 40, 40, 2, "PT00M10.00S"))
+    half = _snapshot(_game(GAME_STATUS_LIVE, 40, 40, 2, "", "Halftime"))
+    assert _events(differ, q1, end_q1) == [("period_end", "End of Q1: LAL 22 - BOS 20")]
+    assert _events(differ, end_q1, q2) == []
+    assert _events(differ, q2, half) == [("period_end", "Halftime: LAL 40 - BOS 40")]
+
+
+def test_final_fires_once():
+    differ = GameDiffer()
+    live = _snapshot(_game(GAME_STATUS_LIVE, 100, 98, 4, "PT00M01.00S"))
+    final = _snapshot(_game(GAME_STATUS_FINAL, 102, 98, 4))
+    assert _events(differ, live, final) == [("final", "Final: LAL 102 - BOS 98")]
+    assert _events(differ, final, final) == []
+
+
+def test_milestone_fires_when_first_reached():
+    differ = GameDiffer()
+    game = _game(GAME_STATUS_LIVE, 80, 70, 3, "PT05M00.00S")
+    before = _snapshot(game, _player(29, 9, 9))
+    after = _snapshot(game, _player(31, 10, 10))
+    assert _events(differ, before, after) == [
+        ("milestone", "LeBron James (LAL): 31 PTS, 10 REB, 10 AST - triple-double")]
+    assert _events(differ, after, _snapshot(game, _player(33, 10, 10))) == []
+
+
+def test_previous_row_without_statistics_has_reached_nothing():
+    differ = GameDiffer()
+    game = _game(GAME_STATUS_LIVE, 80, 70, 3, "PT05M00.00S")
+    before = _snapshot(game, {"personId": 2544, "name": "LeBron James", "familyName": "James"})
+    after = _snapshot(game, _player(40))
+    assert _events(differ, before, after) == [
+        ("milestone", "LeBron James (LAL): 40 PTS, 0 REB, 0 AST - 40 PTS")]
+
+
+def test_unchanged_box_score_is_not_rescanned():
+    differ = GameDiffer()
+    previous = _snapshot(_game(GAME_STATUS_FINAL, 102, 98, 4), _player(45))
+    current = ScoreboardSnapshot(games=previous.games, boxscores=previous.boxscores,
+                                 schedule="", players=previous.players)
+    assert differ.diff(previous, current) == []
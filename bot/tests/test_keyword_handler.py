@@ -0,0 +1,108 @@
+import pytest
+
+from utils import keyword_handler
+from utils.keyword_handler import DEFAULT_KEYWORDS, KeywordHandler, KeywordMatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(keyword_handler, "time", clock)
+    return clock
+
+
+def _row(channel: str, keyword: str, response: str) -> dict:
+    return {"broadcaster_user_id": channel, "keyword": keyword, "response": response}
+
+
+def test_matches_anywhere_ignoring_case():
+    matcher = KeywordMatcher({"Lakers": ("a",), "celtics": ("b",)})
+    assert matcher.match("go LAKERS go") == "lakers"
+    assert matcher.match("celticsfan") == "celtics"
+    assert matcher.match("nothing here") is None
+
+
+def test_longest_keyword_wins_on_shared_prefix():
+    matcher = KeywordMatcher({"lake": ("a",), "lakers": ("b",), "la": ("c",)})
+    assert matcher.match("lakers in 5") == "lakers"
+    assert matcher.match("lake show") == "lake"
+    assert matcher.match("la clippers") == "la"
+
+
+def test_keywords_are_escaped():
+    matcher = KeywordMatcher({"c++": ("a",), "a.b": ("b",)})
+    assert matcher.match("I write c++") == "c++"
+    assert matcher.match("axb") is None
+
+
+def test_case_variants_map_back_to_their_keyword():
+    matcher = KeywordMatcher({"kings": ("a",), "lakers": ("b",)})
+    assert matcher.match("KİNGS win") == "kings"
+    assert matcher.match("lakerſ") == "lakers"
+
+
+def test_case_variants_get_a_response(clock):
+    handler = KeywordHandler()
+    handler.load([_row("1", "kings", "Sactown")])
+    assert handler.get_response("KİNGS win", "1") == "Sactown"
+    assert handler.get_response("lakerſ", "2") in DEFAULT_KEYWORDS["lakers"]
+
+
+def test_empty_matcher_matches_nothing():
+    assert KeywordMatcher({" ": ("a",), "x": ()}).match("x") is None
+
+
+def test_commands_are_ignored(clock):
+    handler = KeywordHandler()
+    assert handler.get_response("  !score lakers", "1") is None
+    assert handler.get_response("lakers", "1") in DEFAULT_KEYWORDS["lakers"]
+
+
+def test_cooldown_starts_only_on_a_match(clock):
+    handler = KeywordHandler(duration=60.0)
+    assert handler.get_response("hello", "1") is None
+    assert not handler.cooldowns
+    assert handler.get_response("lakers", "1") is not None
+    assert handler.get_response("lakers", "1") is None
+    assert handler.get_response("lakers", "2") is not None
+    clock.now += 61.0
+    assert handler.get_response("lakers", "1") is not None
+
+
+def test_expired_cooldowns_are_evicted(clock):
+    handler = KeywordHandler(duration=60.0)
+    handler.get_response("lakers", "1")
+    clock.now += 61.0
+    handler.get_response("lakers", "2")
+    assert list(handler.cooldowns) == ["2"]
+
+
+def test_cooldown_table_is_capped(clock):
+    handler = KeywordHandler(max_cooldowns=2)
+    for channel in ("1", "2", "3"):
+        handler.get_response("lakers", channel)
+    assert list(handler.cooldowns) == ["2", "3"]
+
+
+def test_channel_keywords_extend_defaults(clock):
+    handler = KeywordHandler()
+    handler.load([
+        _row("1", " Nuggets ", "Joker!"),
+        _row("1", "lakers", "Custom"),
+        _row("2", "", "ignored"),
+        _row("3", "spurs", None),
+    ])
+    assert handler.get_response("nuggets win", "1") == "Joker!"
+    assert handler.get_response("lakers", "1") is None
+    clock.now += 61.0
+    assert handler.get_response("lakers", "1") == "Custom"
+    assert handler.get_response("nuggets", "2") is None
+    assert set(handler._matchers) == {"1"}
@@ -0,0 +1,52 @@
+from managers.scoreboard import LivePlayerIndex, PlayerRef
+from utils.text import normalize_name
+
+
+def _player(person_id: int, name: str, family_name: str | None = None) -> dict:
+    player = {"personId": person_id, "name": name}
+    if family_name:
+        player["familyName"] = family_name
+    return player
+
+
+BOXSCORES = {
+    "001": {
+        "awayTeam": {"players": [_player(203999, "Nikola Jokić", "Jokić"),
+                                 _player(1, "Jaren Jackson Jr.", "Jackson Jr.")]},
+        "homeTeam": {"players": [_player(2, "Reggie Jackson", "Jackson")]},
+    },
+    "002": {
+        "awayTeam": {"players": [_player(3, "Jalen Williams")]},
+        "homeTeam": {"players": [_player(4, "Jaylin Williams")]},
+    },
+}
+
+
+def test_normalize_name():
+    assert normalize_name(" Nikola  Jokić. ") == "nikola jokic"
+    assert normalize_name("Shai Gilgeous-Alexander") == "shai gilgeous alexander"
+    assert normalize_name("D'Angelo Russell") == "dangelo russell"
+
+
+def test_lookup_by_full_name_ignores_accents_and_case():
+    index = LivePlayerIndex(BOXSCORES)
+    assert index.lookup("NIKOLA JOKIC") == [PlayerRef("001", "awayTeam", 0)]
+
+
+def test_lookup_by_person_id():
+    index = LivePlayerIndex(BOXSCORES)
+    assert index.lookup(" 203999 ") == [PlayerRef("001", "awayTeam", 0)]
+    assert index.lookup("42") == []
+
+
+def test_lookup_without_suffix():
+    index = LivePlayerIndex(BOXSCORES)
+    assert index.lookup("Jaren Jackson") == [PlayerRef("001", "awayTeam", 1)]
+
+
+def test_lookup_by_last_name():
+    index = LivePlayerIndex(BOXSCORES)
+    assert index.lookup("jokic") == [PlayerRef("001", "awayTeam", 0)]
+    assert set(index.lookup("Williams")) == {PlayerRef("002", "awayTeam", 0),
+                                             PlayerRef("002", "homeTeam", 0)}
+    assert index.lookup("Curry") == []
@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+
+from benchmarks import loadsim
+from benchmarks.fakes import build_nba_stack
+
+
+def _args(**overrides) -> argparse.Namespace:
+    args = dict(channels=20, rate=40, step=0.5, ramp=False, steps=1, slo=2.0,
+                burst_every=0.0, burst_channels=2, burst_size=3, churn=0.0,
+                upstream_latency=0.0, send_latency=0.0, channel_limit=100,
+                global_limit=7500, drain=0.5, seed=1, output=None)
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_fake_supabase_pages_channels():
+    supabase = loadsim.FakeSupabase([str(i) for i in range(5)])
+    response = supabase.table("channels").select("broadcaster_user_id").eq(
+        "is_active", True).order("broadcaster_user_id").range(2, 3).execute()
+    assert [row["broadcaster_user_id"] for row in response.data] == ["2", "3"]
+    assert response.count == 5
+
+
+def test_sim_bot_subscriptions_round_trip_through_the_websocket_manager():
+    async def scenario():
+        stack = build_nba_stack()
+        bot = loadsim.SimBot(stack, ["1"], channel_limit=100, global_limit=20, send_latency=0.0)
+        try:
+            await bot.websocket_manager.subscribe("1")
+            subscribed = bot.websocket_manager.subscribed()
+            await bot.websocket_manager.unsubscribe("1")
+            return subscribed, bot.websocket_subscriptions()
+        finally:
+            await stack.standings.close()
+            stack.transport.close()
+
+    subscribed, live = asyncio.run(scenario())
+    assert subscribed == {"1"}
+    assert live == {}
+
+
+def test_percentile_handles_small_samples():
+    assert loadsim._percentile([], 99) is None
+    assert loadsim._percentile([0.25], 50) == 0.25
+
+
+def test_simulation_step_subscribes_and_injects():
+    results = asyncio.run(loadsim.simulate(_args(burst_every=0.1)))
+    assert len(results) == 1
+    step = results[0]
+    assert step["subscribed_channels"] == 20
+    assert step["injected"] > 0
+    assert step["replies"] > 0
+    assert step["dropped"] == 0
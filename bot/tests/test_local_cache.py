@@ -0,0 +1,64 @@
+import time
+
+from managers.cache import LocalCache
+
+
+def test_get_returns_stored_value():
+    cache = LocalCache(max_bytes=1 << 20)
+    cache.set("key", {"a": 1}, ttl=60)
+    assert cache.get("key") == {"a": 1}
+    assert cache.get("missing") is None
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    cache = LocalCache(max_bytes=1 << 20)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("key", "value", ttl=10)
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_non_positive_ttl_is_not_stored():
+    cache = LocalCache(max_bytes=1 << 20)
+    cache.set("key", "value", ttl=0)
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = LocalCache(max_bytes=300)
+    cache.set("a", "x", ttl=60, size=100)
+    cache.set("b", "x", ttl=60, size=100)
+    cache.set("c", "x", ttl=60, size=100)
+    cache.get("a")
+    cache.set("d", "x", ttl=60, size=100)
+    assert cache.get("b") is None
+    assert cache.get("a") == "x"
+    assert cache.size == 300
+
+
+def test_oversized_value_is_not_stored():
+    cache = LocalCache(max_bytes=100)
+    cache.set("key", "x", ttl=60, size=101)
+    assert cache.get("key") is None
+    assert cache.size == 0
+
+
+def test_size_counts_nested_containers():
+    flat = LocalCache._sizeof("key", [])
+    nested = LocalCache._sizeof("key", [{"name": "LeBron James", "points": [1, 2, 3]}] * 10)
+    assert nested > flat * 10
+
+
+def test_replacing_and_deleting_keep_size_consistent():
+    cache = LocalCache(max_bytes=1 << 20)
+    cache.set("key", "x", ttl=60, size=10)
+    cache.set("key", "y", ttl=60, size=20)
+    assert cache.size == 20
+    cache.delete("key")
+    assert cache.size == 0
+    cache.set("key", "x", ttl=60, size=10)
+    cache.clear()
+    assert (len(cache), cache.size) == (0, 0)
@@ -0,0 +1,230 @@
+import asyncio
+
+import requests
+
+from api.nba import NBAClient
+from managers.cache import CacheManager
+from managers.scoreboard import LivePlayerIndex, ScoreboardSnapshot
+from managers.standings import StandingsManager
+from tests.fakes import FakeProxyManager, FakeRedis
+from utils.cache_policy import GAME_STATUS_FINAL, GAME_STATUS_LIVE, CachePolicy
+from utils.codec import payload_key
+from utils.player_index import PlayerIndex
+
+LAKERS, CELTICS = 1610612747, 1610612738
+
+
+def _statistics(points: int) -> dict:
+    return {"points": points, "reboundsTotal": 7, "assists": 8, "steals": 1, "blocks": 0,
+            "turnovers": 3, "minutes": "PT34M12.00S", "fieldGoalsMade": 10,
+            "fieldGoalsAttempted": 18, "threePointersMade": 2, "threePointersAttempted": 5,
+            "freeThrowsMade": 4, "freeThrowsAttempted": 4}
+
+
+PLAYERS = PlayerIndex([
+    {"id": 2544, "full_name": "LeBron James", "last_name": "James", "is_active": True},
+    {"id": 203076, "full_name": "Anthony Davis", "last_name": "Davis", "is_active": True},
+    {"id": 1630162, "full_name": "Anthony Edwards", "last_name": "Edwards", "is_active": True},
+])
+
+GAME = {
+    "gameId": "0022500101",
+    "gameStatus": GAME_STATUS_LIVE,
+    "gameStatusText": "Q3 5:12",
+    "awayTeam": {"teamId": LAKERS, "teamCity": "Los Angeles", "teamName": "Lakers",
+                 "teamTricode": "LAL", "score": 90},
+    "homeTeam": {"teamId": CELTICS, "teamCity": "Boston", "teamName": "Celtics",
+                 "teamTricode": "BOS", "score": 88},
+}
+BOX = {
+    "gameId": GAME["gameId"],
+    "awayTeam": {"players": [{"personId": 2544, "name": "LeBron James",
+                              "statistics": _statistics(26)}]},
+    "homeTeam": {"players": [{"personId": 1628369, "name": "Jayson Tatum", "statistics": {}}]},
+}
+
+
+class TimingOutTransport:
+    async def get_stats_json(self, endpoint, params, proxy):
+        raise asyncio.TimeoutError
+
+
+class FailingTransport:
+    async def get_stats_json(self, endpoint, params, proxy):
+        raise requests.ConnectionError("connection reset")
+
+
+STANDINGS = {"resultSets": [{
+    "name": "Standings",
+    "headers": ["TeamID", "Conference", "PlayoffRank", "WINS", "LOSSES",
+                "ConferenceGamesBack", "strCurrentStreak"],
+    "rowSet": [[LAKERS, "West", 4, 50, 32, 2.5, "W 3"],
+               [CELTICS, "East", 2, 61, 21, 3.0, "L 1"]],
+}]}
+CAREER = {"resultSets": [{"name": "SeasonTotalsRegularSeason",
+                          "headers": ["SEASON_ID", "TEAM_ABBREVIATION", "GP", "PTS", "REB",
+                                      "AST", "FGM", "FGA"],
+                          "rowSet": [["2003-04", "CLE", 79, 1654, 432, 465, 622, 1492],
+                                     ["2004-05", "CLE", 80, 2175, 588, 577, 795, 1684]]}]}
+
+
+class StatsTransport:
+    """
+    Answers LeagueStandingsV3 and PlayerCareerStats after yielding, counting calls.
+    """
+
+    PAYLOADS = {"LeagueStandingsV3": STANDINGS, "PlayerCareerStats": CAREER}
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_stats_json(self, endpoint, params, proxy):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.PAYLOADS[endpoint]
+
+
+class FakeScoreboard:
+    def __init__(self, snapshot: ScoreboardSnapshot | None):
+        self.snapshot = snapshot
+        self.policy = CachePolicy()
+        self.final_listeners = []
+
+    def add_final_listener(self, callback) -> None:
+        self.final_listeners.append(callback)
+
+
+def _client(snapshot: ScoreboardSnapshot | None = None, transport=None,
+            redis: FakeRedis | None = None) -> NBAClient:
+    transport = transport or TimingOutTransport()
+    cache = CacheManager(redis or FakeRedis())
+    scoreboard = FakeScoreboard(snapshot)
+    standings = StandingsManager(FakeProxyManager(), transport, cache, scoreboard)
+    return NBAClient(FakeProxyManager(), cache, scoreboard, transport, PLAYERS, standings)
+
+
+def _snapshot() -> ScoreboardSnapshot:
+    boxscores = {GAME["gameId"]: BOX}
+    return ScoreboardSnapshot(games=(GAME,), boxscores=boxscores,
+                              schedule="May 15th: LAL @ BOS (7:30 PM EST)",
+                              players=LivePlayerIndex(boxscores))
+
+
+def test_live_commands_before_first_refresh():
+    client = _client(None)
+    assert asyncio.run(client.get_game_score("Lakers")) == NBAClient.UNAVAILABLE
+    assert asyncio.run(client.get_player_statline("LeBron James")) == NBAClient.UNAVAILABLE
+    assert asyncio.run(client.get_schedule()) == NBAClient.UNAVAILABLE
+
+
+def test_game_score():
+    client = _client(_snapshot())
+    assert asyncio.run(client.get_game_score("lakers")) == \
+        "Los Angeles Lakers 90 - Boston Celtics 88 (Q3 5:12)"
+    assert asyncio.run(client.get_game_score("Heat")) == "The Miami Heat are not currently playing."
+    assert asyncio.run(client.get_game_score("Nope")) == "Team not found: Nope"
+
+
+def test_player_statline():
+    client = _client(_snapshot())
+    assert asyncio.run(client.get_player_statline("lebron james")) == (
+        "LeBron James: 26 PTS (10/18 FG, 2/5 3PT, 4/4 FT), "
+        "7 REB, 8 AST, 1 STL, 0 BLK, 3 TO in 34 MIN")
+    assert asyncio.run(client.get_player_statline("james")).startswith("LeBron James: 26 PTS")
+    assert asyncio.run(client.get_player_statline("2544")).startswith("LeBron James: 26 PTS")
+    assert asyncio.run(client.get_player_statline("Jayson Tatum")) == \
+        "Jayson Tatum is not currently playing."
+
+
+def test_schedule():
+    assert asyncio.run(_client(_snapshot()).get_schedule()) == "May 15th: LAL @ BOS (7:30 PM EST)"
+
+
+def test_slow_stats_endpoints_get_a_reply():
+    client = _client(None)
+    assert asyncio.run(client.get_player_career("LeBron James")) == NBAClient.TIMED_OUT
+    assert asyncio.run(client.get_team_record("Lakers")) == NBAClient.TIMED_OUT
+
+
+def test_failing_stats_endpoints_get_a_reply():
+    client = _client(transport=FailingTransport())
+    assert asyncio.run(client.get_player_career("LeBron James")) == NBAClient.STATS_UNAVAILABLE
+    assert asyncio.run(client.get_team_record("Lakers")) == NBAClient.STATS_UNAVAILABLE
+
+
+def test_ambiguous_last_name_lists_candidates():
+    box = {"gameId": "001",
+           "awayTeam": {"players": [{"personId": 1, "name": "Jalen Williams",
+                                     "statistics": _statistics(20)}]},
+           "homeTeam": {"players": [{"personId": 2, "name": "Jaylin Williams",
+                                     "statistics": _statistics(8)}]}}
+    boxscores = {"001": box}
+    snapshot = ScoreboardSnapshot(games=(), boxscores=boxscores, schedule="",
+                                  players=LivePlayerIndex(boxscores))
+    reply = asyncio.run(_client(snapshot).get_player_statline("Williams"))
+    assert reply.startswith("Did you mean: ")
+    assert "Jalen Williams" in reply and "Jaylin Williams" in reply
+
+
+def test_concurrent_record_misses_share_one_fetch():
+    transport = StatsTransport()
+    redis = FakeRedis()
+    client = _client(transport=transport, redis=redis)
+
+    async def scenario():
+        return await asyncio.gather(*(client.get_team_record(team)
+                                      for team in ("Lakers", "Celtics") * 3))
+
+    assert asyncio.run(scenario()) == [
+        "The Los Angeles Lakers are 50 - 32 (W3, 4th in the West, 2.5 GB)",
+        "The Boston Celtics are 61 - 21 (L1, 2nd in the East, 3 GB)",
+    ] * 3
+    assert transport.calls == 1
+    assert payload_key("standings") in redis.data
+
+
+def test_team_missing_from_standings():
+    client = _client(transport=StatsTransport())
+    assert asyncio.run(client.get_team_record("Heat")) == "No record available for the Miami Heat."
+
+
+def test_career_is_formatted_from_cached_rows():
+    transport = StatsTransport()
+    client = _client(transport=transport)
+
+    async def scenario():
+        return [await client.get_player_career("LeBron James") for _ in range(2)]
+
+    assert asyncio.run(scenario()) == ["LeBron James: 24.1 PTS, 6.4 REB, 6.6 AST, 44.6% FG"] * 2
+    assert transport.calls == 1
+
+
+def test_final_game_drops_careers_of_players_who_played():
+    redis = FakeRedis()
+    client = _client(transport=StatsTransport(), redis=redis)
+    box = {
+        "gameId": GAME["gameId"],
+        "gameStatus": GAME_STATUS_FINAL,
+        "awayTeam": {"teamId": LAKERS, "players": [{"personId": 2544, "played": "1"}]},
+        "homeTeam": {"teamId": CELTICS, "players": [{"personId": 1628369, "played": "0"}]},
+    }
+    for key in (payload_key("career", 2544), payload_key("career", 1628369)):
+        redis.data[key] = b"cached"
+
+    async def scenario():
+        await client._on_game_final(box)
+
+    asyncio.run(scenario())
+    assert set(redis.data) == {payload_key("career", 1628369)}
+
+
+def test_unknown_player_gets_suggestions():
+    client = _client(None)
+    assert asyncio.run(client.get_player_career("Anthony")) == \
+        "Player not found: Anthony. Did you mean: Anthony Davis, Anthony Edwards?"
+    assert asyncio.run(client.get_player_career("Zzyzx")) == "Player not found: Zzyzx"
+
+
+def test_ambiguous_team():
+    assert asyncio.run(_client(_snapshot()).get_game_score("Los Angeles")) == \
+        "Los Angeles is ambiguous: Los Angeles Clippers, Los Angeles Lakers."
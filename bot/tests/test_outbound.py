@@ -0,0 +1,134 @@
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from managers import outbound
+from managers.outbound import OutboundManager, TokenBucket, _Pending
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(outbound.time, "monotonic", clock)
+    return clock
+
+
+class FakeBroadcaster:
+    def __init__(self, channel_id: str):
+        self.id = channel_id
+        self.sent: list[str] = []
+
+    async def send_message(self, sender: str, message: str) -> None:
+        self.sent.append(message)
+
+
+def _manager(**kwargs) -> OutboundManager:
+    return OutboundManager(SimpleNamespace(bot_id="bot"), **{"channel_limit": 20,
+                                                             "global_limit": 100, **kwargs})
+
+
+def test_bucket_starts_full(clock):
+    bucket = TokenBucket(capacity=2, per=30.0)
+    assert bucket.wait_time() == 0
+    bucket.take()
+    bucket.take()
+    assert bucket.wait_time() == pytest.approx(15.0)
+
+
+def test_bucket_refills_continuously(clock):
+    bucket = TokenBucket(capacity=2, per=30.0)
+    bucket.take()
+    bucket.take()
+    clock.now += 15.0
+    assert bucket.wait_time() == 0
+    clock.now += 300.0
+    bucket.wait_time()
+    assert bucket.tokens == 2
+
+
+def test_merge_folds_messages_that_fit():
+    manager = _manager()
+    queue = deque(_Pending(text, 1.0) for text in ("a", "b", "c"))
+    merged = manager._merge(queue)
+    assert merged.text == "a | b | c"
+    assert merged.enqueued_at == 1.0
+    assert not queue
+    assert manager.stats["merged"] == 2
+
+
+def test_merge_stops_at_message_length():
+    manager = _manager()
+    long = "x" * (OutboundManager.MAX_MESSAGE_LENGTH - 5)
+    queue = deque([_Pending(long), _Pending("short"), _Pending("next")])
+    assert manager._merge(queue).text == long
+    assert [pending.text for pending in queue] == ["short", "next"]
+
+
+def test_send_drops_oldest_on_overflow():
+    manager = _manager(max_depth=2)
+    broadcaster = FakeBroadcaster("1")
+    for text in ("one", "two", "three"):
+        manager.send(broadcaster, text)
+    assert [pending.text for pending in manager._queues["1"]] == ["two", "three"]
+    assert manager.stats["dropped_overflow"] == 1
+    assert list(manager._ready) == ["1"]
+
+
+def test_forget_discards_channel_state():
+    manager = _manager()
+    manager.send(FakeBroadcaster("1"), "hello")
+    manager._bucket("1")
+    manager.forget("1")
+    assert manager.depth == 0
+    assert not manager._ready
+    assert "1" not in manager._buckets and "1" not in manager._broadcasters
+    manager.forget("1")
+
+
+def test_next_channel_waits_for_channel_bucket(clock):
+    manager = _manager(channel_limit=1, per=30.0)
+    manager.send(FakeBroadcaster("1"), "hello")
+    manager._bucket("1").take()
+    assert manager._next_channel() == (None, pytest.approx(30.0))
+    clock.now += 30.0
+    assert manager._next_channel() == ("1", 0.0)
+
+
+def test_expired_messages_are_dropped(clock):
+    manager = _manager(max_age=30.0)
+    manager.send(FakeBroadcaster("1"), "late")
+    manager._queues["1"][0].enqueued_at = clock.now
+    clock.now += 31.0
+    assert manager._next_channel() == (None, float("inf"))
+    assert manager.stats["dropped_expired"] == 1
+
+
+def test_sender_serves_channels_and_merges_bursts():
+    async def scenario():
+        manager = _manager()
+        first, second = FakeBroadcaster("1"), FakeBroadcaster("2")
+        for i in range(3):
+            manager.send(first, f"a{i}")
+        manager.send(second, "b0")
+        await manager.start()
+        for _ in range(100):
+            if manager.stats["sent"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        await manager.close()
+        return first.sent, second.sent, manager.stats
+
+    first, second, stats = asyncio.run(scenario())
+    assert first == ["a0 | a1 | a2"]
+    assert second == ["b0"]
+    assert stats["sent"] == 2 and stats["merged"] == 2
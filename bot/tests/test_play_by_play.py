@@ -0,0 +1,141 @@
+import asyncio
+
+from managers.play_by_play import PlayByPlayManager
+from managers.scoreboard import LivePlayerIndex, ScoreboardSnapshot
+from utils.cache_policy import GAME_STATUS_FINAL, GAME_STATUS_LIVE
+from utils.play_by_play import GamePlays, Play, _clock
+
+GAME_ID = "0022500101"
+
+
+def _action(number: int, person_id: int = 0, description: str = "") -> dict:
+    return {"actionNumber": number, "period": 3, "clock": "PT05M12.00S",
+            "teamTricode": "LAL", "personId": person_id,
+            "description": description or f"Play {number}",
+            "scoreHome": "88", "scoreAway": "90"}
+
+
+def test_clock():
+    assert _clock("PT05M12.00S") == "5:12"
+    assert _clock("PT00M00.50S") == "0:00"
+    assert _clock("5:12") == "5:12"
+
+
+def test_play_format():
+    play = Play(_action(1, 2544, "L. James 26' 3PT Jump Shot"))
+    assert play.format("LAL", "BOS") == \
+        "Q3 5:12 LAL: L. James 26' 3PT Jump Shot (LAL 90 - BOS 88)"
+
+
+def test_ingest_only_takes_actions_after_cursor():
+    plays = GamePlays()
+    assert plays.ingest([_action(1), _action(2)]) == 2
+    assert plays.ingest([_action(1), _action(2), _action(4)]) == 1
+    assert plays.cursor == 4
+    assert plays.ingest([_action(1), _action(2), _action(4)]) == 0
+    assert [play.action_number for play in plays.plays] == [1, 2, 4]
+    assert plays.last().action_number == 4
+
+
+def test_amended_earlier_actions_are_kept_as_first_seen():
+    plays = GamePlays()
+    plays.ingest([_action(1, description="Shot"), _action(2)])
+    plays.ingest([_action(1, description="Amended"), _action(3)])
+    assert [play.description for play in plays.plays] == ["Shot", "Play 2", "Play 3"]
+
+
+def test_buffers_are_bounded():
+    plays = GamePlays(size=3, per_player=2)
+    plays.ingest([_action(number, person_id=2544) for number in range(1, 6)])
+    assert [play.action_number for play in plays.plays] == [3, 4, 5]
+    assert [play.action_number for play in plays.recent_for_player(2544)] == [4, 5]
+
+
+def test_per_player_plays():
+    plays = GamePlays()
+    plays.ingest([_action(1, 2544), _action(2), _action(3, 1628369), _action(4, 2544)])
+    assert [play.action_number for play in plays.recent_for_player(2544)] == [1, 4]
+    assert plays.recent_for_player(1) == []
+    assert GamePlays().last() is None
+
+
+class FakeProxyManager:
+    async def get_proxy(self) -> None:
+        return None
+
+
+class FakeScoreboard:
+    def __init__(self):
+        self.listeners = []
+        self.snapshot = None
+
+    def add_snapshot_listener(self, listener) -> None:
+        self.listeners.append(listener)
+
+
+class FakeTransport:
+    """
+    Serves the play-by-play feed with an ETag, answering 304 (None) while it
+    is unchanged.
+    """
+
+    def __init__(self, actions: list[dict]):
+        self.actions = actions
+        self.etag = "v1"
+        self.requests: list[str | None] = []
+
+    async def get_live_json_if_changed(self, endpoint, path, proxy, etag):
+        self.requests.append(etag)
+        if etag == self.etag:
+            return None, etag
+        return {"game": {"actions": list(self.actions)}}, self.etag
+
+
+def _manager(transport: FakeTransport) -> PlayByPlayManager:
+    return PlayByPlayManager(FakeProxyManager(), transport, FakeScoreboard())
+
+
+def test_poll_sends_etag_and_skips_unchanged_feed():
+    transport = FakeTransport([_action(1), _action(2)])
+    manager = _manager(transport)
+
+    async def scenario():
+        assert await manager._poll_game(GAME_ID) == 2
+        assert await manager._poll_game(GAME_ID) == 0
+        transport.actions.append(_action(3))
+        transport.etag = "v2"
+        assert await manager._poll_game(GAME_ID) == 1
+
+    asyncio.run(scenario())
+    assert transport.requests == [None, "v1", "v1"]
+    assert manager.plays(GAME_ID).last().action_number == 3
+
+
+def _snapshot(status: int) -> ScoreboardSnapshot:
+    game = {"gameId": GAME_ID, "gameStatus": status,
+            "awayTeam": {"teamId": 1, "teamTricode": "LAL"},
+            "homeTeam": {"teamId": 2, "teamTricode": "BOS"}}
+    return ScoreboardSnapshot(games=(game,), boxscores={}, schedule="",
+                              players=LivePlayerIndex({}))
+
+
+def test_final_game_is_polled_once_then_dropped_off_slate():
+    transport = FakeTransport([_action(1)])
+    manager = _manager(transport)
+    empty = ScoreboardSnapshot(games=(), boxscores={}, schedule="", players=LivePlayerIndex({}))
+
+    async def refresh(snapshot):
+        await manager._on_snapshot(None, snapshot)
+        if manager._task is not None:
+            await manager._task
+
+    async def scenario():
+        await refresh(_snapshot(GAME_STATUS_LIVE))
+        await refresh(_snapshot(GAME_STATUS_FINAL))
+        await refresh(_snapshot(GAME_STATUS_FINAL))
+        assert len(transport.requests) == 2
+        await refresh(empty)
+
+    asyncio.run(scenario())
+    assert manager.plays(GAME_ID) is None
+    assert manager._etags == {} and manager._finished == set()
@@ -0,0 +1,90 @@
+from utils.player_index import PlayerIndex
+
+
+def _player(player_id: int, full_name: str, is_active: bool = True) -> dict:
+    first, _, last = full_name.partition(" ")
+    return {"id": player_id, "full_name": full_name, "first_name": first,
+            "last_name": last, "is_active": is_active}
+
+
+PLAYERS = [
+    _player(1, "Stephen Curry"),
+    _player(2, "Seth Curry"),
+    _player(3, "Dell Curry", is_active=False),
+    _player(4, "Michael Jordan", is_active=False),
+    _player(5, "DeAndre Jordan"),
+    _player(6, "Nikola Jokić"),
+    _player(7, "LeBron James"),
+    _player(8, "Anthony Edwards"),
+    _player(9, "Anthony Davis"),
+    _player(10, "Jayson Tatum"),
+    _player(11, "Earl Tatum", is_active=False),
+]
+
+
+def _resolve(query: str, aliases: dict[str, str] | None = None) -> tuple[str | None, list[str]]:
+    player, candidates = PlayerIndex(PLAYERS, aliases).resolve(query)
+    return (player["full_name"] if player else None,
+            [candidate["full_name"] for candidate in candidates])
+
+
+def test_exact_name_ignores_case_and_accents():
+    assert _resolve("nikola jokic")[0] == "Nikola Jokić"
+    assert _resolve("  LEBRON   james ")[0] == "LeBron James"
+
+
+def test_alias_resolves():
+    assert _resolve("steph")[0] == "Stephen Curry"
+    assert _resolve("bron")[0] == "LeBron James"
+
+
+def test_custom_alias_overrides_default():
+    assert _resolve("ant", {"ant": "Anthony Davis"})[0] == "Anthony Davis"
+
+
+def test_last_name_with_one_active_player_resolves():
+    assert _resolve("Tatum")[0] == "Jayson Tatum"
+
+
+def test_last_name_shared_by_active_players_is_ambiguous():
+    player, candidates = _resolve("Curry")
+    assert player is None
+    assert {"Stephen Curry", "Seth Curry"} <= set(candidates)
+
+
+def test_last_name_of_prominent_retired_player_is_ambiguous():
+    player, candidates = _resolve("Jordan")
+    assert player is None
+    assert candidates[0] == "Michael Jordan"
+    assert "DeAndre Jordan" in candidates
+
+
+def test_prefix_resolves():
+    assert _resolve("Joki")[0] == "Nikola Jokić"
+
+
+def test_typo_resolves_to_clear_best_match():
+    assert _resolve("Antony Edwrds")[0] == "Anthony Edwards"
+
+
+def test_misspelled_alias_resolves():
+    assert _resolve("Steph Cury")[0] == "Stephen Curry"
+    assert _resolve("Lebrn")[0] == "LeBron James"
+
+
+def test_fuzzy_match_never_scores_as_exact():
+    index = PlayerIndex(PLAYERS)
+    assert all(candidate.score < 1.0 for candidate in index.search("Steph Cury"))
+
+
+def test_unknown_name_has_no_candidates():
+    assert _resolve("Zzyzx Qwerty") == (None, [])
+
+
+def test_state_round_trip():
+    index = PlayerIndex(PLAYERS)
+    restored = PlayerIndex.from_state(index.state())
+    assert restored.resolve("steph")[0]["id"] == 1
+    assert restored.resolve("Joki")[0]["id"] == 6
+    assert restored.resolve("Curry")[0] is None
+    assert restored.resolve("Jordan")[0] is None
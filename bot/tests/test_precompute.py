@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from managers.cache import CacheManager
+from managers.precompute import CareerPrecomputer
+from tests.fakes import FakeProxyManager, FakeRedis
+from utils.codec import payload_key, unpack
+from utils.player_index import PlayerIndex
+
+PLAYERS = PlayerIndex([
+    {"id": i, "full_name": f"Player {i}", "last_name": str(i), "is_active": i % 5 != 0}
+    for i in range(1, 13)
+])
+
+
+def _career(player_id: int) -> dict:
+    return {"resultSets": [{"name": "SeasonTotalsRegularSeason",
+                            "headers": ["SEASON_ID", "TEAM_ABBREVIATION", "GP", "PTS", "REB",
+                                        "AST", "FGM", "FGA"],
+                            "rowSet": [["2024-25", "LAL", player_id, 0, 0, 0, 0, 0]]}]}
+
+
+class CareerTransport:
+    def __init__(self, failing: set[int] = frozenset()):
+        self.failing = failing
+        self.requested: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_stats_json(self, endpoint, params, proxy):
+        assert endpoint == "PlayerCareerStats"
+        player_id = params["PlayerID"]
+        self.requested.append(player_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if player_id in self.failing:
+                raise asyncio.TimeoutError
+            return _career(player_id)
+        finally:
+            self.in_flight -= 1
+
+
+def _precomputer(transport: CareerTransport, redis: FakeRedis) -> CareerPrecomputer:
+    precomputer = CareerPrecomputer(FakeProxyManager(), transport, CacheManager(redis),
+                                    PLAYERS, concurrency=3)
+    precomputer.BATCH_SIZE = 4
+    return precomputer
+
+
+def test_run_caches_every_active_player_in_batches():
+    transport, redis = CareerTransport(), FakeRedis()
+    assert asyncio.run(_precomputer(transport, redis).run()) == 10
+
+    active = [i for i in range(1, 13) if i % 5 != 0]
+    assert sorted(transport.requested) == active
+    assert transport.peak == 3
+    value, _ = unpack(redis.data[payload_key("career", 7)])
+    assert value == {"regular": [[2024, "LAL", 7, 0, 0, 0, 0, 0]], "playoffs": []}
+    assert len(redis.published) == 3
+
+
+def test_failed_players_are_skipped():
+    transport, redis = CareerTransport(failing={3, 4}), FakeRedis()
+    assert asyncio.run(_precomputer(transport, redis).run()) == 8
+    assert payload_key("career", 3) not in redis.data
+    assert payload_key("career", 6) in redis.data
+
+
+def test_entries_stay_fresh_until_after_the_next_run(monkeypatch):
+    monkeypatch.setattr("managers.precompute.seconds_until_et_hour", lambda hour: 1000)
+    redis = FakeRedis()
+    precomputer = _precomputer(CareerTransport(), redis)
+    asyncio.run(precomputer.run())
+    _, fresh_until = unpack(redis.data[payload_key("career", 1)])
+    entry_ttl = redis.ttls[payload_key("career", 1)]
+    assert entry_ttl == int(1000 + CareerPrecomputer.FRESH_MARGIN + precomputer.cache.stale_ttl)
+    assert fresh_until == pytest.approx(
+        time.time() + 1000 + CareerPrecomputer.FRESH_MARGIN, abs=5)
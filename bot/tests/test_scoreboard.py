@@ -0,0 +1,221 @@
+import asyncio
+
+from managers.cache import CacheManager
+from managers.scoreboard import ScoreboardManager
+from tests.fakes import FakeProxyManager, FakeRedis
+from utils.cache_policy import (
+    CachePolicy,
+    GAME_STATUS_FINAL,
+    GAME_STATUS_LIVE,
+    GAME_STATUS_SCHEDULED,
+)
+
+
+def _game(game_id: str, status: int, away: int = 1, home: int = 2) -> dict:
+    return {
+        "gameId": game_id,
+        "gameStatus": status,
+        "gameStatusText": "",
+        "gameTimeUTC": "2025-05-15T23:30:00Z",
+        "awayTeam": {"teamId": away, "teamTricode": f"A{game_id[-1]}", "score": 0},
+        "homeTeam": {"teamId": home, "teamTricode": f"H{game_id[-1]}", "score": 0},
+    }
+
+
+class FakeTransport:
+    """
+    Serves the live scoreboard and box scores from memory, recording every
+    request and how many box scores were in flight at once.
+    """
+
+    def __init__(self, games: list[dict]):
+        self.games = games
+        self.failing: set[str] = set()
+        self.scoreboard_requests = 0
+        self.boxscore_requests: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_live_json(self, endpoint: str, path: str, proxy: str | None) -> dict:
+        if endpoint == "ScoreBoard":
+            self.scoreboard_requests += 1
+            if "scoreboard" in self.failing:
+                raise ConnectionError("CDN unavailable")
+            return {"scoreboard": {"games": [dict(game) for game in self.games]}}
+        game_id = path.rsplit("_", 1)[1].removesuffix(".json")
+        self.boxscore_requests.append(game_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if game_id in self.failing:
+            raise ConnectionError("box score unavailable")
+        game = next(game for game in self.games if game["gameId"] == game_id)
+        return {"game": {"gameId": game_id, "gameStatus": game["gameStatus"],
+                         "homeTeam": {"players": []}, "awayTeam": {"players": []}}}
+
+
+def _manager(transport: FakeTransport, idle_interval: float = 300.0,
+             cache: CacheManager | None = None, live_interval: float = 0.0) -> ScoreboardManager:
+    # A live poll interval of 0 keeps shared payloads from ever being fresh,
+    # so each refresh goes upstream unless a test opts into sharing.
+    policy = CachePolicy(live_poll_interval=live_interval)
+    policy.IDLE_POLL_INTERVAL = idle_interval
+    return ScoreboardManager(FakeProxyManager(), transport,
+                             cache or CacheManager(FakeRedis()), policy)
+
+
+def test_no_snapshot_before_first_refresh():
+    assert _manager(FakeTransport([])).snapshot is None
+
+
+def test_refresh_publishes_games_and_started_box_scores():
+    transport = FakeTransport([_game("001", GAME_STATUS_SCHEDULED),
+                               _game("002", GAME_STATUS_LIVE, 3, 4)])
+    manager = _manager(transport)
+    snapshot = asyncio.run(manager.refresh())
+    assert manager.snapshot is snapshot
+    assert [game["gameId"] for game in snapshot.games] == ["001", "002"]
+    assert list(snapshot.boxscores) == ["002"]
+    assert snapshot.schedule == "May 15th: A1 @ H1 (7:30 PM EST), A2 @ H2 (7:30 PM EST)"
+    assert snapshot.find_game(4)["gameId"] == "002"
+    assert snapshot.find_game(99) is None
+
+
+def test_box_scores_are_fetched_concurrently():
+    transport = FakeTransport([_game(f"00{i}", GAME_STATUS_LIVE, i, 10 + i) for i in range(5)])
+    snapshot = asyncio.run(_manager(transport).refresh())
+    assert len(snapshot.boxscores) == 5
+    assert transport.peak == 5
+
+
+def test_final_box_scores_are_reused():
+    transport = FakeTransport([_game("001", GAME_STATUS_LIVE),
+                               _game("002", GAME_STATUS_FINAL, 3, 4)])
+    manager = _manager(transport)
+
+    async def scenario():
+        first = await manager.refresh()
+        transport.games[0]["gameStatus"] = GAME_STATUS_FINAL
+        second = await manager.refresh()
+        third = await manager.refresh()
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert transport.boxscore_requests == ["001", "002", "001"]
+    assert second.boxscores["002"] is first.boxscores["002"]
+    assert third.boxscores["001"] is second.boxscores["001"]
+
+
+def test_failed_box_score_keeps_previous_copy():
+    transport = FakeTransport([_game("001", GAME_STATUS_LIVE), _game("002", GAME_STATUS_LIVE, 3, 4)])
+    manager = _manager(transport)
+
+    async def scenario():
+        first = await manager.refresh()
+        transport.failing = {"001", "002"}
+        transport.games.append(_game("003", GAME_STATUS_LIVE, 5, 6))
+        transport.failing.add("003")
+        return first, await manager.refresh()
+
+    first, second = asyncio.run(scenario())
+    assert second.boxscores["001"] is first.boxscores["001"]
+    assert second.boxscores["002"] is first.boxscores["002"]
+    assert "003" not in second.boxscores
+
+
+def test_poller_survives_failed_refresh():
+    transport = FakeTransport([])
+    calls = []
+    get_live_json = transport.get_live_json
+
+    async def flaky(endpoint, path, proxy):
+        calls.append(endpoint)
+        if len(calls) == 1:
+            raise ConnectionError("upstream down")
+        return await get_live_json(endpoint, path, proxy)
+
+    transport.get_live_json = flaky
+    manager = _manager(transport, idle_interval=0.0)
+
+    async def scenario():
+        await manager.start()
+        while manager.snapshot is None:
+            await asyncio.sleep(0)
+        await manager.close()
+
+    asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert len(calls) >= 2
+    assert manager.snapshot.schedule == "No games scheduled."
+
+
+def test_listeners_are_told_once_when_a_game_goes_final():
+    transport = FakeTransport([_game("001", GAME_STATUS_LIVE), _game("002", GAME_STATUS_LIVE, 3, 4)])
+    manager = _manager(transport)
+    finals = []
+
+    async def on_final(box):
+        finals.append(box["gameId"])
+
+    async def failing(box):
+        raise RuntimeError("listener broke")
+
+    manager.add_final_listener(failing)
+    manager.add_final_listener(on_final)
+
+    async def scenario():
+        await manager.refresh()
+        transport.games[0]["gameStatus"] = GAME_STATUS_FINAL
+        await manager.refresh()
+        await manager.refresh()
+
+    asyncio.run(scenario())
+    assert finals == ["001"]
+
+
+def test_games_final_at_startup_are_not_reported():
+    transport = FakeTransport([_game("001", GAME_STATUS_FINAL), _game("002", GAME_STATUS_LIVE, 3, 4)])
+    manager = _manager(transport)
+    finals = []
+
+    async def on_final(box):
+        finals.append(box["gameId"])
+
+    manager.add_final_listener(on_final)
+
+    async def scenario():
+        await manager.refresh()
+        await manager.refresh()
+
+    asyncio.run(scenario())
+    assert finals == []
+
+
+def test_processes_share_fresh_payloads():
+    transport = FakeTransport([_game("001", GAME_STATUS_LIVE), _game("002", GAME_STATUS_LIVE, 3, 4)])
+    redis = FakeRedis()
+    first = _manager(transport, cache=CacheManager(redis), live_interval=10.0)
+    second = _manager(transport, cache=CacheManager(redis), live_interval=10.0)
+
+    async def scenario():
+        await first.refresh()
+        return await second.refresh()
+
+    snapshot = asyncio.run(scenario())
+    assert transport.scoreboard_requests == 1
+    assert transport.boxscore_requests == ["001", "002"]
+    assert set(snapshot.boxscores) == {"001", "002"}
+
+
+def test_stored_scoreboard_is_served_when_the_cdn_fails():
+    transport = FakeTransport([_game("001", GAME_STATUS_FINAL)])
+    manager = _manager(transport, idle_interval=0.0)
+
+    async def scenario():
+        await manager.refresh()
+        transport.failing.add("scoreboard")
+        return await manager.refresh()
+
+    snapshot = asyncio.run(scenario())
+    assert transport.scoreboard_requests == 2
+    assert [game["gameId"] for game in snapshot.games] == ["001"]
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from managers.shard import ShardManager, owner_of
+from tests.fakes import FakeRedis
+
+CHANNELS = [str(i) for i in range(2000)]
+
+
+def test_owner_of_is_deterministic_and_order_independent():
+    workers = ("a", "b", "c")
+    assert [owner_of(c, workers) for c in CHANNELS] == \
+        [owner_of(c, ("c", "a", "b")) for c in CHANNELS]
+    assert owner_of("1", ()) is None
+
+
+def test_owner_of_spreads_channels_evenly():
+    counts = {}
+    for channel in CHANNELS:
+        owner = owner_of(channel, ("a", "b", "c", "d"))
+        counts[owner] = counts.get(owner, 0) + 1
+    assert set(counts) == {"a", "b", "c", "d"}
+    assert all(400 < count < 600 for count in counts.values())
+
+
+def test_only_the_leaving_workers_channels_move():
+    before = {c: owner_of(c, ("a", "b", "c")) for c in CHANNELS}
+    after = {c: owner_of(c, ("a", "b")) for c in CHANNELS}
+    moved = {c for c in CHANNELS if before[c] != after[c]}
+    assert moved == {c for c in CHANNELS if before[c] == "c"}
+
+
+def test_start_registers_a_lease_and_close_removes_it():
+    async def scenario():
+        redis = FakeRedis()
+        first = ShardManager(redis, "a", heartbeat_interval=60)
+        second = ShardManager(redis, "b", heartbeat_interval=60)
+        await first.start()
+        await second.start()
+        members = dict(redis.sorted_sets[ShardManager.WORKERS_KEY])
+        await first.close()
+        await second.close()
+        return first.workers, second.workers, set(members), redis.sorted_sets[ShardManager.WORKERS_KEY]
+
+    first, second, members, remaining = asyncio.run(scenario())
+    assert first == ("a",)
+    assert second == ("a", "b")
+    assert members == {"a", "b"}
+    assert remaining == {}
+
+
+def test_owns_follows_membership():
+    shard = ShardManager(FakeRedis(), "a")
+    assert all(shard.owns(c) for c in CHANNELS[:50])
+    shard.workers = ("a", "b")
+    assert {shard.owns(c) for c in CHANNELS[:50]} == {True, False}
+
+
+def test_membership_changes_trigger_rebalance():
+    async def scenario():
+        redis = FakeRedis()
+        shard = ShardManager(redis, "a", heartbeat_interval=0.01, lease_ttl=15)
+        changes = []
+
+        async def on_rebalance(previous, current):
+            changes.append((previous, current))
+
+        async def failing(previous, current):
+            raise RuntimeError("rebalance broke")
+
+        shard.on_rebalance(failing)
+        shard.on_rebalance(on_rebalance)
+        await shard.start()
+        redis.sorted_sets[ShardManager.WORKERS_KEY]["b"] = time.time()
+        while len(changes) < 1:
+            await asyncio.sleep(0.01)
+        # b stops heartbeating; its lease expires.
+        redis.sorted_sets[ShardManager.WORKERS_KEY]["b"] = time.time() - 60
+        while len(changes) < 2:
+            await asyncio.sleep(0.01)
+        await shard.close()
+        return changes
+
+    changes = asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert changes == [(("a",), ("a", "b")), (("a", "b"), ("a",))]
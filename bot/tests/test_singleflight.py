@@ -0,0 +1,129 @@
+import asyncio
+
+from tests.fakes import FakeRedis
+from utils.singleflight import SingleFlight
+
+
+class Upstream:
+    """
+    A slow upstream call that writes its result to the cache, counting calls.
+    """
+
+    def __init__(self, cache: FakeRedis | None = None, error: Exception | None = None):
+        self.cache = cache
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def fetch(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        if self.cache is not None:
+            await self.cache.set("key", "value")
+        return "value"
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_calls_share_one_fetch():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream()
+        waiters = [asyncio.create_task(flight.do("key", upstream.fetch)) for _ in range(10)]
+        await _settle()
+        upstream.release.set()
+        return await asyncio.gather(*waiters), upstream.calls, flight
+
+    results, calls, flight = asyncio.run(scenario())
+    assert results == ["value"] * 10
+    assert calls == 1
+    assert flight.stats == {"leaders": 1, "coalesced": 9, "remote_waits": 0}
+    assert flight._inflight == {}
+
+
+def test_error_reaches_every_waiter_and_is_not_cached():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream(error=ValueError("upstream"))
+        waiters = [asyncio.create_task(flight.do("key", upstream.fetch)) for _ in range(3)]
+        await _settle()
+        upstream.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        upstream.error = None
+        return results, await flight.do("key", upstream.fetch), upstream.calls
+
+    results, retry, calls = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert (retry, calls) == ("value", 2)
+
+
+def test_cancelled_waiter_does_not_cancel_the_fetch():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream()
+        first = asyncio.create_task(flight.do("key", upstream.fetch))
+        second = asyncio.create_task(flight.do("key", upstream.fetch))
+        await _settle()
+        first.cancel()
+        await _settle()
+        upstream.release.set()
+        return first, await second
+
+    first, second = asyncio.run(scenario())
+    assert first.cancelled()
+    assert second == "value"
+
+
+def test_leader_holds_and_releases_the_cross_process_lock():
+    async def scenario():
+        redis = FakeRedis()
+        flight, upstream = SingleFlight(redis), Upstream(redis)
+        upstream.release.set()
+        result = await flight.do("key", upstream.fetch, lambda: redis.get("key"))
+        return result, redis
+
+    result, redis = asyncio.run(scenario())
+    assert result == "value"
+    assert not asyncio.run(redis.exists("lock:key"))
+
+
+def test_waits_for_value_from_another_process():
+    async def scenario():
+        redis = FakeRedis()
+        token = await redis.acquire_lock("lock:key", 10)
+        flight, upstream = SingleFlight(redis, poll_interval=0.01), Upstream(redis)
+        waiter = asyncio.create_task(flight.do("key", upstream.fetch, lambda: redis.get("key")))
+        await asyncio.sleep(0.03)
+        await redis.set("key", "remote")
+        await redis.release_lock("lock:key", token)
+        return await waiter, upstream.calls, flight.stats["remote_waits"]
+
+    assert asyncio.run(scenario()) == ("remote", 0, 1)
+
+
+def test_fetches_when_other_process_drops_its_lock_without_a_value():
+    async def scenario():
+        redis = FakeRedis()
+        token = await redis.acquire_lock("lock:key", 10)
+        flight, upstream = SingleFlight(redis, poll_interval=0.01), Upstream(redis)
+        upstream.release.set()
+        waiter = asyncio.create_task(flight.do("key", upstream.fetch, lambda: redis.get("key")))
+        await asyncio.sleep(0.03)
+        await redis.release_lock("lock:key", token)
+        return await waiter, upstream.calls
+
+    assert asyncio.run(scenario()) == ("value", 1)
+
+
+def test_gives_up_waiting_when_lock_is_never_released():
+    async def scenario():
+        redis = FakeRedis()
+        await redis.acquire_lock("lock:key", 10)
+        flight = SingleFlight(redis, lock_ttl=0.05, poll_interval=0.01)
+        upstream = Upstream(redis)
+        upstream.release.set()
+        return await flight.do("key", upstream.fetch, lambda: redis.get("key")), upstream.calls
+
+    assert asyncio.run(scenario()) == ("value", 1)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+import requests
+
+from managers.cache import CacheManager
+from managers.standings import StandingsManager
+from tests.fakes import FakeProxyManager, FakeRedis
+from utils.cache_policy import CachePolicy
+from utils.codec import pack, unpack
+from utils.stats_formatter import TeamStanding, compact_standings, format_record
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+HEAT = 1610612748
+RAPTORS = 1610612761
+
+PAYLOAD = {"resultSets": [{
+    "name": "Standings",
+    "headers": ["LeagueID", "TeamID", "TeamCity", "Conference", "PlayoffRank", "WINS",
+                "LOSSES", "ConferenceGamesBack", "strCurrentStreak"],
+    "rowSet": [["00", HEAT, "Miami", "East", 1, 52, 28, 0.0, "W 2"],
+               ["00", RAPTORS, "Toronto", "East", 2, 50, 30, 2.0, "W 1"]],
+}]}
+
+
+def _standings() -> dict[int, TeamStanding]:
+    return {int(team_id): TeamStanding(*row) for team_id, row in compact_standings(PAYLOAD).items()}
+
+
+def test_parses_every_team():
+    standings = _standings()
+    assert set(standings) == {HEAT, RAPTORS}
+    assert all(team_id == standing.team_id for team_id, standing in standings.items())
+
+
+def test_parses_record_seed_and_streak():
+    assert _standings()[HEAT] == TeamStanding(
+        team_id=HEAT, wins=52, losses=28, conference="East", seed=1,
+        games_back=0.0, streak="W2")
+    assert _standings()[RAPTORS].games_back == 2.0
+
+
+def test_parses_recorded_standings():
+    payload = json.loads((FIXTURES / "standings.json").read_text())
+    table = compact_standings(payload)
+    assert len(table) == 30
+    assert all(team_id == str(row[0]) for team_id, row in table.items())
+
+
+def test_missing_columns_use_defaults():
+    payload = {"resultSets": [{
+        "name": "Standings",
+        "headers": ["TeamID", "WINS", "LOSSES", "ConferenceGamesBack"],
+        "rowSet": [["1610612747", 10, 5, None]],
+    }]}
+    assert TeamStanding(*compact_standings(payload)["1610612747"]) == TeamStanding(
+        team_id=1610612747, wins=10, losses=5, conference="", seed=None,
+        games_back=0.0, streak="")
+
+
+def test_table_survives_the_cache_codec():
+    table = compact_standings(PAYLOAD)
+    assert unpack(pack(table)) == table
+
+
+def test_format_record():
+    assert format_record("Miami Heat", _standings()[HEAT]) == \
+        "The Miami Heat are 52 - 28 (W2, 1st in the East)"
+    assert format_record("Toronto Raptors", _standings()[RAPTORS]) == \
+        "The Toronto Raptors are 50 - 30 (W1, 2nd in the East, 2 GB)"
+    bare = TeamStanding(1, 0, 0, "", None, 0.0, "")
+    assert format_record("Team", bare) == "The Team are 0 - 0"
+
+
+class StandingsTransport:
+    def __init__(self, failures: int = 0):
+        self.calls = 0
+        self.failures = failures
+
+    async def get_stats_json(self, endpoint, params, proxy):
+        assert endpoint == "LeagueStandingsV3"
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise requests.HTTPError("503 Server Error")
+        return PAYLOAD
+
+
+class FakeScoreboard:
+    def __init__(self):
+        self.policy = CachePolicy()
+        self.final_listeners = []
+
+    def add_final_listener(self, callback) -> None:
+        self.final_listeners.append(callback)
+
+
+def _manager(transport: StandingsTransport, redis: FakeRedis) -> StandingsManager:
+    manager = StandingsManager(FakeProxyManager(), transport, CacheManager(redis), FakeScoreboard())
+    manager.REFRESH_DELAY = 0.01
+    return manager
+
+
+def test_standings_are_fetched_once_and_cached():
+    transport = StandingsTransport()
+    manager = _manager(transport, FakeRedis())
+
+    async def scenario():
+        return [await manager.get_standing(HEAT) for _ in range(3)]
+
+    assert all(standing.wins == 52 for standing in asyncio.run(scenario()))
+    assert transport.calls == 1
+
+
+def test_failed_fetch_raises_and_is_not_cached():
+    transport = StandingsTransport(failures=1)
+    manager = _manager(transport, FakeRedis())
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(manager.get_standing(HEAT))
+    assert asyncio.run(manager.get_standing(HEAT)).wins == 52
+    assert transport.calls == 2
+
+
+def test_standing_is_read_from_the_shared_cache():
+    redis = FakeRedis()
+    asyncio.run(_manager(StandingsTransport(), redis).get_standing(HEAT))
+
+    transport = StandingsTransport()
+    manager = _manager(transport, redis)
+    assert asyncio.run(manager.get_standing(RAPTORS)).seed == 2
+    assert asyncio.run(manager.get_standing(1)) is None
+    assert transport.calls == 0
+
+
+def test_finals_close_together_trigger_one_refresh():
+    transport = StandingsTransport()
+    redis = FakeRedis()
+    manager = _manager(transport, redis)
+
+    async def scenario():
+        for _ in range(3):
+            await manager._on_game_final({})
+        await manager._refresh
+
+    asyncio.run(scenario())
+    assert transport.calls == 1
+    assert StandingsManager.KEY in redis.data
+
+
+def test_refresh_is_skipped_while_another_worker_holds_the_lock():
+    transport = StandingsTransport()
+    redis = FakeRedis()
+    redis.data[StandingsManager.LOCK_KEY] = "other-worker"
+    manager = _manager(transport, redis)
+
+    async def scenario():
+        await manager._on_game_final({})
+        await manager._refresh
+
+    asyncio.run(scenario())
+    assert transport.calls == 0
@@ -0,0 +1,51 @@
+import asyncio
+
+import bot
+from bot import Bot
+
+
+class Step:
+    """
+    Fails the first `failures` calls, then succeeds.
+    """
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("not yet")
+
+
+def _run_step(step: Step, monkeypatch, **kwargs) -> tuple[bool, list[float]]:
+    delays = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(bot.asyncio, "sleep", sleep)
+    instance = Bot.__new__(Bot)
+    return asyncio.run(instance._startup_step("step", step, **kwargs)), delays
+
+
+def test_step_is_retried_with_backoff(monkeypatch):
+    step = Step(failures=3)
+    ok, delays = _run_step(step, monkeypatch)
+    assert ok and step.calls == 4
+    assert delays == [1.0, 2.0, 4.0]
+
+
+def test_step_that_keeps_failing_is_skipped(monkeypatch):
+    step = Step(failures=10)
+    ok, delays = _run_step(step, monkeypatch, attempts=3)
+    assert not ok and step.calls == 3
+    assert len(delays) == 2
+
+
+def test_required_step_is_retried_until_it_succeeds(monkeypatch):
+    step = Step(failures=9)
+    ok, delays = _run_step(step, monkeypatch, attempts=None)
+    assert ok and step.calls == 10
+    assert max(delays) == bot.STARTUP_MAX_BACKOFF
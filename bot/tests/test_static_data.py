@@ -0,0 +1,42 @@
+from utils import static_data
+from utils.codec import pack, unpack
+from utils.startup import StartupTimer
+
+
+def _fresh(monkeypatch) -> None:
+    monkeypatch.setattr(static_data, "_snapshot", None)
+
+
+def test_missing_snapshot_is_built_and_saved(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    path = str(tmp_path / "snapshot.bin")
+    snapshot = static_data.load_snapshot(path)
+    with open(path, "rb") as f:
+        saved = unpack(f.read())
+    assert saved["version"] == static_data.SNAPSHOT_VERSION
+    assert len(saved["teams"]) == len(snapshot["teams"]) == 30
+    assert static_data.load_snapshot(path) is snapshot
+
+
+def test_outdated_snapshot_is_rebuilt(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(pack({"version": static_data.SNAPSHOT_VERSION - 1, "teams": []}))
+    assert len(static_data.load_snapshot(str(path))["teams"]) == 30
+
+
+def test_unreadable_snapshot_is_rebuilt(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(b"not a snapshot")
+    assert static_data.load_snapshot(str(path))["player_index"]["players"]
+
+
+def test_startup_timer_records_phases():
+    timer = StartupTimer(started=0.0)
+    with timer.phase("core"):
+        pass
+    timer.record("imports", 0.5)
+    assert set(timer.phases) == {"core", "imports"}
+    assert timer.phases["imports"] == 0.5
+    assert timer.elapsed() > 0
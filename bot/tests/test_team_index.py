@@ -0,0 +1,46 @@
+from utils.team_index import TEAM_INDEX, TeamIndex
+
+TEAMS = [
+    {"id": 1, "full_name": "Los Angeles Lakers", "nickname": "Lakers",
+     "abbreviation": "LAL", "city": "Los Angeles"},
+    {"id": 2, "full_name": "LA Clippers", "nickname": "Clippers",
+     "abbreviation": "LAC", "city": "Los Angeles"},
+    {"id": 3, "full_name": "Portland Trail Blazers", "nickname": "Trail Blazers",
+     "abbreviation": "POR", "city": "Portland"},
+]
+SLANG = {"lakeshow": "LAL", "clips": "LAC", "blazers": "POR"}
+
+
+def _names(name: str, index: TeamIndex = TEAM_INDEX) -> list[str]:
+    return [team["full_name"] for team in index.lookup(name)]
+
+
+def test_lookup_by_every_static_field():
+    index = TeamIndex(TEAMS, SLANG)
+    for alias in ("Los Angeles Lakers", "lakers", "LAL", "lal"):
+        assert _names(alias, index) == ["Los Angeles Lakers"]
+    assert _names("portland", index) == ["Portland Trail Blazers"]
+
+
+def test_shared_alias_is_ambiguous():
+    index = TeamIndex(TEAMS, SLANG)
+    assert _names("Los Angeles", index) == ["Los Angeles Lakers", "LA Clippers"]
+
+
+def test_slang_maps_to_abbreviation():
+    index = TeamIndex(TEAMS, SLANG)
+    assert _names("LakeShow", index) == ["Los Angeles Lakers"]
+    assert _names("clips", index) == ["LA Clippers"]
+    assert _names("Blazers", index) == ["Portland Trail Blazers"]
+
+
+def test_unknown_alias():
+    assert TeamIndex(TEAMS, SLANG).lookup("Sonics") == ()
+
+
+def test_static_index():
+    assert len(TEAM_INDEX.by_id) == 30
+    assert _names("dubs") == ["Golden State Warriors"]
+    assert _names("sixers") == ["Philadelphia 76ers"]
+    assert _names("C's") == ["Boston Celtics"]
+    assert _names("new york") == ["New York Knicks"]
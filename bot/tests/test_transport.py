@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from api.transport import EndpointPolicy, NBATransport
+
+
+@pytest.fixture
+def transport():
+    transport = NBATransport(max_workers=4, policies={
+        "Endpoint": EndpointPolicy(timeout=0.5, concurrency=2)})
+    yield transport
+    transport.close()
+
+def test_policy_defaults_and_overrides(transport):
+    assert transport.policy("Endpoint") == EndpointPolicy(timeout=0.5, concurrency=2)
+    assert transport.policy("ScoreBoard") == NBATransport.POLICIES["ScoreBoard"]
+    assert transport.policy("Unknown") == NBATransport.DEFAULT_POLICY
+
+
+class FakeResponse:
+    def __init__(self, status: int, payload: dict):
+        self.status_code = status
+        self.payload = payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class FakeSession:
+    """
+    Answers every GET with one response, optionally after a delay, and
+    records the requests and the threads they ran on.
+    """
+
+    def __init__(self, response: FakeResponse, delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+        self.urls: list[tuple[str, float]] = []
+        self.requests: list[dict] = []
+        self.threads: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: float, params: dict | None = None,
+            headers: dict | None = None) -> FakeResponse:
+        with self._lock:
+            self.urls.append((url, timeout))
+            self.requests.append({"params": params, "headers": headers})
+            self.threads.append(threading.current_thread().name)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return self.response
+
+    def close(self) -> None:
+        pass
+
+
+def test_sessions_are_pooled_per_proxy(transport):
+    direct = transport._session(None)
+    proxied = transport._session("http://proxy:80")
+    assert transport._session(None) is direct
+    assert transport._session("http://proxy:80") is proxied
+    assert proxied.proxies == {"http": "http://proxy:80", "https": "http://proxy:80"}
+    assert direct.headers["Accept-Encoding"] == "gzip, deflate"
+
+
+def test_get_live_json(transport):
+    session = transport._sessions[None] = FakeSession(FakeResponse(200, {"game": {}}))
+    payload = asyncio.run(transport.get_live_json("BoxScore", "boxscore/boxscore_001.json", None))
+    assert payload == {"game": {}}
+    assert session.urls == [(f"{NBATransport.LIVE_BASE_URL}/boxscore/boxscore_001.json",
+                             NBATransport.POLICIES["BoxScore"].timeout)]
+
+
+def test_get_live_json_raises_on_error_status(transport):
+    transport._sessions[None] = FakeSession(FakeResponse(404, {}))
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(transport.get_live_json("BoxScore", "boxscore/boxscore_001.json", None))
+
+
+def test_get_stats_json_runs_on_the_pool(transport):
+    session = transport._sessions[None] = FakeSession(FakeResponse(200, {"resultSets": []}))
+    payload = asyncio.run(transport.get_stats_json(
+        "PlayerCareerStats", {"PlayerID": 2544}, None))
+    assert payload == {"resultSets": []}
+    assert session.urls == [(f"{NBATransport.STATS_BASE_URL}/playercareerstats",
+                             NBATransport.POLICIES["PlayerCareerStats"].timeout)]
+    assert session.requests == [{"params": {"PlayerID": 2544},
+                                 "headers": NBATransport.STATS_HEADERS}]
+    assert session.threads[0].startswith("nba-api")
+
+
+def test_get_stats_json_times_out(transport):
+    transport._sessions[None] = FakeSession(FakeResponse(200, {}), delay=1.0)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(transport.get_stats_json("Endpoint", {}, None))
+
+
+def test_get_stats_json_respects_endpoint_concurrency(transport):
+    session = transport._sessions[None] = FakeSession(FakeResponse(200, {}), delay=0.05)
+
+    async def scenario():
+        await asyncio.gather(*(transport.get_stats_json("Endpoint", {}, None) for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert session.peak == 2
@@ -0,0 +1,130 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from managers.websocket import WebSocketManager
+from tests.fakes import FakeTwitchBot
+
+
+def test_subscribe_is_idempotent_even_when_concurrent():
+    bot = FakeTwitchBot()
+    manager = WebSocketManager(bot)
+
+    async def scenario():
+        await asyncio.gather(*(manager.subscribe("1") for _ in range(5)))
+        await manager.subscribe("1")
+
+    asyncio.run(scenario())
+    assert bot.subscribe_calls == ["1"]
+    assert manager.subscribed() == {"1"}
+
+
+def test_unsubscribe_deletes_by_registered_id():
+    bot = FakeTwitchBot()
+    manager = WebSocketManager(bot)
+
+    async def scenario():
+        await manager.subscribe("1")
+        await manager.unsubscribe("1")
+        await manager.unsubscribe("1")
+
+    asyncio.run(scenario())
+    assert bot.deleted == ["sub-1"]
+    assert manager.subscribed() == set()
+    assert set(bot.forgotten) == {"1"}
+
+
+def test_subscription_id_falls_back_to_live_subscriptions():
+    bot = FakeTwitchBot(return_ids=False)
+    manager = WebSocketManager(bot)
+
+    async def scenario():
+        await manager.subscribe("1")
+        await manager.unsubscribe("1")
+
+    asyncio.run(scenario())
+    assert bot.deleted == ["sub-1"]
+
+
+def test_failed_subscribe_can_be_retried():
+    bot = FakeTwitchBot()
+    bot.failing.add("1")
+    manager = WebSocketManager(bot)
+    with pytest.raises(RuntimeError):
+        asyncio.run(manager.subscribe("1"))
+    assert manager.subscribed() == set()
+
+    bot.failing.clear()
+    asyncio.run(manager.subscribe("1"))
+    assert manager.subscribed() == {"1"}
+
+
+def test_unsubscribe_during_subscribe_deletes_the_new_subscription():
+    bot = FakeTwitchBot()
+    bot.release.clear()
+    manager = WebSocketManager(bot)
+
+    async def scenario():
+        task = asyncio.create_task(manager.subscribe("1"))
+        await asyncio.sleep(0)
+        await manager.unsubscribe("1")
+        bot.release.set()
+        await task
+
+    asyncio.run(scenario())
+    assert bot.deleted == ["sub-1"]
+    assert manager.subscribed() == set()
+
+
+def test_revocation_drops_the_entry():
+    bot = FakeTwitchBot()
+    manager = WebSocketManager(bot)
+    asyncio.run(manager.subscribe("1"))
+    # twitchio drops a revoked subscription before the event is handled.
+    del bot.live["sub-1"]
+    manager.handle_revocation("sub-1")
+    manager.handle_revocation("unknown")
+    assert manager.subscribed() == set()
+    assert bot.forgotten == ["1"]
+
+
+def _reconnect(bot: FakeTwitchBot) -> None:
+    """
+    Resubscribe every live subscription under a new id, as twitchio does
+    after an EventSub reconnect.
+    """
+    bot.live = {f"new-{subscription_id}": data for subscription_id, data in bot.live.items()}
+
+
+def test_unsubscribe_after_reconnect_deletes_the_new_id():
+    bot = FakeTwitchBot()
+    manager = WebSocketManager(bot)
+    asyncio.run(manager.subscribe("1"))
+    _reconnect(bot)
+    asyncio.run(manager.unsubscribe("1"))
+    assert bot.deleted == ["new-sub-1"]
+
+
+def test_revocation_of_a_reassigned_id_drops_the_entry():
+    bot = FakeTwitchBot()
+    manager = WebSocketManager(bot)
+    asyncio.run(manager.subscribe("1"))
+    asyncio.run(manager.subscribe("2"))
+    _reconnect(bot)
+    del bot.live["new-sub-1"]
+    manager.handle_revocation("new-sub-1")
+    assert manager.subscribed() == {"2"}
+
+
+def test_resync_rebuilds_from_live_subscriptions():
+    bot = FakeTwitchBot()
+    manager = WebSocketManager(bot)
+    asyncio.run(manager.subscribe("1"))
+    bot.live = {"new-1": SimpleNamespace(condition={"broadcaster_user_id": "1"}),
+                "new-2": SimpleNamespace(condition={"broadcaster_user_id": "2"})}
+    manager.resync()
+    assert manager.subscribed() == {"1", "2"}
+
+    asyncio.run(manager.unsubscribe("2"))
+    assert bot.deleted == ["new-2"]
@@ -0,0 +1,142 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+EASTERN = ZoneInfo("America/New_York")
+
+GAME_STATUS_SCHEDULED = 1
+GAME_STATUS_LIVE = 2
+GAME_STATUS_FINAL = 3
+
+
+def _now_et(now: datetime.datetime | None) -> datetime.datetime:
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    return now.astimezone(EASTERN)
+
+
+def seconds_until_next_et_day(now: datetime.datetime | None = None) -> int:
+    """
+    Seconds from `now` until the next midnight US/Eastern, which is when the
+    NBA rolls over to the next day's slate.
+
+    Args:
+        now (datetime.datetime | None): An aware datetime; defaults to the current time.
+
+    Returns:
+        int: Seconds until the boundary, at least 1.
+    """
+    now_et = _now_et(now)
+    tomorrow = (now_et + datetime.timedelta(days=1)).date()
+    boundary = datetime.datetime.combine(tomorrow, datetime.time(), tzinfo=EASTERN)
+    return max(1, int((boundary - now_et).total_seconds()))
+
+
+def seconds_until_et_hour(hour: int, now: datetime.datetime | None = None) -> int:
+    """
+    Seconds from `now` until the next time the US/Eastern clock reads `hour`:00.
+
+    Args:
+        hour (int): Hour of the day, 0-23.
+        now (datetime.datetime | None): An aware datetime; defaults to the current time.
+
+    Returns:
+        int: Seconds until that time, at least 1.
+    """
+    now_et = _now_et(now)
+    target = datetime.datetime.combine(now_et.date(), datetime.time(hour), tzinfo=EASTERN)
+    if target <= now_et:
+        target = datetime.datetime.combine(
+            now_et.date() + datetime.timedelta(days=1), datetime.time(hour), tzinfo=EASTERN)
+    return max(1, int((target - now_et).total_seconds()))
+
+
+def current_season(now: datetime.datetime | None = None) -> int:
+    """
+    Start year of the NBA season under way (or about to start) at `now`,
+    which rolls over in October as nba_api's default season does.
+
+    Args:
+        now (datetime.datetime | None): An aware datetime; defaults to the current time.
+    """
+    now_et = _now_et(now)
+    return now_et.year if now_et.month >= 10 else now_et.year - 1
+
+
+def seconds_until_tipoff(game: dict, now: datetime.datetime | None = None) -> int | None:
+    """
+    Seconds until a scoreboard game's scheduled tip-off, or None if unknown.
+    """
+    try:
+        tipoff = datetime.datetime.strptime(
+            game["gameTimeUTC"], "%Y-%m-%dT%H:%M:%SZ"
+        ).replace(tzinfo=datetime.timezone.utc)
+    except (KeyError, TypeError, ValueError):
+        return None
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    return int((tipoff - now).total_seconds())
+
+
+class CachePolicy:
+    """
+    Picks cache lifetimes and polling intervals from game state.
+
+    Values tied to a game in progress expire within seconds or minutes; values
+    that can only change after a final buzzer live until the next ET day
+    boundary (and are invalidated explicitly when a game goes final); pre-game
+    values expire at tip-off.
+    """
+
+    LIVE_TTL = 60
+
+    LIVE_POLL_INTERVAL = 10.0
+    PREGAME_POLL_INTERVAL = 30.0
+    IDLE_POLL_INTERVAL = 300.0
+    PREGAME_WINDOW = 15 * 60
+
+    def __init__(self, live_poll_interval: float | None = None):
+        """
+        Args:
+            live_poll_interval (float | None): Overrides LIVE_POLL_INTERVAL.
+        """
+        if live_poll_interval is not None:
+            self.LIVE_POLL_INTERVAL = live_poll_interval
+
+    def ttl_for_game(self, game: dict | None, now: datetime.datetime | None = None) -> int:
+        """
+        TTL for a value (record, career line, ...) that depends on the given game.
+
+        Args:
+            game (dict | None): The team's or player's scoreboard game today, if any.
+            now (datetime.datetime | None): Current time, for testing.
+
+        Returns:
+            int: Seconds the value may be served as fresh.
+        """
+        until_tomorrow = seconds_until_next_et_day(now)
+        if game is None or game["gameStatus"] == GAME_STATUS_FINAL:
+            return until_tomorrow
+        if game["gameStatus"] == GAME_STATUS_LIVE:
+            return self.LIVE_TTL
+        until_tipoff = seconds_until_tipoff(game, now)
+        if until_tipoff is None or until_tipoff <= 0:
+            return self.LIVE_TTL
+        return min(until_tipoff, until_tomorrow)
+
+    def poll_interval(self, games: list[dict] | tuple[dict, ...],
+                      now: datetime.datetime | None = None) -> float:
+        """
+        How long the scoreboard poller should sleep given today's games.
+
+        Polls every few seconds while a game is live, more often as tip-off
+        approaches, and slowly otherwise, but never sleeps past the ET day
+        boundary so that the new slate is picked up promptly.
+        """
+        interval = self.IDLE_POLL_INTERVAL
+        for game in games:
+            status = game["gameStatus"]
+            if status == GAME_STATUS_LIVE:
+                return self.LIVE_POLL_INTERVAL
+            if status == GAME_STATUS_SCHEDULED:
+                until_tipoff = seconds_until_tipoff(game, now)
+                if until_tipoff is not None and until_tipoff <= self.PREGAME_WINDOW:
+                    interval = self.PREGAME_POLL_INTERVAL
+        return min(interval, seconds_until_next_et_day(now) + 1)
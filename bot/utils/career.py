@@ -0,0 +1,208 @@
+"""
+Career stats read straight from the PlayerCareerStats JSON.
+
+Only the season-total rows are kept, reduced to a few numeric columns
+(compact_career), which is what gets cached; replies are computed from
+small __slots__ records built from those rows (CareerStats).
+"""
+import re
+
+COLUMNS = ("SEASON_ID", "TEAM_ABBREVIATION", "GP", "PTS", "REB", "AST", "FGM", "FGA")
+RESULT_SETS = {"regular": "SeasonTotalsRegularSeason", "playoffs": "SeasonTotalsPostSeason"}
+# Traded players get one row per team plus a combined row for the season.
+COMBINED_TEAM = "TOT"
+
+_SEASON = re.compile(r"(\d{4}|\d{2})(?:-(\d{4}|\d{2}))?")
+_TRAILING_SEASON = re.compile(r"^(.+?)\s+((?:\d{4}|\d{2})-(?:\d{4}|\d{2})|\d{4})$")
+
+
+def career_params(player_id: int) -> dict:
+    """
+    Query parameters of the PlayerCareerStats request for a player.
+    """
+    return {"PlayerID": player_id, "PerMode": "Totals", "LeagueID": ""}
+
+
+def compact_career(payload: dict) -> dict[str, list[list]]:
+    """
+    Reduce a PlayerCareerStats response to its regular season and playoff
+    season totals.
+
+    Args:
+        payload (dict): The decoded stats.nba.com response.
+
+    Returns:
+        dict[str, list[list]]: {"regular": rows, "playoffs": rows}, each row
+            [start year, team, GP, PTS, REB, AST, FGM, FGA], e.g.
+            [2017, "CLE", 82, 2251, 709, 747, 857, 1580].
+    """
+    by_name = {result_set["name"]: result_set for result_set in payload["resultSets"]}
+    career = {}
+    for kind, name in RESULT_SETS.items():
+        result_set = by_name.get(name)
+        if result_set is None:
+            career[kind] = []
+            continue
+        index = [result_set["headers"].index(column) for column in COLUMNS]
+        career[kind] = [
+            [int(row[index[0]][:4]), row[index[1]], *(int(row[i] or 0) for i in index[2:])]
+            for row in result_set["rowSet"]
+        ]
+    return career
+
+
+def season_label(season: int) -> str:
+    """
+    Format a season start year the way stats.nba.com does, e.g. 2017 -> "2017-18".
+    """
+    return f"{season}-{(season + 1) % 100:02d}"
+
+
+def _year(text: str) -> int:
+    year = int(text)
+    if len(text) == 2:
+        year += 1900 if year >= 46 else 2000
+    return year
+
+
+def parse_season(text: str) -> int | None:
+    """
+    Parse a season as typed in chat into its start year: "2017-18",
+    "2017-2018" and "17-18" all mean 2017. A single year is the season
+    that ended in it ("2018" -> 2017), as in "the 2018 Finals".
+
+    Returns:
+        int | None: The start year, or None if text is not a season.
+    """
+    match = _SEASON.fullmatch(text.strip())
+    if match is None:
+        return None
+    first, second = match.groups()
+    if second is None:
+        return _year(first) - 1 if len(first) == 4 else None
+    start = _year(first)
+    end = start + 1 if len(second) == 4 else (start + 1) % 100
+    return start if int(second) == end else None
+
+
+def split_season(text: str) -> tuple[str, int | None]:
+    """
+    Split a trailing season off a command argument,
+    e.g. "LeBron James 2017-18" -> ("LeBron James", 2017).
+    """
+    match = _TRAILING_SEASON.match(text.strip())
+    if match:
+        season = parse_season(match.group(2))
+        if season is not None:
+            return match.group(1), season
+    return text, None
+
+
+class StatLine:
+    """
+    Counting stats over some games, with per-game averages.
+    """
+
+    __slots__ = ("gp", "pts", "reb", "ast", "fgm", "fga")
+
+    def __init__(self, gp: int = 0, pts: int = 0, reb: int = 0, ast: int = 0,
+                 fgm: int = 0, fga: int = 0):
+        self.gp = gp
+        self.pts = pts
+        self.reb = reb
+        self.ast = ast
+        self.fgm = fgm
+        self.fga = fga
+
+    def add(self, other: "StatLine") -> None:
+        self.gp += other.gp
+        self.pts += other.pts
+        self.reb += other.reb
+        self.ast += other.ast
+        self.fgm += other.fgm
+        self.fga += other.fga
+
+    def _average(self, total: int) -> float:
+        return round(total / self.gp, 1) if self.gp else 0.0
+
+    def format(self) -> str:
+        """
+        Format the per-game averages, e.g. "24.7 PTS, 4.3 REB, 4.7 AST, 44.9% FG".
+        """
+        fg_pct = round(self.fgm / self.fga * 100, 1) if self.fga else 0.0
+        return (
+            f"{self._average(self.pts)} PTS, {self._average(self.reb)} REB, "
+            f"{self._average(self.ast)} AST, {fg_pct}% FG"
+        )
+
+
+class SeasonLine(StatLine):
+    """
+    A player's totals for one season, across every team they played for.
+    """
+
+    __slots__ = ("season", "teams")
+
+    def __init__(self, season: int):
+        super().__init__()
+        self.season = season
+        self.teams: list[str] = []
+
+
+class CareerStats:
+    """
+    A player's season lines, regular season and playoffs, built from the
+    rows of compact_career().
+    """
+
+    __slots__ = ("regular", "playoffs")
+
+    def __init__(self, regular: list[SeasonLine], playoffs: list[SeasonLine]):
+        self.regular = regular
+        self.playoffs = playoffs
+
+    @classmethod
+    def from_compact(cls, career: dict[str, list[list]]) -> "CareerStats":
+        return cls(cls._seasons(career.get("regular", ())),
+                   cls._seasons(career.get("playoffs", ())))
+
+    @staticmethod
+    def _seasons(rows) -> list[SeasonLine]:
+        """
+        Merge the rows of each season into one line: the combined row of a
+        traded player when present, otherwise the sum of the team rows.
+        """
+        seasons: dict[int, SeasonLine] = {}
+        combined: set[int] = set()
+        for season, team, *stats in rows:
+            line = seasons.get(season)
+            if line is None:
+                line = seasons[season] = SeasonLine(season)
+            if team == COMBINED_TEAM:
+                combined.add(season)
+                line.gp, line.pts, line.reb, line.ast, line.fgm, line.fga = stats
+                continue
+            line.teams.append(team)
+            if season not in combined:
+                gp, pts, reb, ast, fgm, fga = stats
+                line.gp += gp
+                line.pts += pts
+                line.reb += reb
+                line.ast += ast
+                line.fgm += fgm
+                line.fga += fga
+        return sorted(seasons.values(), key=lambda line: line.season)
+
+    @staticmethod
+    def total(lines: list[SeasonLine]) -> StatLine:
+        """
+        Add up the given season lines.
+        """
+        total = StatLine()
+        for line in lines:
+            total.add(line)
+        return total
+
+    @staticmethod
+    def season(lines: list[SeasonLine], season: int) -> SeasonLine | None:
+        return next((line for line in lines if line.season == season), None)
@@ -0,0 +1,56 @@
+import zlib
+from typing import Any
+
+import msgpack
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; zlib is always available.
+    zstandard = None
+
+# Bump when the shape of any cached payload changes, so old entries are
+# ignored instead of misread after a deploy.
+PAYLOAD_VERSION = 3
+
+_ZLIB = b"z"
+_ZSTD = b"s"
+
+_zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+
+def payload_key(kind: str, *parts: object) -> str:
+    """
+    Build a versioned cache key, e.g. payload_key("boxscore", game_id) ->
+    "nba:v3:boxscore:0022400001".
+    """
+    return ":".join(["nba", f"v{PAYLOAD_VERSION}", kind, *map(str, parts)])
+
+
+def pack(obj: Any) -> bytes:
+    """
+    Serialize an object with msgpack and compress it with zstd when
+    available, falling back to zlib. The first byte records the codec.
+    """
+    raw = msgpack.packb(obj, use_bin_type=True)
+    if _zstd_compressor is not None:
+        return _ZSTD + _zstd_compressor.compress(raw)
+    return _ZLIB + zlib.compress(raw, 6)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Inverse of pack.
+
+    Raises:
+        ValueError: If the data uses an unknown codec, or zstd data is read
+            by a process without the zstandard package.
+    """
+    codec, body = data[:1], data[1:]
+    if codec == _ZLIB:
+        raw = zlib.decompress(body)
+    elif codec == _ZSTD and _zstd_decompressor is not None:
+        raw = _zstd_decompressor.decompress(body)
+    else:
+        raise ValueError(f"Unsupported payload codec: {codec!r}")
+    return msgpack.unpackb(raw, raw=False)
@@ -0,0 +1,194 @@
+import re
+from typing import NamedTuple
+
+from utils.cache_policy import GAME_STATUS_FINAL, GAME_STATUS_LIVE, GAME_STATUS_SCHEDULED
+
+_CLOCK = re.compile(r"PT(\d+)M([\d.]+)S")
+
+# (label, predicate) pairs, from the least to the most notable.
+MILESTONES = (
+    ("30 PTS", lambda s: s["points"] >= 30),
+    ("40 PTS", lambda s: s["points"] >= 40),
+    ("50 PTS", lambda s: s["points"] >= 50),
+    ("20 REB", lambda s: s["reboundsTotal"] >= 20),
+    ("15 AST", lambda s: s["assists"] >= 15),
+    ("triple-double", lambda s: sum(
+        s[key] >= 10 for key in ("points", "reboundsTotal", "assists", "steals", "blocks")) >= 3),
+)
+
+
+class GameEvent(NamedTuple):
+    """
+    Something followers of either team should hear about, with its chat
+    message already formatted.
+    """
+    game_id: str
+    team_ids: tuple[int, int]
+    kind: str
+    text: str
+
+
+def period_name(period: int, regulation: int = 4) -> str:
+    """
+    Name a period the way chat does: Q1-Q4, then OT, 2OT, ...
+    """
+    if period <= regulation:
+        return f"Q{period}"
+    overtime = period - regulation
+    return "OT" if overtime == 1 else f"{overtime}OT"
+
+
+def _clock_expired(game: dict) -> bool:
+    """
+    Whether the clock of the current period has run out.
+    """
+    match = _CLOCK.fullmatch(game.get("gameClock") or "")
+    if match:
+        return int(match.group(1)) == 0 and float(match.group(2)) == 0
+    text = game.get("gameStatusText", "").lower()
+    return text.startswith("end") or text.startswith("half")
+
+
+def _periods_done(game: dict) -> int:
+    """
+    Number of periods completed in a live game.
+    """
+    period = game.get("period") or 0
+    return period if _clock_expired(game) else period - 1
+
+
+def _score_line(game: dict) -> str:
+    home, away = game["homeTeam"], game["awayTeam"]
+    return f"{away['teamTricode']} {away['score']} - {home['teamTricode']} {home['score']}"
+
+
+def _leader(game: dict) -> str | None:
+    home, away = game["homeTeam"]["score"], game["awayTeam"]["score"]
+    if home == away:
+        return None
+    return "homeTeam" if home > away else "awayTeam"
+
+
+def _reached(statistics: dict) -> set[str]:
+    return {label for label, reached in MILESTONES if reached(statistics)}
+
+
+def _statline(statistics: dict) -> str:
+    return (
+        f"{statistics['points']} PTS, {statistics['reboundsTotal']} REB, "
+        f"{statistics['assists']} AST"
+    )
+
+
+class GameDiffer:
+    """
+    Turns consecutive scoreboard snapshots into game events: tip-offs, lead
+    changes, period ends, finals and big statlines.
+
+    Each refresh is diffed once, so the cost grows with the number of games
+    and players on the slate, never with the number of channels following
+    them. The only state kept between refreshes is the last leader of each
+    game, so a lead change is still reported when the game was tied in the
+    snapshot in between.
+    """
+
+    def __init__(self):
+        self._leaders: dict[str, str] = {}
+
+    def diff(self, previous, current) -> list[GameEvent]:
+        """
+        Return the events that happened between two snapshots.
+
+        Args:
+            previous (ScoreboardSnapshot | None): The snapshot before the refresh;
+                None on the first refresh, which yields no events.
+            current (ScoreboardSnapshot): The snapshot just published.
+
+        Returns:
+            list[GameEvent]: Events in slate order.
+        """
+        events: list[GameEvent] = []
+        if previous is None:
+            for game in current.games:
+                leader = _leader(game)
+                if leader:
+                    self._leaders[game["gameId"]] = leader
+            return events
+
+        before = {game["gameId"]: game for game in previous.games}
+        for game in current.games:
+            old = before.get(game["gameId"])
+            if old is not None:
+                events.extend(self._game_events(old, game))
+                events.extend(self._player_events(previous, current, game))
+        # Forget games that dropped off the slate (the day rolled over).
+        playing = {game["gameId"] for game in current.games}
+        self._leaders = {
+            game_id: leader for game_id, leader in self._leaders.items() if game_id in playing
+        }
+        return events
+
+    def _event(self, game: dict, kind: str, text: str) -> GameEvent:
+        team_ids = (game["awayTeam"]["teamId"], game["homeTeam"]["teamId"])
+        return GameEvent(game["gameId"], team_ids, kind, text)
+
+    def _game_events(self, old: dict, new: dict) -> list[GameEvent]:
+        events = []
+        status, old_status = new["gameStatus"], old["gameStatus"]
+        if old_status == GAME_STATUS_SCHEDULED and status != GAME_STATUS_SCHEDULED:
+            away, home = new["awayTeam"]["teamTricode"], new["homeTeam"]["teamTricode"]
+            events.append(self._event(new, "tipoff", f"Tip-off: {away} @ {home}"))
+
+        if status == GAME_STATUS_FINAL:
+            if old_status != GAME_STATUS_FINAL:
+                events.append(self._event(new, "final", f"Final: {_score_line(new)}"))
+            self._leaders.pop(new["gameId"], None)
+            return events
+        if status != GAME_STATUS_LIVE:
+            return events
+
+        leader = _leader(new)
+        last_leader = self._leaders.get(new["gameId"])
+        if leader:
+            if last_leader and leader != last_leader:
+                team = new[leader]["teamTricode"]
+                events.append(self._event(
+                    new, "lead_change",
+                    f"Lead change: {team} lead {_score_line(new)} ({new['gameStatusText']})"))
+            self._leaders[new["gameId"]] = leader
+
+        done = _periods_done(new)
+        if old_status == GAME_STATUS_LIVE and done > _periods_done(old) and done > 0:
+            regulation = new.get("regulationPeriods") or 4
+            if done == regulation // 2:
+                label = "Halftime"
+            else:
+                label = f"End of {period_name(done, regulation)}"
+            events.append(self._event(new, "period_end", f"{label}: {_score_line(new)}"))
+        return events
+
+    def _player_events(self, previous, current, game: dict) -> list[GameEvent]:
+        box = current.boxscores.get(game["gameId"])
+        if box is None or box is previous.boxscores.get(game["gameId"]):
+            return []  # Not started, or final and reused unchanged.
+        events = []
+        for side in ("homeTeam", "awayTeam"):
+            tricode = box[side]["teamTricode"]
+            for player in box[side]["players"]:
+                statistics = player.get("statistics")
+                if not statistics:
+                    continue
+                reached = _reached(statistics)
+                if not reached:
+                    continue
+                ref = previous.players.by_id.get(player["personId"])
+                # A row without statistics (yet) has reached nothing.
+                before_statistics = previous.player(ref).get("statistics") if ref else None
+                before = _reached(before_statistics) if before_statistics else set()
+                new = [label for label, _ in MILESTONES if label in reached - before]
+                if new:
+                    events.append(self._event(
+                        game, "milestone",
+                        f"{player['name']} ({tricode}): {_statline(statistics)} - {new[-1]}"))
+        return events
+
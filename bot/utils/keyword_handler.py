@@ -1,42 +1,165 @@
-import time
 import random
+import re
+import time
+from collections import OrderedDict
 
-class KeywordHandler:
-    def __init__(self):
-        self.cooldowns = {}
-        self.duration = 60
-    
-        self.handlers = {
-            "lakers": self.handle_lakers_keyword
+DEFAULT_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "lakers": (
+        "OKC, KFC, UFC - Lakers in 5 🖐🏾",
+        "Chris Paul, Jake Paul, Logan Paul - Lakers in 5 🖐🏾",
+        "Tyler Herro, Super Hero, Guitar Hero - Lakers in 5 🖐🏾",
+        "Lakers in 5 🖐🏾",
+    ),
+}
+
+
+def _trie_pattern(keywords: list[str]) -> str:
+    """
+    Build a regex alternation from a prefix trie of the keywords, so that
+    shared prefixes are only matched once and the work per character is
+    bounded by the trie's branching rather than by the number of keywords.
+
+    The end of the i-th keyword is marked by an empty named group `k<i>`,
+    so a match's `lastgroup` names the keyword it found.
+    """
+    trie: dict = {}
+    for index, keyword in enumerate(keywords):
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = index
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if "" in node:
+            # Longer keywords win: the terminal (empty) branch is tried last.
+            branches.append(f"(?P<k{node['']}>)")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    A keyword -> responses table compiled into a single regular expression.
+    Matching is case-insensitive and, as before, finds keywords anywhere in
+    the message.
+    """
+
+    def __init__(self, keywords: dict[str, tuple[str, ...]]):
+        self.responses = {
+            keyword.strip().lower(): tuple(responses)
+            for keyword, responses in keywords.items()
+            if keyword.strip() and responses
         }
-    
-    def _is_on_cooldown(self, channel):
-        curr = time.time()
-        prev = self.cooldowns.get(channel, 0)
-        if curr - prev < self.duration:
-            return True
-        self.cooldowns[channel] = curr
-        return False
-    
-    def get_response(self, message: str, channel:str) -> str | None:
-        content = message.strip().lower()
+        self._keywords = list(self.responses)
+        self.pattern = (
+            re.compile(_trie_pattern(self._keywords), re.IGNORECASE)
+            if self.responses else None
+        )
+
+    def match(self, message: str) -> str | None:
+        """
+        Return the first keyword found in the message, or None.
+
+        The keyword is read from the match's marker group rather than from
+        the matched text: case-insensitive matching also accepts characters
+        such as "İ" or "ſ" whose lowercase form is not in the table.
+        """
+        if self.pattern is None:
+            return None
+        found = self.pattern.search(message)
+        if found is None or found.lastgroup is None:
+            return None
+        return self._keywords[int(found.lastgroup[1:])]
 
+
+class KeywordHandler:
+    """
+    Replies to chat messages that mention a keyword.
+
+    Every channel uses DEFAULT_KEYWORDS plus its own keyword/response rows
+    (loaded from Supabase), compiled into one KeywordMatcher per channel so
+    the cost of a message does not grow with the number of keywords.
+    Channels without custom keywords share the default matcher.
+
+    The per-channel cooldown only starts when a keyword actually matched,
+    and cooldown entries older than `duration` are evicted, so the table
+    holds at most the channels that replied within the last window.
+    """
+
+    def __init__(self, duration: float = 60.0, max_cooldowns: int = 10_000):
+        """
+        Args:
+            duration (float): Seconds between two keyword replies in a channel.
+            max_cooldowns (int): Hard cap on tracked channel cooldowns.
+        """
+        self.duration = duration
+        self.max_cooldowns = max_cooldowns
+        self.cooldowns: OrderedDict[str, float] = OrderedDict()
+        self.default = KeywordMatcher(DEFAULT_KEYWORDS)
+        self._matchers: dict[str, KeywordMatcher] = {}
+
+    def load(self, rows: list[dict]) -> None:
+        """
+        Replace every channel's custom keywords.
+
+        Args:
+            rows (list[dict]): Rows with `broadcaster_user_id`, `keyword` and
+                `response`; a keyword may appear on several rows, one per response.
+        """
+        by_channel: dict[str, dict[str, list[str]]] = {}
+        for row in rows:
+            channel = row.get("broadcaster_user_id")
+            keyword = (row.get("keyword") or "").strip().lower()
+            response = row.get("response")
+            if not channel or not keyword or not response:
+                continue
+            by_channel.setdefault(channel, {}).setdefault(keyword, []).append(response)
+
+        matchers = {}
+        for channel, keywords in by_channel.items():
+            merged = dict(DEFAULT_KEYWORDS)
+            merged.update({keyword: tuple(responses) for keyword, responses in keywords.items()})
+            matchers[channel] = KeywordMatcher(merged)
+        self._matchers = matchers
+
+    def _on_cooldown(self, channel: str, now: float) -> bool:
+        cutoff = now - self.duration
+        while self.cooldowns:
+            oldest, at = next(iter(self.cooldowns.items()))
+            if at >= cutoff:
+                break
+            del self.cooldowns[oldest]
+        return channel in self.cooldowns
+
+    def _start_cooldown(self, channel: str, now: float) -> None:
+        self.cooldowns[channel] = now
+        self.cooldowns.move_to_end(channel)
+        while len(self.cooldowns) > self.max_cooldowns:
+            self.cooldowns.popitem(last=False)
+
+    def get_response(self, message: str, channel: str) -> str | None:
+        """
+        Return a reply for the first keyword in the message, or None when
+        nothing matches, the message is a command, or the channel is on cooldown.
+
+        Args:
+            message (str): The chat message text.
+            channel (str): The broadcaster_user_id of the channel.
+        """
+        content = message.lstrip()
         if content.startswith("!"):
             return None
 
-        if self._is_on_cooldown(channel):
+        matcher = self._matchers.get(channel, self.default)
+        responses = matcher.responses.get(matcher.match(content))
+        if not responses:
+            return None
+
+        now = time.monotonic()
+        if self._on_cooldown(channel, now):
             return None
-        
-        for keyword, handler in self.handlers.items():
-            if keyword in content:
-                return handler()
-        return None
-    
-    def handle_lakers_keyword(self):
-        options = [
-            "OKC, KFC, UFC - Lakers in 5 🖐🏾",
-            "Chris Paul, Jake Paul, Logan Paul - Lakers in 5 🖐🏾",
-            "Tyler Herro, Super Hero, Guitar Hero - Lakers in 5 🖐🏾"
-            "Lakers in 5 🖐🏾"
-        ]
-        return random.choice(options)
+        self._start_cooldown(channel, now)
+        return random.choice(responses)
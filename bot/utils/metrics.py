@@ -0,0 +1,150 @@
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Samples = dict[tuple[str, ...], float]
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """
+    A monotonically increasing count per label combination.
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Samples = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}"
+
+
+class Histogram:
+    """
+    Bucketed observations per label combination. Observing is one bisect
+    and a few additions; cumulative counts are only built when rendered.
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """
+        Observe the wall-clock duration of the with-block.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def render(self) -> Iterator[str]:
+        for labels, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, bucket in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total:g}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}"
+
+
+class CallbackMetric:
+    """
+    A gauge or counter whose samples are read from existing state (queue
+    depths, cache stats, ...) only when the registry is rendered, so it
+    costs nothing between scrapes.
+    """
+
+    def __init__(self, name: str, documentation: str, type: str,
+                 labelnames: tuple[str, ...], collect: Callable[[], Samples]):
+        """
+        Args:
+            type (str): "gauge" or "counter".
+            collect (Callable): Returns {label values: sample value}; use ()
+                as the key for a metric without labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.type = type
+        self.labelnames = labelnames
+        self.collect = collect
+
+    def render(self) -> Iterator[str]:
+        for labels, value in self.collect().items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}"
+
+
+class Registry:
+    """
+    A set of metrics rendered together in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram | CallbackMetric] = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+COMMAND_LATENCY = REGISTRY.register(Histogram(
+    "nba_bot_command_duration_seconds", "Time to build a chat command reply.", ("command",)))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "nba_bot_upstream_duration_seconds", "Latency of NBA upstream requests.",
+    ("endpoint", "proxy", "outcome")))
+CHAT_MESSAGES = REGISTRY.register(Counter(
+    "nba_bot_chat_messages_total", "EventSub chat messages received."))
+FOLLOW_EVENTS = REGISTRY.register(Counter(
+    "nba_bot_follow_events_total", "Game events pushed to following channels.", ("kind",)))
+LOOP_LAG = REGISTRY.register(Histogram(
+    "nba_bot_event_loop_lag_seconds", "How late the event loop woke up a sleeping task.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)))
@@ -0,0 +1,106 @@
+from collections import deque
+
+from utils.game_events import period_name
+
+
+def _clock(clock: str) -> str:
+    """
+    Turn an ISO-8601 game clock ("PT05M12.00S") into "5:12".
+    """
+    if not clock.startswith("PT"):
+        return clock
+    minutes, _, seconds = clock[2:].rstrip("S").partition("M")
+    return f"{int(minutes or 0)}:{int(float(seconds or 0)):02d}"
+
+
+class Play:
+    """
+    The few fields of a live play-by-play action that chat replies use.
+    """
+
+    __slots__ = ("action_number", "period", "clock", "team_tricode", "person_id",
+                 "description", "score_home", "score_away")
+
+    def __init__(self, action: dict):
+        self.action_number: int = action["actionNumber"]
+        self.period: int = action.get("period") or 0
+        self.clock: str = _clock(action.get("clock") or "")
+        self.team_tricode: str | None = action.get("teamTricode") or None
+        self.person_id: int | None = action.get("personId") or None
+        self.description: str = action.get("description") or action.get("actionType", "")
+        self.score_home: str = action.get("scoreHome") or ""
+        self.score_away: str = action.get("scoreAway") or ""
+
+    def format(self, away: str, home: str) -> str:
+        """
+        Format the play for chat, e.g. "Q3 5:12 LAL: L. James 26' 3PT Jump Shot (BOS 88 - LAL 90)".
+
+        Args:
+            away (str): Tricode of the away team.
+            home (str): Tricode of the home team.
+        """
+        team = f" {self.team_tricode}" if self.team_tricode else ""
+        text = f"{period_name(self.period)} {self.clock}{team}: {self.description}"
+        if self.score_home and self.score_away:
+            text += f" ({away} {self.score_away} - {home} {self.score_home})"
+        return text
+
+
+class GamePlays:
+    """
+    The most recent plays of one game in a bounded ring buffer, plus the
+    last few plays of each player, behind a cursor on the last ingested
+    actionNumber. Appending a poll only touches the actions after the
+    cursor, and the latest play (overall or per player) is a constant-time
+    lookup.
+
+    The feed occasionally amends or removes earlier actions; plays already
+    ingested are kept as first seen.
+    """
+
+    def __init__(self, size: int = 200, per_player: int = 5):
+        """
+        Args:
+            size (int): Plays kept for the game.
+            per_player (int): Plays kept for each player.
+        """
+        self.cursor = 0
+        self.plays: deque[Play] = deque(maxlen=size)
+        self.per_player = per_player
+        self.by_player: dict[int, deque[Play]] = {}
+
+    def ingest(self, actions: list[dict]) -> int:
+        """
+        Append the actions after the cursor, in order.
+
+        Args:
+            actions (list[dict]): The feed's "actions", ordered by actionNumber.
+
+        Returns:
+            int: The number of new plays.
+        """
+        # New actions are at the end of the feed, so walk back to the cursor
+        # instead of scanning the whole game.
+        start = len(actions)
+        while start > 0 and actions[start - 1]["actionNumber"] > self.cursor:
+            start -= 1
+        for action in actions[start:]:
+            play = Play(action)
+            self.plays.append(play)
+            if play.person_id:
+                plays = self.by_player.get(play.person_id)
+                if plays is None:
+                    plays = self.by_player[play.person_id] = deque(maxlen=self.per_player)
+                plays.append(play)
+        if start < len(actions):
+            self.cursor = actions[-1]["actionNumber"]
+        return len(actions) - start
+
+    def last(self) -> Play | None:
+        return self.plays[-1] if self.plays else None
+
+    def recent_for_player(self, person_id: int) -> list[Play]:
+        """
+        Return the player's most recent plays, oldest first.
+        """
+        return list(self.by_player.get(person_id, ()))
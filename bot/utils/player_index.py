@@ -0,0 +1,290 @@
+import bisect
+import difflib
+import json
+import logging
+from collections import Counter
+from typing import NamedTuple
+
+from utils.text import normalize_name
+
+logger = logging.getLogger(__name__)
+
+# Common chat nicknames, keyed by normalized alias. Extend or override with
+# a JSON file of {"alias": "Full Name"} via Config.PLAYER_ALIASES_FILE.
+DEFAULT_ALIASES = {
+    "ad": "Anthony Davis",
+    "ant": "Anthony Edwards",
+    "ant man": "Anthony Edwards",
+    "bron": "LeBron James",
+    "cp3": "Chris Paul",
+    "dame": "Damian Lillard",
+    "giannis": "Giannis Antetokounmpo",
+    "greek freak": "Giannis Antetokounmpo",
+    "joker": "Nikola Jokic",
+    "kat": "Karl-Anthony Towns",
+    "kd": "Kevin Durant",
+    "king james": "LeBron James",
+    "lebron": "LeBron James",
+    "luka": "Luka Doncic",
+    "pg13": "Paul George",
+    "sga": "Shai Gilgeous-Alexander",
+    "spida": "Donovan Mitchell",
+    "steph": "Stephen Curry",
+    "wemby": "Victor Wembanyama",
+}
+
+# Retired players well known enough that a bare last name ("Jordan",
+# "Bird") should not silently resolve to the only active namesake.
+PROMINENT_PLAYERS = (
+    "Allen Iverson", "Bill Russell", "Carmelo Anthony", "Charles Barkley",
+    "Dirk Nowitzki", "Dwyane Wade", "Hakeem Olajuwon", "Jason Kidd", "Jerry West",
+    "John Stockton", "Julius Erving", "Kareem Abdul-Jabbar", "Karl Malone",
+    "Kevin Garnett", "Kobe Bryant", "Larry Bird", "Magic Johnson", "Manu Ginobili",
+    "Michael Jordan", "Moses Malone", "Oscar Robertson", "Patrick Ewing",
+    "Paul Pierce", "Ray Allen", "Scottie Pippen", "Shaquille O'Neal", "Steve Nash",
+    "Tim Duncan", "Tracy McGrady", "Vince Carter", "Wilt Chamberlain", "Yao Ming",
+)
+
+
+class PlayerCandidate(NamedTuple):
+    """
+    A ranked match returned by PlayerIndex.search.
+    """
+    player: dict
+    score: float
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    """
+    Name-resolution index over the static nba_api player list.
+
+    Built once at startup, it holds exact lookups on normalized full and last
+    names, a configurable alias table, a sorted key list for prefix matches,
+    and a trigram index that shortlists candidates for typo-tolerant scoring.
+    Active players are preferred whenever several players match equally
+    well, except that a bare last name shared with a prominent retired
+    player is treated as ambiguous.
+    """
+
+    ACTIVE_BONUS = 0.05
+    MIN_SCORE = 0.6
+    CONFIDENT_SCORE = 0.85
+    CONFIDENT_MARGIN = 0.1
+    # Fuzzy matches stay below an exact match's 1.0.
+    FUZZY_MAX = 0.99
+
+    def __init__(self, players: list[dict], aliases: dict[str, str] | None = None):
+        """
+        Build the index.
+
+        Args:
+            players (list[dict]): Static player records with "id", "full_name",
+                "last_name" and "is_active".
+            aliases (dict[str, str] | None): Extra alias -> full name entries.
+        """
+        # Active players first so every bucket and tie-break prefers them.
+        self.players = sorted(players, key=lambda player: not player["is_active"])
+        self.by_id: dict[int, dict] = {}
+        self.by_name: dict[str, list[int]] = {}
+        self.by_last_name: dict[str, list[int]] = {}
+        self.names: list[str] = []
+        self._trigrams: dict[str, list[int]] = {}
+
+        for idx, player in enumerate(self.players):
+            self.by_id[player["id"]] = player
+            name = normalize_name(player["full_name"])
+            self.names.append(name)
+            self.by_name.setdefault(name, []).append(idx)
+            last = normalize_name(player.get("last_name") or name.split()[-1])
+            self.by_last_name.setdefault(last, []).append(idx)
+            for gram in _trigrams(name):
+                self._trigrams.setdefault(gram, []).append(idx)
+
+        self._prefixes = sorted(
+            [(name, idx) for idx, name in enumerate(self.names)] +
+            [(last, idx) for last, idxs in self.by_last_name.items() for idx in idxs]
+        )
+
+        self._add_aliases(aliases)
+
+    def _add_aliases(self, aliases: dict[str, str] | None) -> None:
+        """
+        Build the alias table, the spelled-out forms of first-name aliases
+        used for fuzzy matching ("steph" -> "steph curry"), and the set of
+        prominent retired players.
+        """
+        self.aliases: dict[str, int] = {}
+        self._alias_forms: list[tuple[str, int]] = []
+        for alias, full_name in {**DEFAULT_ALIASES, **(aliases or {})}.items():
+            idxs = self.by_name.get(normalize_name(full_name))
+            if not idxs:
+                logger.warning("Alias %r points to unknown player %r", alias, full_name)
+                continue
+            alias = normalize_name(alias)
+            self.aliases[alias] = idxs[0]
+            self._alias_forms.append((alias, idxs[0]))
+            last = self.names[idxs[0]].rsplit(" ", 1)[-1]
+            if " " not in alias and alias != last:
+                self._alias_forms.append((f"{alias} {last}", idxs[0]))
+
+        self.prominent: set[int] = set()  # player ids
+        for full_name in PROMINENT_PLAYERS:
+            idxs = self.by_name.get(normalize_name(full_name))
+            if idxs:
+                self.prominent.add(self.players[idxs[0]]["id"])
+
+    def state(self) -> dict:
+        """
+        Return the built index (without aliases) as plain lists and dicts,
+        for the static data snapshot.
+        """
+        return {
+            "players": self.players,
+            "by_name": self.by_name,
+            "by_last_name": self.by_last_name,
+            "names": self.names,
+            "trigrams": self._trigrams,
+            "prefixes": self._prefixes,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, aliases: dict[str, str] | None = None) -> "PlayerIndex":
+        """
+        Restore an index saved with state() without rebuilding it.
+        """
+        index = cls.__new__(cls)
+        index.players = state["players"]
+        index.by_id = {player["id"]: player for player in index.players}
+        index.by_name = state["by_name"]
+        index.by_last_name = state["by_last_name"]
+        index.names = state["names"]
+        index._trigrams = state["trigrams"]
+        index._prefixes = [tuple(prefix) for prefix in state["prefixes"]]
+        index._add_aliases(aliases)
+        return index
+
+    @classmethod
+    def from_static(cls, aliases_file: str | None = None) -> "PlayerIndex":
+        """
+        Load the index built from nba_api's bundled player list from the
+        static data snapshot (see utils.static_data), plus an optional alias file.
+        """
+        from utils import static_data
+
+        aliases = None
+        if aliases_file:
+            with open(aliases_file, encoding="utf-8") as f:
+                aliases = json.load(f)
+        return cls.from_state(static_data.load_snapshot()["player_index"], aliases)
+
+    def _candidates(self, idxs: list[int], score: float) -> list[PlayerCandidate]:
+        return [PlayerCandidate(self.players[idx], score) for idx in idxs]
+
+    def _prefix(self, query: str) -> list[int]:
+        start = bisect.bisect_left(self._prefixes, (query, -1))
+        idxs: set[int] = set()
+        for key, idx in self._prefixes[start:]:
+            if not key.startswith(query):
+                break
+            idxs.add(idx)
+        return sorted(idxs)
+
+    def _fuzzy(self, query: str, limit: int) -> list[PlayerCandidate]:
+        grams = _trigrams(query)
+        overlap = Counter()
+        for gram in grams:
+            overlap.update(self._trigrams.get(gram, ()))
+        shortlist = [idx for idx, _ in overlap.most_common(limit * 5)]
+
+        scores: dict[int, float] = {}
+        for idx in shortlist:
+            name = self.names[idx]
+            score = difflib.SequenceMatcher(None, query, name).ratio()
+            last = name.rsplit(" ", 1)[-1]
+            scores[idx] = max(score, difflib.SequenceMatcher(None, query, last).ratio())
+        # Nicknames are matched too, so "steph cury" still finds Stephen Curry.
+        for form, idx in self._alias_forms:
+            score = difflib.SequenceMatcher(None, query, form).ratio()
+            if score > scores.get(idx, 0.0):
+                scores[idx] = score
+
+        scored = []
+        for idx, score in scores.items():
+            if self.players[idx]["is_active"]:
+                score += self.ACTIVE_BONUS
+            if score >= self.MIN_SCORE:
+                scored.append(PlayerCandidate(self.players[idx], min(score, self.FUZZY_MAX)))
+        scored.sort(key=lambda candidate: candidate.score, reverse=True)
+        return scored[:limit]
+
+    def search(self, query: str, limit: int = 5) -> list[PlayerCandidate]:
+        """
+        Return up to `limit` ranked candidates for the query.
+
+        Exact full-name and alias matches score 1.0, exact last names 0.95,
+        prefixes 0.9; otherwise candidates are ranked by fuzzy similarity.
+
+        Args:
+            query (str): The name as typed in chat.
+            limit (int): Maximum number of candidates to return.
+
+        Returns:
+            list[PlayerCandidate]: Candidates, best first.
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        idxs = self.by_name.get(normalized)
+        if idxs:
+            return self._candidates(idxs[:limit], 1.0)
+        if normalized in self.aliases:
+            return self._candidates([self.aliases[normalized]], 1.0)
+        idxs = self.by_last_name.get(normalized)
+        if idxs:
+            # Keep prominent retired players in the list, ahead of the rest.
+            idxs = sorted(idxs, key=lambda idx: self.players[idx]["id"] not in self.prominent)
+            return self._candidates(idxs[:limit], 0.95)
+        idxs = self._prefix(normalized)
+        if idxs:
+            return self._candidates(idxs[:limit], 0.9)
+        return self._fuzzy(normalized, limit)
+
+    def resolve(self, query: str) -> tuple[dict | None, list[dict]]:
+        """
+        Resolve a query to a single player when the match is unambiguous.
+
+        A match is confident when it is an exact full-name or alias match, the
+        only candidate, the only active candidate (unless a prominent retired
+        player is among the others), or a fuzzy match that is both strong and
+        clearly ahead of the runner-up.
+
+        Args:
+            query (str): The name as typed in chat.
+
+        Returns:
+            tuple[dict | None, list[dict]]: The resolved player (or None) and the
+                ranked candidates, for "did you mean" replies.
+        """
+        candidates = self.search(query)
+        players = [candidate.player for candidate in candidates]
+        if not candidates:
+            return None, []
+        if len(candidates) == 1 or candidates[0].score == 1.0:
+            return players[0], players
+
+        active = [player for player in players if player["is_active"]]
+        prominent = any(player["id"] in self.prominent for player in players)
+        if candidates[0].score >= 0.9 and len(active) == 1 and not prominent:
+            return active[0], players
+
+        best, runner_up = candidates[0], candidates[1]
+        if (best.score >= self.CONFIDENT_SCORE and
+                best.score - runner_up.score >= self.CONFIDENT_MARGIN):
+            return best.player, players
+        return None, players
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from managers.redis import RedisManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent cache misses for the same key into one upstream fetch.
+
+    Within a process, the first caller for a key becomes the leader and every
+    concurrent caller awaits the leader's task, receiving its result or its
+    exception. Across processes, the leader also takes a short Redis lock;
+    a process that finds the lock held polls the cache for the other
+    process's result instead of fetching, and only fetches itself if the
+    lock is released (or expires) without a value being written.
+    """
+
+    def __init__(self, redis_manager: RedisManager | None = None,
+                 lock_ttl: float = 10.0, poll_interval: float = 0.05):
+        """
+        Initialize the SingleFlight.
+
+        Args:
+            redis_manager (RedisManager | None): Used for the cross-process lock.
+                Without it, coalescing is limited to the current process.
+            lock_ttl (float): Seconds before a cross-process lock expires on its own.
+            poll_interval (float): Seconds between cache polls while another
+                process holds the lock.
+        """
+        self.redis = redis_manager
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = {"leaders": 0, "coalesced": 0, "remote_waits": 0}
+
+    async def do(self, key: str, fetch: Callable[[], Awaitable[T]],
+                 lookup: Callable[[], Awaitable[T | None]] | None = None) -> T:
+        """
+        Return fetch()'s result, sharing a single in-flight call per key.
+
+        Args:
+            key (str): The cache key the fetch populates.
+            fetch (Callable): Performs the upstream call and writes the cache.
+            lookup (Callable | None): Reads the cache; used to pick up a value
+                written by another process while it holds the lock.
+
+        Returns:
+            The result of the shared fetch.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["leaders"] += 1
+            task = asyncio.create_task(self._lead(key, fetch, lookup))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so that one cancelled waiter does not cancel the shared fetch.
+        return await asyncio.shield(task)
+
+    async def _lead(self, key: str, fetch: Callable[[], Awaitable[T]],
+                    lookup: Callable[[], Awaitable[T | None]] | None) -> T:
+        if self.redis is None:
+            return await fetch()
+
+        lock_key = f"lock:{key}"
+        token = await self.redis.acquire_lock(lock_key, self.lock_ttl)
+        if token is None and lookup is not None:
+            self.stats["remote_waits"] += 1
+            value = await self._wait_for_remote(lock_key, lookup)
+            if value is not None:
+                return value
+            token = await self.redis.acquire_lock(lock_key, self.lock_ttl)
+
+        try:
+            return await fetch()
+        finally:
+            if token is not None:
+                await self.redis.release_lock(lock_key, token)
+
+    async def _wait_for_remote(self, lock_key: str,
+                               lookup: Callable[[], Awaitable[T | None]]) -> T | None:
+        """
+        Poll the cache until another process publishes a value or drops its lock.
+        """
+        deadline = time.monotonic() + self.lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            value = await lookup()
+            if value is not None:
+                return value
+            if not await self.redis.exists(lock_key):
+                return await lookup()
+        logger.warning("Gave up waiting on %s held by another process", lock_key)
+        return None
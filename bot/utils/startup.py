@@ -0,0 +1,44 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    Times the phases of startup (imports, construction, EventSub, Supabase,
+    cache warm-up, ...) relative to process start, so that restarts can be
+    compared and time-to-first-reply tracked.
+    """
+
+    def __init__(self, started: float | None = None):
+        """
+        Args:
+            started (float | None): time.monotonic() at process start; defaults to now.
+        """
+        self.started = time.monotonic() if started is None else started
+        self.phases: dict[str, float] = {}
+
+    def elapsed(self) -> float:
+        """
+        Seconds since process start.
+        """
+        return time.monotonic() - self.started
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+        logger.info("Startup phase %s took %.3fs (%.3fs since start)",
+                    name, seconds, self.elapsed())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time the with-block as the named phase.
+        """
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - started)
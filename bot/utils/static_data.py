@@ -0,0 +1,122 @@
+"""
+Static player and team data, served from a precomputed snapshot file.
+
+nba_api ships its player and team tables as Python modules, and the
+PlayerIndex built from them takes a noticeable share of startup. The
+snapshot holds both tables and the built PlayerIndex, packed with
+utils.codec, so a restart reads one small file instead. It is tied to the
+installed copy of nba_api and rebuilt automatically when that changes or
+the file is missing; to build it ahead of a deploy, run from the bot
+directory:
+
+    python -m utils.static_data
+"""
+import logging
+import os
+from importlib.util import find_spec
+
+from utils.codec import pack, unpack
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static_snapshot.bin")
+# Bump when the layout of the snapshot (or of PlayerIndex.state) changes.
+SNAPSHOT_VERSION = 1
+
+_snapshot: dict | None = None
+
+
+def _source_fingerprint() -> str | None:
+    """
+    Identify the installed copy of nba_api's static data module (cheaper
+    than reading the package metadata, and nothing gets imported).
+    """
+    spec = find_spec("nba_api")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    data_file = os.path.join(spec.submodule_search_locations[0], "stats", "library", "data.py")
+    try:
+        stat = os.stat(data_file)
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _build() -> dict:
+    from nba_api.stats.static import players, teams
+
+    from utils.player_index import PlayerIndex
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "source": _source_fingerprint(),
+        "teams": teams.get_teams(),
+        "player_index": PlayerIndex(players.get_players()).state(),
+    }
+
+
+def build_snapshot(path: str = SNAPSHOT_FILE) -> dict:
+    """
+    Build the snapshot from nba_api's static tables and write it to path.
+
+    Returns:
+        dict: The snapshot.
+    """
+    snapshot = _build()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pack(snapshot))
+    os.replace(tmp_path, path)
+    return snapshot
+
+
+def load_snapshot(path: str = SNAPSHOT_FILE) -> dict:
+    """
+    Return the snapshot, building and saving it first if the file is
+    missing, unreadable or from another nba_api version. Loaded once per
+    process.
+    """
+    global _snapshot
+    if _snapshot is not None:
+        return _snapshot
+
+    try:
+        with open(path, "rb") as f:
+            snapshot = unpack(f.read())
+        if (snapshot.get("version") == SNAPSHOT_VERSION
+                and snapshot.get("source") == _source_fingerprint()):
+            _snapshot = snapshot
+            return snapshot
+        logger.info("Static data snapshot %s is outdated, rebuilding", path)
+    except FileNotFoundError:
+        logger.info("No static data snapshot at %s, building one", path)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read static data snapshot %s: %s", path, e)
+
+    try:
+        _snapshot = build_snapshot(path)
+    except OSError as e:
+        logger.warning("Could not write static data snapshot %s: %s", path, e)
+        _snapshot = _build()
+    return _snapshot
+
+
+def get_teams() -> list[dict]:
+    """
+    Return nba_api's static team records.
+    """
+    return load_snapshot()["teams"]
+
+
+def get_players() -> list[dict]:
+    """
+    Return nba_api's static player records.
+    """
+    return load_snapshot()["player_index"]["players"]
+
+
+if __name__ == "__main__":
+    built = build_snapshot()
+    print(f"Wrote {len(built['player_index']['players'])} players and "
+          f"{len(built['teams'])} teams to {SNAPSHOT_FILE}")
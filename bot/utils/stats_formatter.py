@@ -0,0 +1,127 @@
+from typing import NamedTuple
+
+from utils.cache_policy import current_season
+from utils.career import CareerStats, season_label
+
+
+class TeamStanding(NamedTuple):
+    """
+    One team's row of the league standings.
+    """
+    team_id: int
+    wins: int
+    losses: int
+    conference: str
+    seed: int | None
+    games_back: float
+    streak: str
+
+
+def standings_params() -> dict:
+    """
+    Query parameters of the LeagueStandingsV3 request for the current season.
+    """
+    return {
+        "LeagueID": "00",
+        "Season": season_label(current_season()),
+        "SeasonType": "Regular Season",
+        "SeasonYear": "",
+    }
+
+
+def compact_standings(payload: dict) -> dict[str, list]:
+    """
+    Reduce a LeagueStandingsV3 response to the cached standings table:
+    team id (as a string, for msgpack) -> the TeamStanding fields, so a
+    read is one dict lookup with nothing left to parse.
+
+    Args:
+        payload (dict): The decoded stats.nba.com response.
+
+    Returns:
+        dict[str, list]: e.g. {"1610612747": [1610612747, 50, 32, "West", 4, 2.5, "W3"]}.
+    """
+    standings = next(
+        result_set for result_set in payload["resultSets"] if result_set["name"] == "Standings")
+    index = {header: i for i, header in enumerate(standings["headers"])}
+
+    def column(row: list, name: str, default=None):
+        i = index.get(name)
+        return default if i is None or row[i] is None else row[i]
+
+    table = {}
+    for row in standings["rowSet"]:
+        team_id = int(column(row, "TeamID"))
+        table[str(team_id)] = list(TeamStanding(
+            team_id=team_id,
+            wins=int(column(row, "WINS", 0)),
+            losses=int(column(row, "LOSSES", 0)),
+            conference=column(row, "Conference", ""),
+            seed=column(row, "PlayoffRank"),
+            games_back=float(column(row, "ConferenceGamesBack", 0) or 0),
+            streak=str(column(row, "strCurrentStreak", "")).replace(" ", ""),
+        ))
+    return table
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def format_career(full_name: str, career: CareerStats, season: int | None = None) -> str:
+    """
+    Format a player's per-game averages, over their career or one season,
+    with the playoffs alongside when they played any.
+
+    Args:
+        full_name (str): The player's display name.
+        career (CareerStats): The player's season lines.
+        season (int | None): Start year of the season to show; the whole
+            career if None.
+
+    Returns:
+        str: A line like "Donovan Mitchell: 24.7 PTS, 4.3 REB, 4.7 AST, 44.9% FG
+             | Playoffs: 28.3 PTS, 4.9 REB, 4.5 AST, 44.4% FG", or a reply
+             saying there is no data.
+    """
+    if season is None:
+        if not career.regular:
+            return "No career data available."
+        regular = career.total(career.regular)
+        playoffs = career.total(career.playoffs)
+        text = f"{full_name}: {regular.format()}"
+    else:
+        label = season_label(season)
+        regular = career.season(career.regular, season)
+        if regular is None:
+            return f"{full_name} did not play in {label}."
+        playoffs = career.season(career.playoffs, season)
+        teams = "/".join(regular.teams)
+        text = f"{full_name} {label} ({teams}): {regular.format()} in {regular.gp} GP"
+    if playoffs is not None and playoffs.gp:
+        text += f" | Playoffs: {playoffs.format()}"
+    return text
+
+
+def format_record(full_name: str, standing: TeamStanding) -> str:
+    """
+    Format a team's win-loss record with its streak, conference seed and
+    games behind the conference leader.
+
+    Args:
+        full_name (str): The team's display name.
+        standing (TeamStanding): The team's row of the standings.
+
+    Returns:
+        str: A line like "The Los Angeles Lakers are 50 - 32 (W3, 4th in the West, 2.5 GB)".
+    """
+    record = f"The {full_name} are {standing.wins} - {standing.losses}"
+    details = []
+    if standing.streak:
+        details.append(standing.streak)
+    if standing.seed:
+        details.append(f"{_ordinal(standing.seed)} in the {standing.conference}")
+    if standing.games_back:
+        details.append(f"{standing.games_back:g} GB")
+    return f"{record} ({', '.join(details)})" if details else record
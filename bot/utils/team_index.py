@@ -0,0 +1,66 @@
+from utils.static_data import get_teams
+from utils.text import normalize_name
+
+# Chat slang and short forms not covered by the static team fields,
+# mapped to team abbreviations.
+TEAM_SLANG = {
+    "blazers": "POR",
+    "c's": "BOS",
+    "cavs": "CLE",
+    "celts": "BOS",
+    "clips": "LAC",
+    "dubs": "GSW",
+    "grizz": "MEM",
+    "lakeshow": "LAL",
+    "mavs": "DAL",
+    "nola": "NOP",
+    "nugs": "DEN",
+    "pels": "NOP",
+    "raps": "TOR",
+    "sixers": "PHI",
+    "the bay": "GSW",
+    "wiz": "WAS",
+    "wolves": "MIN",
+}
+
+
+class TeamIndex:
+    """
+    Constant-time team lookup by full name, nickname, abbreviation, city or
+    slang. Aliases shared by several teams (e.g. "Los Angeles") map to every
+    matching team so callers can report the ambiguity instead of guessing.
+    """
+
+    def __init__(self, team_list: list[dict], slang: dict[str, str] | None = None):
+        """
+        Build the alias dictionary.
+
+        Args:
+            team_list (list[dict]): Static team records from nba_api.
+            slang (dict[str, str] | None): Alias -> abbreviation overrides.
+        """
+        self.by_id: dict[int, dict] = {team["id"]: team for team in team_list}
+        self.aliases: dict[str, tuple[dict, ...]] = {}
+
+        by_abbreviation = {team["abbreviation"]: team for team in team_list}
+        for team in team_list:
+            for field in ("full_name", "nickname", "abbreviation", "city"):
+                self._add(team[field], team)
+        for alias, abbreviation in (slang or TEAM_SLANG).items():
+            self._add(alias, by_abbreviation[abbreviation])
+
+    def _add(self, alias: str, team: dict) -> None:
+        key = normalize_name(alias)
+        matches = self.aliases.get(key, ())
+        if team not in matches:
+            self.aliases[key] = matches + (team,)
+
+    def lookup(self, name: str) -> tuple[dict, ...]:
+        """
+        Return every team matching the alias: one for a unique match, several
+        for an ambiguous one, none if the alias is unknown.
+        """
+        return self.aliases.get(normalize_name(name), ())
+
+
+TEAM_INDEX = TeamIndex(get_teams())
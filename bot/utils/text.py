@@ -0,0 +1,24 @@
+import re
+import unicodedata
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a person or team name for dictionary lookups.
+
+    Strips diacritics, lowercases, drops punctuation and collapses whitespace,
+    so "Nikola Jokić", "nikola jokic" and " Nikola  Jokic. " all compare equal.
+
+    Args:
+        name (str): The raw name as typed in chat or returned by the API.
+
+    Returns:
+        str: The normalized name.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_only = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    cleaned = _NON_ALNUM.sub("", ascii_only.replace("-", " "))
+    return _SPACES.sub(" ", cleaned).strip()